@@ -10,7 +10,10 @@ import tempfile
 from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
+import json
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from zipfile import ZipFile, BadZipFile
 
@@ -77,6 +80,67 @@ def sha256sum(filename):
     return h.hexdigest()
 
 
+def sha256sum_stream(stream):
+    """Calculate sha256 of file-like object content read in chunks.
+
+    Args:
+        stream (BinaryIO): Opened stream, e.g. zip member.
+
+    Returns:
+        str: hex encoded sha256
+
+    """
+    h = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def get_validation_workers() -> int:
+    """Number of threads used to validate and extract OpenPype versions.
+
+    Can be changed with ``OPENPYPE_VALIDATION_WORKERS`` environment variable.
+    Hashing and decompression release GIL, so threads are used.
+
+    """
+    workers = os.getenv("OPENPYPE_VALIDATION_WORKERS")
+    if workers:
+        return max(int(workers), 1)
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class _ThreadLocalZipFile:
+    """Zip file opened separately in each thread of a pool.
+
+    Args:
+        path (Path): Path to zip file.
+        zip_cls (type): Class of zip file object.
+
+    """
+
+    def __init__(self, path, zip_cls=ZipFile):
+        self._path = path
+        self._zip_cls = zip_cls
+        self._local = threading.local()
+        self._opened = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        zip_file = getattr(self._local, "zip_file", None)
+        if zip_file is None:
+            zip_file = self._zip_cls(self._path, "r")
+            self._local.zip_file = zip_file
+            with self._lock:
+                self._opened.append(zip_file)
+        return zip_file
+
+    def close(self):
+        with self._lock:
+            for zip_file in self._opened:
+                zip_file.close()
+            self._opened = []
+
+
 class ZipFileLongPaths(ZipFile):
     def _extract_member(self, member, targetpath, pwd):
         return ZipFile._extract_member(
@@ -902,18 +966,101 @@ class BootstrapRepos:
         if not path.exists():
             return False, "Path doesn't exist"
 
+        marker_key = self._get_validation_marker_key(path)
+        if (
+            marker_key is not None
+            and self._get_validation_markers().get(str(path)) == marker_key
+        ):
+            return True, "Already validated"
+
+        max_workers = get_validation_workers()
         if path.is_file():
-            return self._validate_zip(path)
-        return self._validate_dir(path)
+            result = self._validate_zip(path, max_workers)
+        else:
+            result = self._validate_dir(path, max_workers)
+
+        if result == (True, "All ok") and marker_key is not None:
+            self._store_validation_marker(path, marker_key)
+        return result
+
+    @property
+    def _validation_markers_path(self) -> Path:
+        return Path(self.data_dir) / "validated_versions.json"
+
+    @staticmethod
+    def _get_validation_marker_key(path: Path) -> Union[list, None]:
+        """Size and modification time identifying validated version.
+
+        Zip file is identified by its stat. Directory is identified by stat
+        of its `checksums` file, total size and latest modification time
+        of all files listed in `checksums`, so change of any file of
+        the version is validated again.
+
+        """
+        try:
+            stat = path.stat()
+            if not path.is_dir():
+                return [stat.st_size, stat.st_mtime]
+
+            checksums_file = path / "checksums"
+            stat = checksums_file.stat()
+            checksums_data = checksums_file.read_text()
+        except OSError:
+            return None
+
+        total_size = stat.st_size
+        max_mtime = stat.st_mtime
+        files_count = 0
+        for line in checksums_data.split("\n"):
+            if not line:
+                continue
+            file_name = line.split(":")[-1]
+            if platform.system().lower() == "windows":
+                file_name = file_name.replace("/", "\\")
+            try:
+                file_stat = os.stat(
+                    sanitize_long_path((path / file_name).as_posix()))
+            except OSError:
+                return None
+            files_count += 1
+            total_size += file_stat.st_size
+            max_mtime = max(max_mtime, file_stat.st_mtime)
+        return [total_size, max_mtime, files_count]
+
+    def _get_validation_markers(self) -> dict:
+        try:
+            with open(self._validation_markers_path, "r") as stream:
+                return json.load(stream)
+        except (OSError, ValueError):
+            return {}
+
+    def _store_validation_marker(self, path: Path, marker_key: list):
+        markers = self._get_validation_markers()
+        markers[str(path)] = marker_key
+        markers_path = self._validation_markers_path
+        tmp_path = markers_path.with_name(
+            f"{markers_path.name}.{os.getpid()}.tmp")
+        try:
+            markers_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(markers, stream)
+            os.replace(tmp_path, markers_path)
+        except OSError:
+            self._print(
+                "Cannot store validated version marker.", LOG_WARNING)
 
     @staticmethod
-    def _validate_zip(path: Path) -> tuple:
-        """Validate content of zip file."""
+    def _validate_zip(path: Path, max_workers: int = 1) -> tuple:
+        """Validate content of zip file.
+
+        Members are hashed as streams in thread pool.
+
+        """
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
-                checksums_data = str(zip_file.read("checksums"))
-            except IOError:
+                checksums_data = zip_file.read("checksums").decode("utf-8")
+            except (IOError, KeyError):
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
 
@@ -934,26 +1081,75 @@ class BootstrapRepos:
             if diff:
                 return False, f"Missing files {diff}"
 
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
-                h = hashlib.sha256()
-                try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
-                    return False, f"Invalid checksum on {file_name}"
+        # calculate and compare checksums in the zip file
+        zip_files = _ThreadLocalZipFile(path)
+
+        def _hash_member(file_name):
+            if file_name not in files_in_zip:
+                return None
+            with zip_files.get().open(file_name) as stream:
+                return sha256sum_stream(stream)
+
+        try:
+            return BootstrapRepos._compare_checksums(
+                checksums, _hash_member, max_workers)
+        finally:
+            zip_files.close()
+
+    @staticmethod
+    def _compare_checksums(
+            checksums: list, hash_func: Callable, max_workers: int) -> tuple:
+        """Compare checksums with hashes calculated in thread pool.
+
+        Args:
+            checksums (list): List of tuples with checksum and file name.
+            hash_func (Callable): Function returning hash of file by name
+                or None if file is missing.
+            max_workers (int): Number of threads.
+
+        Returns:
+            tuple(bool, str): Status and reason.
+
+        """
+        def _validate(item):
+            file_checksum, file_name = item
+            try:
+                current = hash_func(file_name)
+            except FileNotFoundError:
+                current = None
+            if current is None:
+                return f"Missing file [ {file_name} ]"
+            if current != file_checksum:
+                return f"Invalid checksum on {file_name}"
+            return None
+
+        if max_workers < 2:
+            errors = map(_validate, checksums)
+            for error in errors:
+                if error:
+                    return False, error
+            return True, "All ok"
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_validate, item) for item in checksums
+            ]
+            for future in futures:
+                error = future.result()
+                if error:
+                    for _future in futures:
+                        _future.cancel()
+                    return False, error
 
         return True, "All ok"
 
     @staticmethod
-    def _validate_dir(path: Path) -> tuple:
+    def _validate_dir(path: Path, max_workers: int = 1) -> tuple:
         """Validate checksums in a given path.
 
         Args:
             path (Path): path to folder to validate.
+            max_workers (int): Number of threads used for hashing.
 
         Returns:
             tuple(bool, str): returns status and reason as a bool
@@ -984,20 +1180,15 @@ class BootstrapRepos:
             return False, f"Missing files {diff}"
 
         # calculate and compare checksums
-        for file_checksum, file_name in checksums:
+        def _hash_file(file_name):
             if platform.system().lower() == "windows":
                 file_name = file_name.replace("/", "\\")
-            try:
-                current = sha256sum(
-                    sanitize_long_path((path / file_name).as_posix())
-                )
-            except FileNotFoundError:
-                return False, f"Missing file [ {file_name} ]"
-
-            if file_checksum != current:
-                return False, f"Invalid checksum on {file_name}"
+            return sha256sum(
+                sanitize_long_path((path / file_name).as_posix())
+            )
 
-        return True, "All ok"
+        return BootstrapRepos._compare_checksums(
+            checksums, _hash_file, max_workers)
 
     @staticmethod
     def add_paths_from_archive(archive: Path) -> None:
@@ -1302,13 +1493,59 @@ class BootstrapRepos:
 
         # extract zip there
         self._print("Extracting zip to destination ...")
-        with ZipFileLongPaths(version.path, "r") as zip_ref:
-            zip_ref.extractall(destination)
+        self._extract_zip(version.path, destination, get_validation_workers())
 
         self._print(f"Installed as {version.path.stem}")
 
         return destination
 
+    @staticmethod
+    def _extract_zip(
+            zip_path: Path, destination: Path, max_workers: int = 1) -> None:
+        """Extract zip file using thread pool.
+
+        Directories are created first, so threads extract only files.
+
+        Args:
+            zip_path (Path): Path to zip file.
+            destination (Path): Directory where to extract.
+            max_workers (int): Number of threads.
+
+        """
+        if max_workers < 2:
+            with ZipFileLongPaths(zip_path, "r") as zip_ref:
+                zip_ref.extractall(destination)
+            return
+
+        with ZipFileLongPaths(zip_path, "r") as zip_ref:
+            members = zip_ref.infolist()
+            for member in members:
+                if member.is_dir():
+                    zip_ref.extract(member, destination)
+                    continue
+                parent = os.path.dirname(member.filename)
+                if parent:
+                    target = destination / parent
+                    os.makedirs(
+                        sanitize_long_path(str(target)), exist_ok=True)
+
+        zip_files = _ThreadLocalZipFile(zip_path, ZipFileLongPaths)
+
+        def _extract(member):
+            zip_files.get().extract(member, destination)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_extract, member)
+                    for member in members
+                    if not member.is_dir()
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            zip_files.close()
+
     def is_inside_user_data(self, path: Path) -> bool:
         """Test if version is located in user data dir.
 
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""Instrumentation of OpenPype startup.
+
+Startup profiling is enabled with ``--startup-profile`` argument of
+`start.py` or with ``OPENPYPE_STARTUP_PROFILE`` environment variable. Value
+of the environment variable can be path to report file, ``{pid}`` in the
+path is replaced with process id. Report is written to temp directory if
+value is ``1``.
+
+Profiler records wall time of startup phases and import time of each
+python module. Report is json file written when process exits.
+
+Phases are recorded with `phase` context manager. OpenPype code should use
+`openpype.lib.profiling.startup_phase` which does nothing when profiling
+is not enabled.
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import tempfile
+import threading
+import contextlib
+from typing import Union
+
+STARTUP_PROFILE_ENV_KEY = "OPENPYPE_STARTUP_PROFILE"
+DEFAULT_REPORT_FILENAME = "openpype_startup_{pid}.json"
+
+_profiler = None
+
+
+class _ImportTimer:
+    """Measure import time of python modules.
+
+    Wraps `importlib._bootstrap._find_and_load` which is called for every
+    module that is not in `sys.modules` yet, by import statement and by
+    `importlib.import_module`. This is the same place where python's
+    ``-X importtime`` measures imports.
+
+    Time spent in imports of other modules is subtracted from module's
+    self time.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self._local = threading.local()
+        self._bootstrap = None
+        self._original = None
+
+    def _get_stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def _find_and_load(self, name, *args, **kwargs):
+        stack = self._get_stack()
+        item = [name, time.perf_counter(), 0.0]
+        stack.append(item)
+        try:
+            return self._original(name, *args, **kwargs)
+        finally:
+            stack.pop()
+            cumulative = time.perf_counter() - item[1]
+            if stack:
+                stack[-1][2] += cumulative
+            if name not in self.records:
+                self.records[name] = {
+                    "name": name,
+                    "parent": stack[-1][0] if stack else None,
+                    "self": cumulative - item[2],
+                    "cumulative": cumulative,
+                }
+
+    def install(self) -> bool:
+        import importlib._bootstrap as bootstrap
+
+        original = getattr(bootstrap, "_find_and_load", None)
+        if original is None:
+            return False
+        self._bootstrap = bootstrap
+        self._original = original
+        bootstrap._find_and_load = self._find_and_load
+        return True
+
+    def uninstall(self):
+        if self._bootstrap is not None:
+            self._bootstrap._find_and_load = self._original
+            self._bootstrap = None
+
+
+class StartupProfiler:
+    """Record duration of startup phases and imports.
+
+    Args:
+        report_path (str): Path where report is written.
+    """
+
+    def __init__(self, report_path: str):
+        self._report_path = report_path
+        self._started = time.time()
+        self._start_counter = time.perf_counter()
+        self._stopped = None
+        self._phases = []
+        self._local = threading.local()
+        self._import_timer = _ImportTimer()
+        self._import_timer_installed = False
+        self._report_written = False
+
+    @property
+    def report_path(self) -> str:
+        return self._report_path
+
+    def start(self):
+        """Start measuring of imports and write report on exit."""
+        self._import_timer_installed = self._import_timer.install()
+        atexit.register(self._on_exit)
+
+    def stop(self):
+        """Stop measuring of imports."""
+        if self._stopped is None:
+            self._stopped = time.perf_counter()
+        self._import_timer.uninstall()
+
+    def _get_phases_stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Measure wall time of a startup phase.
+
+        Phases can be nested, parent phase is stored in the report.
+
+        Args:
+            name (str): Name of the phase.
+        """
+        stack = self._get_phases_stack()
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            self._phases.append({
+                "name": name,
+                "parent": parent,
+                "start": start - self._start_counter,
+                "duration": end - start,
+            })
+
+    def add_phase(
+        self,
+        name: str,
+        start: Union[float, None] = None,
+        end: Union[float, None] = None
+    ):
+        """Record phase with known start and end.
+
+        Args:
+            name (str): Name of the phase.
+            start (Union[float, None]): Value of `time.perf_counter` when
+                phase started. Start of profiler is used if not passed.
+            end (Union[float, None]): Value of `time.perf_counter` when
+                phase ended. Current time is used if not passed.
+        """
+        if start is None:
+            start = self._start_counter
+        if end is None:
+            end = time.perf_counter()
+        stack = self._get_phases_stack()
+        self._phases.append({
+            "name": name,
+            "parent": stack[-1] if stack else None,
+            "start": start - self._start_counter,
+            "duration": end - start,
+        })
+
+    def get_report(self) -> dict:
+        """Report data.
+
+        Returns:
+            dict: Total time, phases in order of start and imports sorted
+                by cumulative time.
+        """
+        end = self._stopped
+        if end is None:
+            end = time.perf_counter()
+
+        imports = sorted(
+            self._import_timer.records.values(),
+            key=lambda item: item["cumulative"],
+            reverse=True
+        )
+        return {
+            "pid": os.getpid(),
+            "argv": list(sys.argv),
+            "started": self._started,
+            "total": end - self._start_counter,
+            "phases": sorted(self._phases, key=lambda item: item["start"]),
+            "imports_measured": self._import_timer_installed,
+            "imports_total": sum(item["self"] for item in imports),
+            "imports": imports,
+        }
+
+    def write_report(self, path: Union[str, None] = None) -> str:
+        """Write report to json file.
+
+        Args:
+            path (Union[str, None]): Output path, report path of profiler
+                is used if not passed.
+
+        Returns:
+            str: Path to report file.
+        """
+        if path is None:
+            path = self._report_path
+        dirpath = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dirpath, exist_ok=True)
+        with open(path, "w") as stream:
+            json.dump(self.get_report(), stream, indent=4)
+        self._report_written = True
+        return path
+
+    def _on_exit(self):
+        if self._report_written:
+            return
+        self.stop()
+        try:
+            path = self.write_report()
+        except OSError as exc:
+            print(f"!!! Failed to write startup profile report: {exc}")
+            return
+        print(f">>> Startup profile report written to [ {path} ]")
+
+
+def get_report_path(value: Union[str, None] = None) -> str:
+    """Path to report file from value of environment variable.
+
+    Args:
+        value (Union[str, None]): Value of ``OPENPYPE_STARTUP_PROFILE``.
+            Current environment is used if not passed.
+
+    Returns:
+        str: Path to report file with filled process id.
+    """
+    if value is None:
+        value = os.getenv(STARTUP_PROFILE_ENV_KEY) or "1"
+
+    if value == "1":
+        value = os.path.join(tempfile.gettempdir(), DEFAULT_REPORT_FILENAME)
+    return value.format(pid=os.getpid())
+
+
+def is_enabled() -> bool:
+    """Startup profiling is enabled by environment variable."""
+    return bool(os.getenv(STARTUP_PROFILE_ENV_KEY))
+
+
+def start_profiler(
+    report_path: Union[str, None] = None
+) -> StartupProfiler:
+    """Start profiling of current process.
+
+    Profiler is started only once, next calls return the same profiler.
+
+    Args:
+        report_path (Union[str, None]): Path where report is written.
+            Is resolved from environment if not passed.
+
+    Returns:
+        StartupProfiler: Started profiler.
+    """
+    global _profiler
+    if _profiler is None:
+        if report_path is None:
+            report_path = get_report_path()
+        _profiler = StartupProfiler(report_path)
+        _profiler.start()
+    return _profiler
+
+
+def get_profiler() -> Union[StartupProfiler, None]:
+    """Started profiler or None if profiling is not enabled."""
+    return _profiler
+
+
+@contextlib.contextmanager
+def phase(name: str):
+    """Measure startup phase if profiler is started.
+
+    Args:
+        name (str): Name of the phase.
+    """
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.phase(name):
+            yield
+
+
+def end_phase(name: str):
+    """Record phase from start of profiler until now if profiler is started.
+
+    Args:
+        name (str): Name of the phase.
+    """
+    if _profiler is not None:
+        _profiler.add_phase(name)
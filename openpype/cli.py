@@ -372,6 +372,39 @@ def unpack_project(zipfile, root, dbonly):
     PypeCommands().unpack_project(zipfile, root, dbonly)
 
 
+@main.command()
+@click.option(
+    "--project", help="Project name (all projects if not set)", default=None)
+def ensure_project_indexes(project):
+    """Create database indexes of project collections if they are missing."""
+    if AYON_SERVER_ENABLED:
+        raise RuntimeError(
+            "AYON does not support 'ensure-project-indexes' command.")
+    PypeCommands().ensure_project_indexes(project)
+
+
+@main.command()
+@click.option(
+    "--project", help="Project name (all projects if not set)", default=None)
+def rebuild_last_versions(project):
+    """Store last version of each subset on subset documents."""
+    if AYON_SERVER_ENABLED:
+        raise RuntimeError(
+            "AYON does not support 'rebuild-last-versions' command.")
+    PypeCommands().rebuild_last_versions(project)
+
+
+@main.command()
+@click.option(
+    "--project", help="Project name (all projects if not set)", default=None)
+def backfill_source_hashes(project):
+    """Store indexed source hashes on previously published versions."""
+    if AYON_SERVER_ENABLED:
+        raise RuntimeError(
+            "AYON does not support 'backfill-source-hashes' command.")
+    PypeCommands().backfill_source_hashes(project)
+
+
 @main.command()
 def interactive():
     """Interactive (Python like) console.
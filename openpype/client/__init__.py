@@ -1,5 +1,9 @@
 from .mongo import (
     OpenPypeMongoConnection,
+    enable_entity_cache,
+    disable_entity_cache,
+    invalidate_entity_cache,
+    get_entity_cache_stats,
 )
 
 from .entities import (
@@ -28,6 +32,7 @@ from .entities import (
     get_last_version_by_subset_id,
     get_last_version_by_subset_name,
     get_output_link_versions,
+    get_versions_by_source_hashes,
 
     version_is_latest,
 
@@ -37,6 +42,7 @@ from .entities import (
     get_representation_parents,
     get_representations_parents,
     get_archived_representations,
+    get_representations_by_file_hashes,
 
     get_thumbnail,
     get_thumbnails,
@@ -58,6 +64,10 @@ from .operations import (
 
 __all__ = (
     "OpenPypeMongoConnection",
+    "enable_entity_cache",
+    "disable_entity_cache",
+    "invalidate_entity_cache",
+    "get_entity_cache_stats",
 
     "get_projects",
     "get_project",
@@ -84,6 +94,7 @@ __all__ = (
     "get_last_version_by_subset_id",
     "get_last_version_by_subset_name",
     "get_output_link_versions",
+    "get_versions_by_source_hashes",
 
     "version_is_latest",
 
@@ -93,6 +104,7 @@ __all__ = (
     "get_representation_parents",
     "get_representations_parents",
     "get_archived_representations",
+    "get_representations_by_file_hashes",
 
     "get_thumbnail",
     "get_thumbnails",
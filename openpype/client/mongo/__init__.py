@@ -6,6 +6,15 @@ from .mongo import (
     OpenPypeMongoConnection,
     get_project_database,
     get_project_connection,
+    ensure_project_indexes,
+)
+from .entity_cache import (
+    EntityCache,
+    enable_entity_cache,
+    disable_entity_cache,
+    get_entity_cache,
+    invalidate_entity_cache,
+    get_entity_cache_stats,
 )
 
 
@@ -17,4 +26,12 @@ __all__ = (
     "OpenPypeMongoConnection",
     "get_project_database",
     "get_project_connection",
+    "ensure_project_indexes",
+
+    "EntityCache",
+    "enable_entity_cache",
+    "disable_entity_cache",
+    "get_entity_cache",
+    "invalidate_entity_cache",
+    "get_entity_cache_stats",
 )
@@ -13,6 +13,7 @@ import six
 from bson.objectid import ObjectId
 
 from .mongo import get_project_database, get_project_connection
+from .entity_cache import cached_entity_getter
 
 PatternType = type(re.compile(""))
 
@@ -93,6 +94,7 @@ def get_projects(active=True, inactive=False, fields=None):
             yield project_doc
 
 
+@cached_entity_getter
 def get_project(project_name, active=True, inactive=True, fields=None):
     """Return project entity document by project name.
 
@@ -150,6 +152,7 @@ def get_whole_project(project_name):
     return conn.find({})
 
 
+@cached_entity_getter
 def get_asset_by_id(project_name, asset_id, fields=None):
     """Receive asset data by its id.
 
@@ -174,6 +177,7 @@ def get_asset_by_id(project_name, asset_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_asset_by_name(project_name, asset_name, fields=None):
     """Receive asset data by its name.
 
@@ -268,6 +272,7 @@ def _get_assets(
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_assets(
     project_name,
     asset_ids=None,
@@ -309,6 +314,7 @@ def get_assets(
     )
 
 
+@cached_entity_getter
 def get_archived_assets(
     project_name,
     asset_ids=None,
@@ -384,6 +390,7 @@ def get_asset_ids_with_subsets(project_name, asset_ids=None):
     return asset_ids_with_subsets
 
 
+@cached_entity_getter
 def get_subset_by_id(project_name, subset_id, fields=None):
     """Single subset entity data by its id.
 
@@ -408,6 +415,7 @@ def get_subset_by_id(project_name, subset_id, fields=None):
     return conn.find_one(query_filters, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
     """Single subset entity data by its name and its version id.
 
@@ -439,6 +447,7 @@ def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
     return conn.find_one(query_filters, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_subsets(
     project_name,
     subset_ids=None,
@@ -548,6 +557,7 @@ def get_subset_families(project_name, subset_ids=None):
     return set()
 
 
+@cached_entity_getter
 def get_version_by_id(project_name, version_id, fields=None):
     """Single version entity data by its id.
 
@@ -575,6 +585,7 @@ def get_version_by_id(project_name, version_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_version_by_name(project_name, version, subset_id, fields=None):
     """Single version entity data by its name and subset id.
 
@@ -690,6 +701,7 @@ def _get_versions(
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_versions(
     project_name,
     version_ids=None,
@@ -729,6 +741,7 @@ def get_versions(
     )
 
 
+@cached_entity_getter
 def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     """Hero version by subset id.
 
@@ -761,6 +774,7 @@ def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     return None
 
 
+@cached_entity_getter
 def get_hero_version_by_id(project_name, version_id, fields=None):
     """Hero version by its id.
 
@@ -792,6 +806,7 @@ def get_hero_version_by_id(project_name, version_id, fields=None):
     return None
 
 
+@cached_entity_getter
 def get_hero_versions(
     project_name,
     subset_ids=None,
@@ -855,9 +870,168 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+def get_versions_by_source_hashes(project_name, source_hashes, fields=None):
+    """Versions which published sources with any of passed source hashes.
+
+    Source hashes (see 'openpype.lib.source_hash') are stored as keys of
+    'data.sourceHashes' with published path as value. Keys are also stored
+    in indexed 'data.sourceHashKeys' list which is used for the query.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        source_hashes (Iterable[str]): Source hashes.
+        fields (Optional[Iterable[str]]): Fields that should be returned. All
+            fields are returned if 'None' is passed.
+
+    Returns:
+        Cursor: Iterable cursor yielding all matching versions.
+    """
+
+    source_hashes = set(source_hashes or [])
+    if not source_hashes:
+        return []
+
+    query_filter = {
+        "type": "version",
+        "data.sourceHashKeys": {"$in": list(source_hashes)}
+    }
+    conn = get_project_connection(project_name)
+    return conn.find(query_filter, _prepare_fields(fields))
+
+
+def _get_stored_last_versions(conn, subset_ids):
+    """Last versions of subsets based on 'data.lastVersion' of subsets.
+
+    Last version is stored on subset by 'MongoOperationsSession' on version
+    creation. Stored value is validated with single query that stored
+    version exists and there is not a version with higher name, because
+    versions can be created or removed without the operations session.
+
+    Args:
+        conn (pymongo.collection.Collection): Project collection.
+        subset_ids (list[ObjectId]): Subset ids.
+
+    Returns:
+        tuple[dict[ObjectId, dict[str, Any]], list[ObjectId]]: Last version
+            data ('_id', 'parent', 'name') by subset id and subset ids
+            where stored value is not available or is not valid.
+    """
+
+    stored_by_subset_id = {}
+    for subset_doc in conn.find(
+        {"type": "subset", "_id": {"$in": subset_ids}},
+        {"data.lastVersion": True}
+    ):
+        last_version = subset_doc.get("data", {}).get("lastVersion")
+        if last_version and last_version.get("id"):
+            stored_by_subset_id[subset_doc["_id"]] = last_version
+
+    if not stored_by_subset_id:
+        return {}, subset_ids
+
+    or_filters = [{
+        "type": "version",
+        "_id": {"$in": [
+            last_version["id"]
+            for last_version in stored_by_subset_id.values()
+        ]}
+    }]
+    for subset_id, last_version in stored_by_subset_id.items():
+        or_filters.append({
+            "type": "version",
+            "parent": subset_id,
+            "name": {"$gt": last_version["name"]}
+        })
+
+    existing_ids = set()
+    invalid_subset_ids = set()
+    for version_doc in conn.find(
+        {"$or": or_filters}, {"_id": True, "parent": True, "name": True}
+    ):
+        subset_id = version_doc["parent"]
+        last_version = stored_by_subset_id.get(subset_id)
+        if last_version is None:
+            continue
+        if version_doc["_id"] == last_version["id"]:
+            existing_ids.add(version_doc["_id"])
+        elif version_doc["name"] > last_version["name"]:
+            invalid_subset_ids.add(subset_id)
+
+    output = {}
+    remaining_subset_ids = []
+    for subset_id in subset_ids:
+        last_version = stored_by_subset_id.get(subset_id)
+        if (
+            last_version is None
+            or subset_id in invalid_subset_ids
+            or last_version["id"] not in existing_ids
+        ):
+            remaining_subset_ids.append(subset_id)
+            continue
+        output[subset_id] = {
+            "_id": last_version["id"],
+            "parent": subset_id,
+            "name": last_version["name"]
+        }
+    return output, remaining_subset_ids
+
+
+def _aggregate_last_versions(conn, subset_ids, active=None):
+    """Last versions of subsets calculated with aggregation.
+
+    Args:
+        conn (pymongo.collection.Collection): Project collection.
+        subset_ids (list[ObjectId]): Subset ids.
+        active (Optional[bool]): If True only active versions are used.
+
+    Returns:
+        dict[ObjectId, dict[str, Any]]: Last version data ('_id', 'parent',
+            'name') by subset id.
+    """
+
+    aggregate_filter = {
+        "type": "version",
+        "parent": {"$in": subset_ids}
+    }
+    if active is False:
+        aggregate_filter["data.active"] = active
+    elif active is True:
+        aggregate_filter["$or"] = [
+            {"data.active": {"$exists": 0}},
+            {"data.active": active},
+        ]
+
+    aggregation_pipeline = [
+        # Find all versions of those subsets
+        {"$match": aggregate_filter},
+        # Sorting versions all together
+        {"$sort": {"name": 1}},
+        # Group them by "parent", but only take the last
+        {"$group": {
+            "_id": "$parent",
+            "_version_id": {"$last": "$_id"},
+            "name": {"$last": "$name"}
+        }}
+    ]
+
+    return {
+        item["_id"]: {
+            "_id": item["_version_id"],
+            "parent": item["_id"],
+            "name": item["name"]
+        }
+        for item in conn.aggregate(aggregation_pipeline)
+    }
+
+
+@cached_entity_getter
 def get_last_versions(project_name, subset_ids, active=None, fields=None):
     """Latest versions for entered subset_ids.
 
+    Last versions stored on subsets are used when 'active' filter is not
+    set. Subsets without valid stored value fallback to aggregation
+    of all their versions.
+
     Args:
         project_name (str): Name of project where to look for queried entities.
         subset_ids (Iterable[Union[str, ObjectId]]): List of subset ids.
@@ -892,51 +1066,33 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
                 fields_s.remove(field)
         limit_query = len(fields_s) == 0
 
-    group_item = {
-        "_id": "$parent",
-        "_version_id": {"$last": "$_id"}
-    }
-    # Add name if name is needed (only for limit query)
-    if name_needed:
-        group_item["name"] = {"$last": "$name"}
-
-    aggregate_filter = {
-        "type": "version",
-        "parent": {"$in": subset_ids}
-    }
-    if active is False:
-        aggregate_filter["data.active"] = active
-    elif active is True:
-        aggregate_filter["$or"] = [
-            {"data.active": {"$exists": 0}},
-            {"data.active": active},
-        ]
+    conn = get_project_connection(project_name)
+    last_versions = {}
+    if active is None:
+        last_versions, subset_ids = _get_stored_last_versions(
+            conn, subset_ids
+        )
 
-    aggregation_pipeline = [
-        # Find all versions of those subsets
-        {"$match": aggregate_filter},
-        # Sorting versions all together
-        {"$sort": {"name": 1}},
-        # Group them by "parent", but only take the last
-        {"$group": group_item}
-    ]
+    if subset_ids:
+        last_versions.update(
+            _aggregate_last_versions(conn, subset_ids, active)
+        )
 
-    conn = get_project_connection(project_name)
-    aggregate_result = conn.aggregate(aggregation_pipeline)
     if limit_query:
         output = {}
-        for item in aggregate_result:
-            subset_id = item["_id"]
-            item_data = {"_id": item["_version_id"], "parent": subset_id}
+        for subset_id, last_version in last_versions.items():
+            item_data = {"_id": last_version["_id"], "parent": subset_id}
             if name_needed:
-                item_data["name"] = item["name"]
+                item_data["name"] = last_version["name"]
             output[subset_id] = item_data
         return output
 
     version_ids = [
-        doc["_version_id"]
-        for doc in aggregate_result
+        last_version["_id"]
+        for last_version in last_versions.values()
     ]
+    if not version_ids:
+        return {}
 
     fields = _prepare_fields(fields, ["parent"])
 
@@ -950,6 +1106,7 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
     }
 
 
+@cached_entity_getter
 def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     """Last version for passed subset id.
 
@@ -975,6 +1132,7 @@ def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     return last_versions.get(subset_id)
 
 
+@cached_entity_getter
 def get_last_version_by_subset_name(
     project_name, subset_name, asset_id=None, asset_name=None, fields=None
 ):
@@ -1016,6 +1174,7 @@ def get_last_version_by_subset_name(
     )
 
 
+@cached_entity_getter
 def get_representation_by_id(project_name, representation_id, fields=None):
     """Representation entity data by its id.
 
@@ -1046,6 +1205,7 @@ def get_representation_by_id(project_name, representation_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_representation_by_name(
     project_name, representation_name, version_id, fields=None
 ):
@@ -1219,6 +1379,7 @@ def _get_representations(
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_representations(
     project_name,
     representation_ids=None,
@@ -1312,6 +1473,36 @@ def get_archived_representations(
     )
 
 
+def get_representations_by_file_hashes(
+    project_name, file_hashes, fields=None
+):
+    """Representations containing file with any of passed content hashes.
+
+    Content hash of file is stored in 'content_hash' key of file info in
+    representation 'files'.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        file_hashes (Iterable[str]): Content hashes of files.
+        fields (Optional[Iterable[str]]): Fields that should be returned. All
+            fields are returned if 'None' is passed.
+
+    Returns:
+        Cursor: Iterable cursor yielding all matching representations.
+    """
+
+    file_hashes = set(file_hashes or [])
+    if not file_hashes:
+        return []
+
+    query_filter = {
+        "type": "representation",
+        "files.content_hash": {"$in": list(file_hashes)}
+    }
+    conn = get_project_connection(project_name)
+    return conn.find(query_filter, _prepare_fields(fields))
+
+
 def get_representations_parents(project_name, representations):
     """Prepare parents of representation entities.
 
@@ -1438,6 +1629,7 @@ def get_thumbnail_id_from_source(project_name, src_type, src_id):
     return None
 
 
+@cached_entity_getter
 def get_thumbnails(project_name, thumbnail_ids, fields=None):
     """Receive thumbnails entity data.
 
@@ -1468,6 +1660,7 @@ def get_thumbnails(project_name, thumbnail_ids, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_thumbnail(
     project_name, thumbnail_id, entity_type, entity_id, fields=None
 ):
@@ -1492,6 +1685,7 @@ def get_thumbnail(
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_getter
 def get_workfile_info(
     project_name, asset_id, task_name, filename, fields=None
 ):
@@ -0,0 +1,498 @@
+"""Process-wide read-through cache of entity documents.
+
+Cache is disabled by default. It can be enabled with
+'enable_entity_cache' or by setting 'OPENPYPE_ENTITY_CACHE' environment
+variable to '1' ('OPENPYPE_ENTITY_CACHE_TTL' and
+'OPENPYPE_ENTITY_CACHE_SIZE' can change default limits).
+
+Cached values of a project are invalidated when project collection is
+changed. Changes are received from MongoDB change streams, which require
+replica set. Counters of 'top' command are polled if change streams are not
+available. Operations committed with 'MongoOperationsSession' invalidate
+the project immediately.
+
+Returned documents are copies so it is safe to modify them.
+"""
+
+import os
+import copy
+import time
+import logging
+import threading
+import functools
+import collections
+
+import six
+from pymongo.errors import OperationFailure, PyMongoError
+
+ENTITY_CACHE_ENV_KEY = "OPENPYPE_ENTITY_CACHE"
+ENTITY_CACHE_TTL_ENV_KEY = "OPENPYPE_ENTITY_CACHE_TTL"
+ENTITY_CACHE_SIZE_ENV_KEY = "OPENPYPE_ENTITY_CACHE_SIZE"
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_SIZE = 4096
+# Interval of 'top' polling if change streams are not available
+POLL_INTERVAL = 2.0
+
+_CACHE_STATE = {
+    "initialized": False,
+    "cache": None,
+}
+_CACHE_LOCK = threading.Lock()
+
+
+def _freeze(value):
+    """Convert value to hashable value usable in cache key."""
+
+    if isinstance(value, dict):
+        return frozenset(
+            (key, _freeze(item))
+            for key, item in value.items()
+        )
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _normalize_arg(value):
+    """Convert iterators to lists so they can be used multiple times."""
+
+    if (
+        hasattr(value, "__iter__")
+        and not isinstance(
+            value, (six.string_types, dict, list, tuple, set, frozenset)
+        )
+    ):
+        return list(value)
+    return value
+
+
+class EntityCache(object):
+    """Least recently used cache of getter results with TTL.
+
+    Args:
+        ttl (Optional[float]): Time in seconds after which values expire.
+        max_size (Optional[int]): Maximum number of cached results.
+    """
+
+    log = logging.getLogger("EntityCache")
+
+    def __init__(self, ttl=None, max_size=None):
+        if ttl is None:
+            ttl = DEFAULT_CACHE_TTL
+        if max_size is None:
+            max_size = DEFAULT_CACHE_SIZE
+        self._ttl = ttl
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._items = collections.OrderedDict()
+        self._keys_by_project = collections.defaultdict(set)
+        # Generation of project is changed on each invalidation, results
+        #   queried during invalidation are not stored
+        self._generations = collections.defaultdict(int)
+        self._stats = collections.Counter()
+        self._watcher = None
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        """Get cached value.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            tuple[bool, Any]: Value was found and the value.
+        """
+
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                expire_time, project_name, value = item
+                if expire_time > time.time():
+                    self._items.pop(key)
+                    self._items[key] = item
+                    self._stats["hits"] += 1
+                    return True, value
+                self._remove_item(key)
+                self._stats["expired"] += 1
+            self._stats["misses"] += 1
+        return False, None
+
+    def set(self, project_name, key, value, generation=None):
+        """Store value.
+
+        Args:
+            project_name (str): Project to which value is related.
+            key (Hashable): Cache key.
+            value (Any): Value to store.
+            generation (Optional[int]): Generation of project when value was
+                queried. Value is not stored if project was invalidated
+                since then.
+        """
+
+        with self._lock:
+            if (
+                generation is not None
+                and generation != self._generations[project_name]
+            ):
+                return
+            if key in self._items:
+                self._remove_item(key)
+            self._items[key] = (time.time() + self._ttl, project_name, value)
+            self._keys_by_project[project_name].add(key)
+            while len(self._items) > self._max_size:
+                old_key = next(iter(self._items))
+                self._remove_item(old_key)
+                self._stats["evictions"] += 1
+
+    def get_generation(self, project_name):
+        with self._lock:
+            return self._generations[project_name]
+
+    def _remove_item(self, key):
+        _, project_name, _ = self._items.pop(key)
+        keys = self._keys_by_project.get(project_name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                self._keys_by_project.pop(project_name)
+
+    def invalidate_project(self, project_name):
+        """Remove cached values of a project.
+
+        Args:
+            project_name (str): Project name.
+        """
+
+        with self._lock:
+            self._generations[project_name] += 1
+            keys = self._keys_by_project.pop(project_name, None)
+            if not keys:
+                return
+            for key in keys:
+                self._items.pop(key, None)
+            self._stats["invalidations"] += 1
+
+    def clear(self):
+        """Remove all cached values."""
+
+        with self._lock:
+            for project_name in tuple(self._generations.keys()):
+                self._generations[project_name] += 1
+            self._items.clear()
+            self._keys_by_project.clear()
+            self._stats["invalidations"] += 1
+
+    def get_stats(self):
+        """Counters of cache usage.
+
+        Returns:
+            dict[str, Any]: Hits, misses, expired, evicted values, number
+                of invalidations, number of cached values and hit ratio.
+        """
+
+        with self._lock:
+            stats = {
+                key: self._stats[key]
+                for key in (
+                    "hits", "misses", "expired", "evictions", "invalidations"
+                )
+            }
+            stats["size"] = len(self._items)
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = 0.0
+        if requests:
+            stats["hit_ratio"] = float(stats["hits"]) / requests
+        return stats
+
+    def call(self, func, args, kwargs):
+        """Call getter function or return its cached result.
+
+        Args:
+            func (Callable): Getter function with project name as first
+                argument.
+            args (tuple): Positional arguments.
+            kwargs (dict[str, Any]): Keyword arguments.
+
+        Returns:
+            Any: Copy of cached or queried result.
+        """
+
+        args = tuple(_normalize_arg(arg) for arg in args)
+        kwargs = {
+            key: _normalize_arg(value)
+            for key, value in kwargs.items()
+        }
+        if args:
+            project_name = args[0]
+        else:
+            project_name = kwargs.get("project_name")
+
+        try:
+            key = (func.__name__, _freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        found, value = self.get(key)
+        if found:
+            return copy.deepcopy(value)
+
+        generation = self.get_generation(project_name)
+        result = func(*args, **kwargs)
+        if result is not None and not isinstance(result, dict):
+            result = list(result)
+        self.set(project_name, key, copy.deepcopy(result), generation)
+        return result
+
+    def start_watcher(self, database=None):
+        """Start thread invalidating projects changed in database.
+
+        Args:
+            database (Optional[pymongo.database.Database]): Database with
+                project collections.
+        """
+
+        if self._watcher is not None:
+            return
+        self._watcher = _EntityChangesWatcher(self, database)
+        self._watcher.start()
+
+    def stop_watcher(self):
+        if self._watcher is None:
+            return
+        self._watcher.stop()
+        self._watcher = None
+
+
+class _EntityChangesWatcher(threading.Thread):
+    """Thread invalidating cache based on changes in project database.
+
+    Change streams are used when available (replica set), otherwise are
+    polled operation counters of 'top' command. Only TTL is used if none
+    of them is available.
+    """
+
+    log = logging.getLogger("EntityChangesWatcher")
+
+    def __init__(self, cache, database=None):
+        super(_EntityChangesWatcher, self).__init__()
+        self.daemon = True
+        self._cache = cache
+        self._database = database
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _get_database(self):
+        if self._database is None:
+            from .mongo import get_project_database
+
+            self._database = get_project_database()
+        return self._database
+
+    def run(self):
+        try:
+            database = self._get_database()
+        except Exception:
+            self.log.warning(
+                "Entity cache can't connect to database, only TTL is used.",
+                exc_info=True
+            )
+            return
+
+        while not self._stopped.is_set():
+            try:
+                self._watch(database)
+                return
+
+            except OperationFailure as exc:
+                self.log.debug((
+                    "Change streams are not available ({}),"
+                    " polling 'top' command."
+                ).format(exc))
+                break
+
+            except PyMongoError:
+                # Changes could be missed
+                self.log.debug(
+                    "Change stream failed, restarting.", exc_info=True
+                )
+                self._cache.clear()
+                self._stopped.wait(POLL_INTERVAL)
+
+        try:
+            self._poll(database)
+        except OperationFailure:
+            self.log.warning((
+                "Entity cache can't watch database changes, only TTL is used."
+            ), exc_info=True)
+
+    def _watch(self, database):
+        with database.watch(max_await_time_ms=1000) as stream:
+            # Values cached before stream started could be outdated
+            self._cache.clear()
+            while not self._stopped.is_set() and stream.alive:
+                change = stream.try_next()
+                if change is None:
+                    continue
+                operation_type = change.get("operationType")
+                if operation_type in ("dropDatabase", "invalidate"):
+                    self._cache.clear()
+                    continue
+                collection_name = change.get("ns", {}).get("coll")
+                if collection_name:
+                    self._cache.invalidate_project(collection_name)
+
+    def _poll(self, database):
+        prefix = "{}.".format(database.name)
+        admin_db = database.client.admin
+        last_counts = None
+        while not self._stopped.is_set():
+            try:
+                totals = admin_db.command("top")["totals"]
+            except OperationFailure:
+                raise
+            except PyMongoError:
+                self._cache.clear()
+                last_counts = None
+                self._stopped.wait(POLL_INTERVAL)
+                continue
+
+            counts = {}
+            for namespace, values in totals.items():
+                if not namespace.startswith(prefix):
+                    continue
+                counts[namespace[len(prefix):]] = sum(
+                    values.get(key, {}).get("count", 0)
+                    for key in ("insert", "update", "remove")
+                )
+
+            if last_counts is not None:
+                for collection_name, count in counts.items():
+                    if last_counts.get(collection_name) != count:
+                        self._cache.invalidate_project(collection_name)
+            last_counts = counts
+            self._stopped.wait(POLL_INTERVAL)
+
+
+def enable_entity_cache(ttl=None, max_size=None, watch=True):
+    """Enable process-wide entity cache.
+
+    Args:
+        ttl (Optional[float]): Time in seconds after which values expire.
+        max_size (Optional[int]): Maximum number of cached results.
+        watch (Optional[bool]): Invalidate cache based on database changes.
+
+    Returns:
+        EntityCache: Enabled cache.
+    """
+
+    with _CACHE_LOCK:
+        _CACHE_STATE["initialized"] = True
+        cache = _CACHE_STATE["cache"]
+        if cache is not None:
+            cache.stop_watcher()
+        cache = EntityCache(ttl, max_size)
+        _CACHE_STATE["cache"] = cache
+
+    if watch:
+        cache.start_watcher()
+    return cache
+
+
+def disable_entity_cache():
+    """Disable process-wide entity cache."""
+
+    with _CACHE_LOCK:
+        _CACHE_STATE["initialized"] = True
+        cache = _CACHE_STATE["cache"]
+        _CACHE_STATE["cache"] = None
+
+    if cache is not None:
+        cache.stop_watcher()
+
+
+def get_entity_cache():
+    """Process-wide entity cache if is enabled.
+
+    Cache is enabled on first call if 'OPENPYPE_ENTITY_CACHE' environment
+    variable is set to '1'.
+
+    Returns:
+        Union[EntityCache, None]: Entity cache or None if is disabled.
+    """
+
+    if _CACHE_STATE["initialized"]:
+        return _CACHE_STATE["cache"]
+
+    with _CACHE_LOCK:
+        initialized = _CACHE_STATE["initialized"]
+        _CACHE_STATE["initialized"] = True
+
+    if not initialized and os.environ.get(ENTITY_CACHE_ENV_KEY) == "1":
+        ttl = os.environ.get(ENTITY_CACHE_TTL_ENV_KEY)
+        max_size = os.environ.get(ENTITY_CACHE_SIZE_ENV_KEY)
+        enable_entity_cache(
+            float(ttl) if ttl else None,
+            int(max_size) if max_size else None
+        )
+    return _CACHE_STATE["cache"]
+
+
+def invalidate_entity_cache(project_name=None):
+    """Remove cached values.
+
+    Args:
+        project_name (Optional[str]): Remove only values of the project.
+    """
+
+    cache = _CACHE_STATE["cache"]
+    if cache is None:
+        return
+    if project_name:
+        cache.invalidate_project(project_name)
+    else:
+        cache.clear()
+
+
+def get_entity_cache_stats():
+    """Usage counters of entity cache.
+
+    Returns:
+        Union[dict[str, Any], None]: Counters or None if cache is disabled.
+    """
+
+    cache = _CACHE_STATE["cache"]
+    if cache is None:
+        return None
+    return cache.get_stats()
+
+
+def cached_entity_getter(func):
+    """Decorator of entity getters using entity cache if is enabled.
+
+    Decorated function must have project name as first argument and return
+    document, dictionary, None or iterable of documents. Iterables are
+    returned as lists when cache is enabled.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = get_entity_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+        return cache.call(func, args, kwargs)
+    return wrapper
@@ -17,6 +17,8 @@ if sys.version_info[0] == 2:
 else:
     from urllib.parse import urlparse, parse_qs
 
+from .entity_cache import invalidate_entity_cache
+
 
 class MongoEnvNotSet(Exception):
     pass
@@ -378,6 +380,84 @@ def get_project_connection(project_name, database_name=None):
     return get_project_database(database_name)[project_name]
 
 
+# Indexes of project collection used by entity queries
+# - all entity types are in the same collection so 'type' is always first
+PROJECT_INDEXES = (
+    # Subsets, versions, representations and workfiles by parent
+    #   and name (also used for last versions)
+    {
+        "name": "type_parent_name",
+        "keys": [("type", 1), ("parent", 1), ("name", 1)],
+    },
+    # Entities by name (e.g. assets)
+    {
+        "name": "type_name",
+        "keys": [("type", 1), ("name", 1)],
+    },
+    # Assets by parent asset
+    {
+        "name": "type_visual_parent",
+        "keys": [("type", 1), ("data.visualParent", 1)],
+    },
+    # Output links of versions
+    {
+        "name": "type_input_links",
+        "keys": [("type", 1), ("data.inputLinks.id", 1)],
+    },
+    # Representations by site (sync server)
+    {
+        "name": "type_files_sites_name",
+        "keys": [("type", 1), ("files.sites.name", 1)],
+    },
+    # Representations by context
+    {
+        "name": "type_context_asset_subset",
+        "keys": [("type", 1), ("context.asset", 1), ("context.subset", 1)],
+    },
+    # Representations by content hash of files
+    {
+        "name": "type_files_content_hash",
+        "keys": [("type", 1), ("files.content_hash", 1)],
+    },
+    # Versions by source hashes of published textures
+    {
+        "name": "type_source_hash_keys",
+        "keys": [("type", 1), ("data.sourceHashKeys", 1)],
+    },
+)
+
+
+def ensure_project_indexes(project_name, database_name=None):
+    """Create indexes of project collection if they don't exist.
+
+    Index is not created if index with the same keys already exists
+    (e.g. created manually with different name).
+
+    Args:
+        project_name (str): Name of project.
+        database_name (Optional[str]): Name of mongo database where project
+            collection is.
+
+    Returns:
+        list[str]: Names of created indexes.
+    """
+
+    conn = get_project_connection(project_name, database_name)
+    existing_keys = {
+        tuple(tuple(key) for key in index_info["key"])
+        for index_info in conn.index_information().values()
+    }
+
+    created = []
+    for index_info in PROJECT_INDEXES:
+        keys = index_info["keys"]
+        if tuple(keys) in existing_keys:
+            continue
+        conn.create_index(keys, name=index_info["name"], background=True)
+        created.append(index_info["name"])
+    return created
+
+
 def get_project_documents(project_name, database_name=None):
     """Query all documents from project collection.
 
@@ -427,6 +507,8 @@ def replace_project_documents(project_name, docs, database_name=None):
     if not database_name:
         database_name = get_project_database_name()
     replace_collection_documents(docs, database_name, project_name)
+    ensure_project_indexes(project_name, database_name)
+    invalidate_entity_cache(project_name)
 
 
 def restore_project_documents(project_name, filepath, database_name=None):
@@ -445,3 +527,5 @@ def restore_project_documents(project_name, filepath, database_name=None):
     if not database_name:
         database_name = get_project_database_name()
     restore_collection(filepath, database_name, project_name)
+    ensure_project_indexes(project_name, database_name)
+    invalidate_entity_cache(project_name)
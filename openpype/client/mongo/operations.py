@@ -1,9 +1,18 @@
 import re
 import copy
+import time
+import logging
+import threading
 import collections
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 hosts without 'futures' backport commit synchronously
+    ThreadPoolExecutor = None
+
 from bson.objectid import ObjectId
-from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo import DeleteOne, InsertOne, UpdateOne, UpdateMany
 
 from openpype.client.operations_base import (
     REMOVED_VALUE,
@@ -12,7 +21,8 @@ from openpype.client.operations_base import (
     DeleteOperation,
     BaseOperationsSession
 )
-from .mongo import get_project_connection
+from .mongo import get_project_connection, ensure_project_indexes
+from .entity_cache import invalidate_entity_cache
 from .entities import get_project
 
 
@@ -31,6 +41,14 @@ CURRENT_REPRESENTATION_SCHEMA = "openpype:representation-2.0"
 CURRENT_WORKFILE_INFO_SCHEMA = "openpype:workfile-1.0"
 CURRENT_THUMBNAIL_SCHEMA = "openpype:thumbnail-1.0"
 
+# Maximum number of write operations sent in one bulk write
+BULK_WRITE_CHUNK_SIZE = 1000
+
+_COMMIT_EXECUTOR = {
+    "executor": None,
+    "lock": threading.Lock(),
+}
+
 
 def _create_or_convert_to_mongo_id(mongo_id):
     if mongo_id is None:
@@ -470,6 +488,134 @@ class MongoDeleteOperation(DeleteOperation):
         return DeleteOne({"_id": self.entity_id})
 
 
+def _prepare_last_version_operations(operations):
+    """Prepare operations keeping last version stored on subsets up to date.
+
+    Subset document stores id and name of its last version under
+    'data.lastVersion' so 'get_last_versions' does not have to aggregate
+    all versions of subsets. Created versions set the value if they are
+    newer than the stored version. Removed versions, or versions with
+    changed name or parent, unset the value so it's calculated again.
+
+    Args:
+        operations (list[AbstractOperation]): Operations of single project.
+
+    Returns:
+        list[Union[UpdateOne, UpdateMany]]: Mongo operations which should
+            be processed after all operations of the session.
+    """
+
+    outdated_version_ids = set()
+    last_version_by_subset_id = {}
+    for operation in operations:
+        if operation.entity_type != "version":
+            continue
+
+        if operation.operation_name == "create":
+            subset_id = operation.data.get("parent")
+            version = operation.data.get("name")
+            if subset_id is None or version is None:
+                continue
+            subset_id = ObjectId(subset_id)
+            last_version = last_version_by_subset_id.get(subset_id)
+            if last_version is None or last_version["name"] < version:
+                last_version_by_subset_id[subset_id] = {
+                    "id": operation.entity_id,
+                    "name": version
+                }
+
+        elif operation.operation_name == "delete":
+            outdated_version_ids.add(operation.entity_id)
+
+        elif operation.operation_name == "update":
+            update_data = operation.update_data
+            if "name" in update_data or "parent" in update_data:
+                outdated_version_ids.add(operation.entity_id)
+
+    output = []
+    if outdated_version_ids:
+        output.append(UpdateMany(
+            {
+                "type": "subset",
+                "data.lastVersion.id": {"$in": list(outdated_version_ids)}
+            },
+            {"$unset": {"data.lastVersion": None}}
+        ))
+
+    for subset_id, last_version in last_version_by_subset_id.items():
+        output.append(UpdateOne(
+            {
+                "_id": subset_id,
+                "type": "subset",
+                # Field does not exist or is lower than created version
+                "data.lastVersion.name": {
+                    "$not": {"$gte": last_version["name"]}
+                }
+            },
+            {"$set": {"data.lastVersion": last_version}}
+        ))
+    return output
+
+
+def _get_commit_executor():
+    """Executor committing sessions in background.
+
+    Single worker is used so background commits happen in order in which
+    were requested.
+
+    Returns:
+        Union[ThreadPoolExecutor, None]: Executor or None if is not
+            available.
+    """
+
+    if ThreadPoolExecutor is None:
+        return None
+
+    with _COMMIT_EXECUTOR["lock"]:
+        executor = _COMMIT_EXECUTOR["executor"]
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+            _COMMIT_EXECUTOR["executor"] = executor
+    return executor
+
+
+def _split_bulk_writes(operations, chunk_size):
+    """Split operations to chunks which can be written unordered.
+
+    Operations related to the same entity must keep their order, so new
+    chunk is started when entity is already in current chunk.
+
+    Args:
+        operations (list[AbstractOperation]): Operations to split.
+        chunk_size (int): Maximum number of operations in a chunk.
+
+    Returns:
+        list[list[Union[InsertOne, UpdateOne, DeleteOne]]]: Chunks of mongo
+            operations.
+    """
+
+    chunks = []
+    chunk = []
+    entity_ids = set()
+    for operation in operations:
+        mongo_op = operation.to_mongo_operation()
+        if mongo_op is None:
+            continue
+
+        entity_id = operation.entity_id
+        if len(chunk) >= chunk_size or entity_id in entity_ids:
+            chunks.append(chunk)
+            chunk = []
+            entity_ids = set()
+
+        chunk.append(mongo_op)
+        entity_ids.add(entity_id)
+
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
 class MongoOperationsSession(BaseOperationsSession):
     """Session storing operations that should happen in an order.
 
@@ -478,33 +624,106 @@ class MongoOperationsSession(BaseOperationsSession):
     of same entity is there multiple times it's handled in any way and document
     values are not validated.
 
-    All operations must be related to single project.
+    Operations are written in unordered bulk writes of limited size. Order
+    is kept only for operations related to the same entity.
 
     Args:
-        project_name (str): Project name to which are operations related.
+        chunk_size (Optional[int]): Maximum number of operations in one bulk
+            write. Default is 'BULK_WRITE_CHUNK_SIZE'.
     """
 
+    log = logging.getLogger("MongoOperationsSession")
+
+    def __init__(self, chunk_size=None):
+        super(MongoOperationsSession, self).__init__()
+        if not chunk_size:
+            chunk_size = BULK_WRITE_CHUNK_SIZE
+        self._chunk_size = chunk_size
+        self._last_commit_report = None
+
+    @property
+    def last_commit_report(self):
+        """Report of last finished commit.
+
+        Returns:
+            Union[dict[str, Any], None]: Number of operations, database
+                round trips, total duration and maximum latency of a round
+                trip in seconds.
+        """
+
+        return self._last_commit_report
+
     def commit(self):
-        """Commit session operations."""
+        """Commit session operations.
+
+        Returns:
+            Union[dict[str, Any], None]: Commit report or None if there was
+                nothing to commit.
+        """
 
         operations, self._operations = self._operations, []
+        return self._commit_operations(operations)
+
+    def commit_async(self):
+        """Commit session operations in background.
+
+        Operations added after this call are part of next commit.
+
+        Returns:
+            Future: Future with commit report.
+        """
+
+        executor = _get_commit_executor()
+        if executor is None:
+            return super(MongoOperationsSession, self).commit_async()
+
+        operations, self._operations = self._operations, []
+        return executor.submit(self._commit_operations, operations)
+
+    def _commit_operations(self, operations):
         if not operations:
-            return
+            return None
 
         operations_by_project = collections.defaultdict(list)
         for operation in operations:
             operations_by_project[operation.project_name].append(operation)
 
+        report = {
+            "operations": 0,
+            "round_trips": 0,
+            "duration": 0.0,
+            "max_latency": 0.0,
+        }
         for project_name, operations in operations_by_project.items():
-            bulk_writes = []
-            for operation in operations:
-                mongo_op = operation.to_mongo_operation()
-                if mongo_op is not None:
-                    bulk_writes.append(mongo_op)
-
-            if bulk_writes:
-                collection = get_project_connection(project_name)
-                collection.bulk_write(bulk_writes)
+            chunks = _split_bulk_writes(operations, self._chunk_size)
+            if not chunks:
+                continue
+
+            collection = get_project_connection(project_name)
+            for chunk in chunks:
+                self._bulk_write(collection, chunk, False, report)
+
+            last_version_ops = _prepare_last_version_operations(operations)
+            if last_version_ops:
+                self._bulk_write(collection, last_version_ops, True, report)
+            invalidate_entity_cache(project_name)
+
+        self.log.debug((
+            "Committed {operations} operations in {round_trips} round trips"
+            " ({duration:.3f}s, max latency {max_latency:.3f}s)"
+        ).format(**report))
+        self._last_commit_report = report
+        return report
+
+    @staticmethod
+    def _bulk_write(collection, mongo_ops, ordered, report):
+        start = time.time()
+        collection.bulk_write(mongo_ops, ordered=ordered)
+        latency = time.time() - start
+        report["operations"] += len(mongo_ops)
+        report["round_trips"] += 1
+        report["duration"] += latency
+        report["max_latency"] = max(report["max_latency"], latency)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
@@ -629,4 +848,92 @@ def create_project(
         op_session.commit()
         raise
 
+    ensure_project_indexes(project_name)
+
     return project_doc
+
+
+def rebuild_last_versions(project_name):
+    """Store last version of each subset on subset documents.
+
+    Last versions are stored on subsets during 'MongoOperationsSession'
+    commit. This function can be used to fill the values for projects
+    with versions created before or outside of the operations session.
+
+    Args:
+        project_name (str): Name of project where last versions are stored.
+
+    Returns:
+        int: Number of subsets with changed last version.
+    """
+
+    collection = get_project_connection(project_name)
+    last_version_by_subset_id = {
+        item["_id"]: {"id": item["version_id"], "name": item["name"]}
+        for item in collection.aggregate([
+            {"$match": {"type": "version"}},
+            {"$sort": {"name": 1}},
+            {"$group": {
+                "_id": "$parent",
+                "version_id": {"$last": "$_id"},
+                "name": {"$last": "$name"}
+            }}
+        ])
+    }
+
+    bulk_writes = []
+    for subset_doc in collection.find(
+        {"type": "subset"}, {"data.lastVersion": True}
+    ):
+        subset_id = subset_doc["_id"]
+        current = subset_doc.get("data", {}).get("lastVersion")
+        last_version = last_version_by_subset_id.get(subset_id)
+        if current == last_version:
+            continue
+
+        if last_version is None:
+            op_data = {"$unset": {"data.lastVersion": None}}
+        else:
+            op_data = {"$set": {"data.lastVersion": last_version}}
+        bulk_writes.append(UpdateOne({"_id": subset_id}, op_data))
+
+    if bulk_writes:
+        collection.bulk_write(bulk_writes)
+        invalidate_entity_cache(project_name)
+    return len(bulk_writes)
+
+
+def backfill_source_hash_keys(project_name):
+    """Store indexed 'data.sourceHashKeys' on versions with source hashes.
+
+    Keys of 'data.sourceHashes' are stored as list by integrator so
+    published sources can be found with indexed query. This function fills
+    the list on versions published before.
+
+    Args:
+        project_name (str): Name of project where versions are updated.
+
+    Returns:
+        int: Number of updated versions.
+    """
+
+    collection = get_project_connection(project_name)
+    bulk_writes = []
+    for version_doc in collection.find(
+        {
+            "type": "version",
+            "data.sourceHashes": {"$exists": True},
+            "data.sourceHashKeys": {"$exists": False}
+        },
+        {"data.sourceHashes": True}
+    ):
+        source_hashes = version_doc["data"].get("sourceHashes") or {}
+        bulk_writes.append(UpdateOne(
+            {"_id": version_doc["_id"]},
+            {"$set": {"data.sourceHashKeys": list(source_hashes.keys())}}
+        ))
+
+    if bulk_writes:
+        collection.bulk_write(bulk_writes)
+        invalidate_entity_cache(project_name)
+    return len(bulk_writes)
@@ -3,9 +3,37 @@ import copy
 from abc import ABCMeta, abstractmethod, abstractproperty
 import six
 
+try:
+    from concurrent.futures import Future
+except ImportError:
+    # Python 2 hosts without 'futures' backport
+    Future = None
+
 REMOVED_VALUE = object()
 
 
+class CommitResult(object):
+    """Result of finished commit with interface of 'Future'.
+
+    Used when 'concurrent.futures' is not available.
+    """
+
+    def __init__(self, result=None, exception=None):
+        self._result = result
+        self._exception = exception
+
+    def done(self):
+        return True
+
+    def exception(self, timeout=None):
+        return self._exception
+
+    def result(self, timeout=None):
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
 @six.add_metaclass(ABCMeta)
 class AbstractOperation(object):
     """Base operation class.
@@ -253,6 +281,34 @@ class BaseOperationsSession(object):
         """Commit session operations."""
         pass
 
+    def commit_async(self):
+        """Commit session operations without waiting for the result.
+
+        Operations are committed synchronously by default. Subclasses can
+        commit them in background so the caller can do something else
+        meanwhile.
+
+        Returns:
+            Union[Future, CommitResult]: Future with result of commit.
+        """
+
+        try:
+            result = self.commit()
+            exception = None
+        except Exception as exc:
+            result = None
+            exception = exc
+
+        if Future is None:
+            return CommitResult(result, exception)
+
+        future = Future()
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+        return future
+
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'CreateOperation'.
 
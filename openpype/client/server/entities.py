@@ -445,6 +445,11 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return get_versions(project_name, version_ids=version_ids, fields=fields)
 
 
+def get_versions_by_source_hashes(project_name, source_hashes, fields=None):
+    # Source hashes are not indexed on AYON server
+    return []
+
+
 def version_is_latest(project_name, version_id):
     con = get_server_api_connection()
     return con.version_is_latest(project_name, version_id)
@@ -580,6 +585,13 @@ def get_archived_representations(
     )
 
 
+def get_representations_by_file_hashes(
+    project_name, file_hashes, fields=None
+):
+    # Content hashes of files are not stored on AYON server
+    return []
+
+
 def get_thumbnail(
     project_name, thumbnail_id, entity_type, entity_id, fields=None
 ):
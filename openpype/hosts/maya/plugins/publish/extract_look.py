@@ -11,6 +11,12 @@ import tempfile
 import six
 import attr
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 hosts without 'futures' backport process textures serially
+    ThreadPoolExecutor = None
+
 import pyblish.api
 
 from maya import cmds  # noqa
@@ -20,9 +26,12 @@ from openpype.lib import (
     source_hash,
     run_subprocess,
     get_oiio_tool_args,
+    get_transcoding_max_workers,
+    ConversionCache,
     ToolNotFoundError,
 )
 
+from openpype.client import get_versions_by_source_hashes
 from openpype.pipeline import legacy_io, publish, KnownPublishError
 from openpype.hosts.maya.api import lib
 
@@ -57,8 +66,42 @@ def find_paths_by_hash(texture_hash):
         str: path to texture if found.
 
     """
-    key = "data.sourceHashes.{0}".format(texture_hash)
-    return legacy_io.distinct(key, {"type": "version"})
+    return find_paths_by_hashes([texture_hash]).get(texture_hash, [])
+
+
+def find_paths_by_hashes(texture_hashes, project_name=None):
+    """Find published paths of textures by their hashes.
+
+    Uses single indexed query for all hashes.
+
+    Args:
+        texture_hashes (Iterable[str]): Hashes of textures.
+        project_name (Optional[str]): Project name, active project is used
+            if not passed.
+
+    Returns:
+        dict[str, list[str]]: Published paths by texture hash. Hashes which
+            were not published are not in output.
+
+    """
+    texture_hashes = set(texture_hashes)
+    if not texture_hashes:
+        return {}
+
+    if project_name is None:
+        project_name = legacy_io.active_project()
+
+    output = {}
+    version_docs = get_versions_by_source_hashes(
+        project_name, texture_hashes, fields=["data.sourceHashes"]
+    )
+    for version_doc in version_docs:
+        source_hashes = version_doc["data"].get("sourceHashes") or {}
+        for texture_hash in texture_hashes:
+            path = source_hashes.get(texture_hash)
+            if path and path not in output.get(texture_hash, []):
+                output.setdefault(texture_hash, []).append(path)
+    return output
 
 
 @contextlib.contextmanager
@@ -102,6 +145,27 @@ class TextureProcessor:
         if log is None:
             log = logging.getLogger(self.__class__.__name__)
         self.log = log
+        # Optional 'ConversionCache' reusing results of previous conversions
+        self.conversion_cache = None
+
+    def run_conversion(self, source, texture_hash, destination, convert_func):
+        """Run conversion of texture or use cached result.
+
+        Args:
+            source (str): Path to source file.
+            texture_hash (str): Hash of source and conversion arguments.
+            destination (str): Path to converted file.
+            convert_func (Callable[[], Any]): Function converting the texture.
+        """
+        if self.conversion_cache is None:
+            convert_func()
+            return
+
+        if self.conversion_cache.convert(
+            source, texture_hash, destination, convert_func
+        ):
+            self.log.info(
+                "Using cached conversion of {}".format(source))
 
     def apply_settings(self, system_settings, project_settings):
         """Apply OpenPype system/project settings to the TextureProcessor
@@ -178,13 +242,16 @@ class MakeRSTexBin(TextureProcessor):
         basename, ext = os.path.splitext(source)
         destination = "{}{}".format(basename, self.extension)
 
-        self.log.debug(" ".join(subprocess_args))
-        try:
-            run_subprocess(subprocess_args)
-        except Exception:
-            self.log.error("Texture .rstexbin conversion failed",
-                           exc_info=True)
-            raise
+        def _convert():
+            self.log.debug(" ".join(subprocess_args))
+            try:
+                run_subprocess(subprocess_args)
+            except Exception:
+                self.log.error("Texture .rstexbin conversion failed",
+                               exc_info=True)
+                raise
+
+        self.run_conversion(source, texture_hash, destination, _convert)
 
         return TextureResult(
             path=destination,
@@ -363,13 +430,16 @@ class MakeTX(TextureProcessor):
         env = os.environ.copy()
         env.pop("OCIO", None)
 
-        self.log.debug(" ".join(subprocess_args))
-        try:
-            run_subprocess(subprocess_args, env=env)
-        except Exception:
-            self.log.error("Texture maketx conversion failed",
-                           exc_info=True)
-            raise
+        def _convert():
+            self.log.debug(" ".join(subprocess_args))
+            try:
+                run_subprocess(subprocess_args, env=env)
+            except Exception:
+                self.log.error("Texture maketx conversion failed",
+                               exc_info=True)
+                raise
+
+        self.run_conversion(source, texture_hash, destination, _convert)
 
         return TextureResult(
             path=destination,
@@ -460,6 +530,7 @@ class ExtractLook(publish.Extractor):
         # TODO: Load these more dynamically once we support more processors
         processors = []
         context = instance.context
+        conversion_cache = ConversionCache()
         for key, Processor in {
             # Instance data key to texture processor mapping
             "maketx": MakeTX,
@@ -469,6 +540,7 @@ class ExtractLook(publish.Extractor):
                 processor = Processor()
                 processor.apply_settings(context.data["system_settings"],
                                          context.data["project_settings"])
+                processor.conversion_cache = conversion_cache
                 processors.append(processor)
 
         if processors:
@@ -479,6 +551,8 @@ class ExtractLook(publish.Extractor):
         results = self.process_resources(instance,
                                          staging_dir=dir_path,
                                          processors=processors)
+        if processors:
+            conversion_cache.prune()
         transfers = results["fileTransfers"]
         hardlinks = results["fileHardlinks"]
         hashes = results["fileHashes"]
@@ -608,6 +682,21 @@ class ExtractLook(publish.Extractor):
                 destinations_cache[path] = destination
             return destinations_cache[path]
 
+        # Process each file once with colorspace of first resource using it
+        files_colorspace = OrderedDict()
+        for resource in resources:
+            for filepath in resource["files"]:
+                files_colorspace.setdefault(
+                    os.path.normpath(filepath), resource["color_space"]
+                )
+        texture_results = self._process_textures(
+            files_colorspace,
+            processors=processors,
+            staging_dir=staging_dir,
+            force_copy=force_copy,
+            color_management=color_management
+        )
+
         # Process all resource's individual files
         processed_files = {}
         transfers = []
@@ -648,14 +737,7 @@ class ExtractLook(publish.Extractor):
                     )
                     continue
 
-                texture_result = self._process_texture(
-                    filepath,
-                    processors=processors,
-                    staging_dir=staging_dir,
-                    force_copy=force_copy,
-                    color_management=color_management,
-                    colorspace=colorspace
-                )
+                texture_result = texture_results[filepath]
 
                 # Set the resulting color space on the resource
                 self._set_resource_result_colorspace(
@@ -716,6 +798,72 @@ class ExtractLook(publish.Extractor):
             "attrRemap": remap,
         }
 
+    def _process_textures(self,
+                          files_colorspace,
+                          processors,
+                          staging_dir,
+                          force_copy,
+                          color_management):
+        """Process texture files in parallel.
+
+        Textures are converted by external tools, so processing runs in
+        a bounded pool of threads waiting for the subprocesses.
+
+        Args:
+            files_colorspace (OrderedDict[str, str]): Colorspace by filepath.
+            processors (list): List of TextureProcessor processing textures.
+            staging_dir (str): The staging directory to write to.
+            force_copy (bool): Whether to force a copy of textures.
+            color_management (dict): Maya's Color Management settings from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            dict[str, TextureResult]: Texture results by filepath.
+        """
+
+        filepaths = list(files_colorspace.keys())
+
+        # Find already published textures with single query
+        published_paths_by_hash = None
+        if not processors and not force_copy:
+            published_paths_by_hash = find_paths_by_hashes(
+                source_hash(filepath) for filepath in filepaths
+            )
+
+        def _process(filepath):
+            return self._process_texture(
+                filepath,
+                processors=processors,
+                staging_dir=staging_dir,
+                force_copy=force_copy,
+                color_management=color_management,
+                colorspace=files_colorspace[filepath],
+                published_paths_by_hash=published_paths_by_hash
+            )
+
+        max_workers = min(get_transcoding_max_workers(), len(filepaths))
+        if not processors or ThreadPoolExecutor is None or max_workers < 2:
+            return {filepath: _process(filepath) for filepath in filepaths}
+
+        self.log.debug("Processing {} textures in {} workers".format(
+            len(filepaths), max_workers
+        ))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_process, filepath)
+                for filepath in filepaths
+            ]
+            try:
+                return {
+                    filepath: future.result()
+                    for filepath, future in zip(filepaths, futures)
+                }
+            except Exception:
+                # Don't start processing of remaining textures
+                for future in futures:
+                    future.cancel()
+                raise
+
     def get_resource_destination(self, filepath, resources_dir, processors):
         """Get resource destination path.
 
@@ -749,12 +897,23 @@ class ExtractLook(publish.Extractor):
             resources_dir, basename + ext
         )
 
-    def _get_existing_hashed_texture(self, texture_hash):
-        """Return the first found filepath from a texture hash"""
+    def _get_existing_hashed_texture(
+        self, texture_hash, published_paths_by_hash=None
+    ):
+        """Return the first found filepath from a texture hash
+
+        Args:
+            texture_hash (str): Hash of the texture.
+            published_paths_by_hash (Optional[dict[str, list[str]]]): Result
+                of `find_paths_by_hashes`, database is queried if not passed.
+        """
 
         # If source has been published before with the same settings,
         # then don't reprocess but hardlink from the original
-        existing = find_paths_by_hash(texture_hash)
+        if published_paths_by_hash is None:
+            existing = find_paths_by_hash(texture_hash)
+        else:
+            existing = published_paths_by_hash.get(texture_hash)
         if existing:
             source = next((p for p in existing if os.path.exists(p)), None)
             if source:
@@ -771,7 +930,8 @@ class ExtractLook(publish.Extractor):
                          staging_dir,
                          force_copy,
                          color_management,
-                         colorspace):
+                         colorspace,
+                         published_paths_by_hash=None):
         """Process a single texture file on disk for publishing.
 
         This will:
@@ -792,6 +952,9 @@ class ExtractLook(publish.Extractor):
                 `lib.get_color_management_preferences`
             colorspace (str): The source colorspace of the resources this
                 texture belongs to.
+            published_paths_by_hash (Optional[dict[str, list[str]]]):
+                Published paths of textures found by
+                `find_paths_by_hashes`.
 
         Returns:
             TextureResult: The texture result information.
@@ -825,7 +988,9 @@ class ExtractLook(publish.Extractor):
         # No texture processing for this file
         texture_hash = source_hash(filepath)
         if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
+            existing = self._get_existing_hashed_texture(
+                texture_hash, published_paths_by_hash
+            )
             if existing:
                 self.log.info("Found hash in database, preparing hardlink..")
                 return TextureResult(
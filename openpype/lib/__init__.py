@@ -97,7 +97,8 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    CompiledProfiles,
 )
 
 from .transcoding import (
@@ -105,6 +106,9 @@ from .transcoding import (
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
     convert_input_paths_for_ffmpeg,
+    get_transcoding_max_workers,
+    run_oiio_commands,
+    ConversionCache,
     get_ffprobe_data,
     get_ffprobe_streams,
     get_ffmpeg_codec_args,
@@ -143,6 +147,7 @@ from .applications import (
 from .plugin_tools import (
     prepare_template_data,
     source_hash,
+    get_file_content_hash,
 )
 
 from .path_tools import (
@@ -226,6 +231,9 @@ __all__ = [
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
     "convert_input_paths_for_ffmpeg",
+    "get_transcoding_max_workers",
+    "run_oiio_commands",
+    "ConversionCache",
     "get_ffprobe_data",
     "get_ffprobe_streams",
     "get_ffmpeg_codec_args",
@@ -257,9 +265,11 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "CompiledProfiles",
 
     "prepare_template_data",
     "source_hash",
+    "get_file_content_hash",
 
     "format_file_size",
     "collect_frames",
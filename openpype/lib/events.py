@@ -47,6 +47,8 @@ class EventCallback(object):
     def __init__(self, topic, func):
         self._log = None
         self._topic = topic
+        self._topic_prefix = topic.split("*", 1)[0]
+        self._has_wildcard = "*" in topic
         # Replace '*' with any character regex and escape rest of text
         #   - when callback is registered for '*' topic it will receive all
         #       events
@@ -101,6 +103,21 @@ class EventCallback(object):
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
+    @property
+    def topic(self):
+        """Topic to which is callback registered."""
+        return self._topic
+
+    @property
+    def topic_prefix(self):
+        """Part of topic before first wildcard."""
+        return self._topic_prefix
+
+    @property
+    def has_wildcard(self):
+        """Topic contains wildcard."""
+        return self._has_wildcard
+
     @property
     def is_ref_valid(self):
         return self._ref_valid
@@ -138,6 +155,18 @@ class EventCallback(object):
             event(Event): Event that was triggered.
         """
 
+        self._process_event(event, True)
+
+    def process_matched_event(self, event):
+        """Process event which topic is known to match callback's topic.
+
+        Args:
+            event(Event): Event that was triggered.
+        """
+
+        self._process_event(event, False)
+
+    def _process_event(self, event, check_topic):
         # Skip if callback is not enabled or has invalid reference
         if not self._ref_valid or not self._enabled:
             return
@@ -149,7 +178,7 @@ class EventCallback(object):
             # Change state if is invalid so the callback is removed
             self._ref_valid = False
 
-        elif self.topic_matches(event.topic):
+        elif not check_topic or self.topic_matches(event.topic):
             # Try execute callback
             try:
                 if self._expect_args:
@@ -278,6 +307,46 @@ class Event(object):
         return obj
 
 
+class _TopicTrie(object):
+    """Prefix tree of callbacks with wildcard topics.
+
+    Callbacks are stored in node of their topic prefix (part before first
+    wildcard), so callbacks which may match a topic are found by walking
+    the topic characters.
+    """
+
+    def __init__(self):
+        self._root = ({}, [])
+
+    def add(self, callback):
+        children, callbacks = self._root
+        for char in callback.topic_prefix:
+            node = children.get(char)
+            if node is None:
+                node = ({}, [])
+                children[char] = node
+            children, callbacks = node
+        callbacks.append(callback)
+
+    def remove(self, callback):
+        children, callbacks = self._root
+        for char in callback.topic_prefix:
+            children, callbacks = children[char]
+        callbacks.remove(callback)
+
+    def get_candidates(self, topic):
+        """Callbacks which topic prefix is a prefix of passed topic."""
+        children, callbacks = self._root
+        output = list(callbacks)
+        for char in topic:
+            node = children.get(char)
+            if node is None:
+                break
+            children, callbacks = node
+            output.extend(callbacks)
+        return output
+
+
 class EventSystem(object):
     """Encapsulate event handling into an object.
 
@@ -285,11 +354,21 @@ class EventSystem(object):
     so it is possible to create mutltiple independent systems that have their
     topics and callbacks.
 
-
+    Callbacks of a topic are resolved using index of exact topics and prefix
+    tree of wildcard topics. Resolved callbacks are cached per topic until
+    callbacks change.
     """
 
+    # Maximum number of topics with cached callbacks
+    max_cached_topics = 1000
+
     def __init__(self):
         self._registered_callbacks = []
+        self._callback_order = {}
+        self._order_counter = 0
+        self._exact_callbacks = {}
+        self._wildcard_callbacks = _TopicTrie()
+        self._callbacks_by_topic = {}
 
     def add_callback(self, topic, callback):
         """Register callback in event system.
@@ -306,8 +385,46 @@ class EventSystem(object):
 
         callback = EventCallback(topic, callback)
         self._registered_callbacks.append(callback)
+        self._order_counter += 1
+        self._callback_order[callback] = self._order_counter
+        if callback.has_wildcard:
+            self._wildcard_callbacks.add(callback)
+        else:
+            self._exact_callbacks.setdefault(topic, []).append(callback)
+        self._callbacks_by_topic = {}
         return callback
 
+    def _remove_callback(self, callback):
+        self._registered_callbacks.remove(callback)
+        self._callback_order.pop(callback)
+        if callback.has_wildcard:
+            self._wildcard_callbacks.remove(callback)
+        else:
+            callbacks = self._exact_callbacks[callback.topic]
+            callbacks.remove(callback)
+            if not callbacks:
+                self._exact_callbacks.pop(callback.topic)
+        self._callbacks_by_topic = {}
+
+    def _get_topic_callbacks(self, topic):
+        """Callbacks matching topic in order of registration."""
+        callbacks = self._callbacks_by_topic.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        callbacks = list(self._exact_callbacks.get(topic, []))
+        callbacks.extend(
+            callback
+            for callback in self._wildcard_callbacks.get_candidates(topic)
+            if callback.topic_matches(topic)
+        )
+        callbacks.sort(key=self._callback_order.__getitem__)
+
+        if len(self._callbacks_by_topic) >= self.max_cached_topics:
+            self._callbacks_by_topic = {}
+        self._callbacks_by_topic[topic] = callbacks
+        return callbacks
+
     def create_event(self, topic, data, source):
         """Create new event which is bound to event system.
 
@@ -348,13 +465,15 @@ class EventSystem(object):
         """
 
         invalid_callbacks = []
-        for callback in self._registered_callbacks:
-            callback.process_event(event)
+        for callback in self._get_topic_callbacks(event.topic):
+            callback.process_matched_event(event)
             if not callback.is_ref_valid:
                 invalid_callbacks.append(callback)
 
         for callback in invalid_callbacks:
-            self._registered_callbacks.remove(callback)
+            # Callback could be removed by nested event
+            if callback in self._callback_order:
+                self._remove_callback(callback)
 
 
 class GlobalEventSystem:
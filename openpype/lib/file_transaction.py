@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import errno
+import threading
 import six
 
 from openpype.lib import create_hard_link
@@ -12,6 +13,118 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+try:
+    from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+except ImportError:
+    # Python 2 hosts without 'futures' backport can transfer only serially
+    ThreadPoolExecutor = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Linux ioctl request to clone file content (copy-on-write)
+FICLONE = 0x40049409
+# Errors meaning that the copy method is not supported for the files
+_UNSUPPORTED_COPY_ERRNOS = {
+    getattr(errno, name)
+    for name in (
+        "EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP", "ENOTSUP",
+        "ENOTTY", "EBADF", "EPERM"
+    )
+    if hasattr(errno, name)
+}
+
+
+def _reflink_file(src_file, dst_file):
+    """Clone file content using copy-on-write reflink (Linux only).
+
+    Returns:
+        bool: File content was cloned.
+    """
+
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    except (IOError, OSError) as exc:
+        if exc.errno in _UNSUPPORTED_COPY_ERRNOS:
+            return False
+        raise
+    return True
+
+
+def _kernel_copy_file(src_file, dst_file, size):
+    """Copy file content in kernel using 'copy_file_range' or 'sendfile'.
+
+    The 'copy_file_range' can also use server side copy on network
+    filesystems (e.g. NFS 4.2).
+
+    Returns:
+        bool: File content was copied.
+    """
+
+    src_fd = src_file.fileno()
+    dst_fd = dst_file.fileno()
+    for func_name in ("copy_file_range", "sendfile"):
+        func = getattr(os, func_name, None)
+        if func is None:
+            continue
+
+        copied = 0
+        try:
+            while copied < size:
+                if func_name == "sendfile":
+                    sent = func(dst_fd, src_fd, copied, size - copied)
+                else:
+                    sent = func(
+                        src_fd, dst_fd, size - copied, copied, copied
+                    )
+                if sent == 0:
+                    break
+                copied += sent
+
+        except OSError as exc:
+            # Try other method only if nothing was copied yet
+            if copied == 0 and exc.errno in _UNSUPPORTED_COPY_ERRNOS:
+                continue
+            raise
+
+        if copied == size:
+            return True
+        # Source file changed during copy, let fallback copy handle it
+        return False
+    return False
+
+
+def fast_copyfile(src, dst):
+    """Copy file content using the fastest available method.
+
+    On Linux is tried reflink (copy-on-write clone), then kernel side copy
+    ('copy_file_range' or 'sendfile') and regular copy is used as fallback.
+    On Windows is used 'speedcopy' which does server side copy if possible.
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path.
+    """
+
+    if not sys.platform.startswith("linux"):
+        copyfile(src, dst)
+        return
+
+    with open(src, "rb") as src_file:
+        size = os.fstat(src_file.fileno()).st_size
+        with open(dst, "wb") as dst_file:
+            if size == 0:
+                return
+            if _reflink_file(src_file, dst_file):
+                return
+            if _kernel_copy_file(src_file, dst_file, size):
+                return
+    copyfile(src, dst)
+
 
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
@@ -49,17 +162,33 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for transfer messages.
+        allow_queue_replacements (Optional[bool]): Allow to replace source
+            of already queued destination.
+        max_workers (Optional[int]): Number of files processed in parallel.
+            Files are processed serially if set to 1 (default).
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self, log=None, allow_queue_replacements=False, max_workers=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if not max_workers or ThreadPoolExecutor is None:
+            max_workers = 1
+        self._max_workers = max(1, int(max_workers))
+        self._lock = threading.Lock()
+        # Folders which were already created or validated during transfer
+        self._created_dirs = set()
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -110,40 +239,78 @@ class FileTransaction(object):
         self._transfers[dst] = (src, opts)
 
     def process(self):
-        # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
-            self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
-                continue
+        transfers = list(self._transfers.items())
 
-            # Backup original file
-            # todo: add timestamp or uuid to ensure unique
-            backup = dst + ".bak"
-            self._backup_to_original[backup] = dst
-            self.log.debug(
-                "Backup existing file: {} -> {}".format(dst, backup))
-            os.rename(dst, backup)
+        # Backup any existing files
+        same_paths = self._map(self._backup_file, transfers)
 
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
-                continue
+        self._map(
+            self._transfer_file,
+            [
+                transfer
+                for transfer, path_same in zip(transfers, same_paths)
+                if not path_same
+            ]
+        )
+
+    def _map(self, func, transfers):
+        """Call function for each transfer and return results in order.
+
+        Transfers are processed in a thread pool if more than one worker is
+        allowed. When any transfer fails the remaining transfers are not
+        started, the running transfers are finished and the first error is
+        raised so rollback knows about all changes made on disk.
+        """
+
+        if self._max_workers == 1 or len(transfers) < 2:
+            return [func(dst, src_opts) for dst, src_opts in transfers]
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(func, dst, src_opts)
+                for dst, src_opts in transfers
+            ]
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+
+        for future in futures:
+            if not future.cancelled() and future.exception() is not None:
+                # Re-raise the error with its traceback
+                future.result()
+        return [future.result() for future in futures]
+
+    def _backup_file(self, dst, src_opts):
+        src, _ = src_opts
+        self.log.debug("Checking file ... {} -> {}".format(src, dst))
+        path_same = self._same_paths(src, dst)
+        if path_same or not os.path.exists(dst):
+            return path_same
+
+        # Backup original file
+        # todo: add timestamp or uuid to ensure unique
+        backup = dst + ".bak"
+        self.log.debug(
+            "Backup existing file: {} -> {}".format(dst, backup))
+        os.rename(dst, backup)
+        with self._lock:
+            self._backup_to_original[backup] = dst
+        return path_same
 
-            self._create_folder_for_file(dst)
+    def _transfer_file(self, dst, src_opts):
+        src, opts = src_opts
+        self._create_folder_for_file(dst)
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            fast_copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
 
+        with self._lock:
             self._transferred.append(dst)
 
     def finalize(self):
@@ -197,6 +364,9 @@ class FileTransaction(object):
 
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
+        if dirname in self._created_dirs:
+            return
+
         try:
             os.makedirs(dirname)
         except OSError as e:
@@ -206,9 +376,14 @@ class FileTransaction(object):
                 self.log.critical("An unexpected error occurred.")
                 six.reraise(*sys.exc_info())
 
+        with self._lock:
+            self._created_dirs.add(dirname)
+
     def _same_paths(self, src, dst):
         # handles same paths but with C:/project vs c:/project
-        if os.path.exists(src) and os.path.exists(dst):
-            return os.stat(src) == os.stat(dst)
-
-        return src == dst
+        try:
+            src_stat = os.stat(src)
+            dst_stat = os.stat(dst)
+        except OSError:
+            return src == dst
+        return src_stat == dst_stat
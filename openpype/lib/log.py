@@ -12,6 +12,7 @@ Best place for it is in ``repos/pype-config/environments/global.json``
 """
 
 
+import atexit
 import datetime
 import getpass
 import logging
@@ -24,6 +25,11 @@ import traceback
 import threading
 import copy
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
 from openpype import AYON_SERVER_ENABLED
 from openpype.client.mongo import (
     MongoEnvNotSet,
@@ -182,6 +188,185 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class BufferedMongoHandler(logging.Handler):
+    """Log handler writing records to mongo collection in batches.
+
+    Records are formatted to documents on the calling thread and are put to
+    a bounded queue. Background thread writes them using 'insert_many', so
+    logging never waits for the database. Records are dropped when the queue
+    is full and their count is available in 'get_stats'.
+
+    Flush waits at most 'FLUSH_TIMEOUT' seconds and does nothing after
+    the handler is closed, so even unavailable database does not block
+    the process exit.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection for records.
+        max_queue_size (Optional[int]): Maximum number of waiting records.
+        batch_size (Optional[int]): Maximum number of records in one write.
+        flush_interval (Optional[float]): Maximum time in seconds for which
+            are records waiting for write.
+    """
+
+    MAX_QUEUE_SIZE = 10000
+    BATCH_SIZE = 200
+    FLUSH_INTERVAL = 1.0
+    # Default time in seconds for which flush waits
+    FLUSH_TIMEOUT = 5.0
+    # Time in seconds for which flush on close waits
+    EXIT_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        collection,
+        max_queue_size=None,
+        batch_size=None,
+        flush_interval=None
+    ):
+        super(BufferedMongoHandler, self).__init__()
+        if max_queue_size is None:
+            max_queue_size = self.MAX_QUEUE_SIZE
+        if batch_size is None:
+            batch_size = self.BATCH_SIZE
+        if flush_interval is None:
+            flush_interval = self.FLUSH_INTERVAL
+
+        self._collection = collection
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue = queue.Queue(max_queue_size)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._closed = False
+        self._stats = {
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+
+    def get_stats(self):
+        """Counters of written, dropped and failed records.
+
+        Returns:
+            dict[str, int]: Counters and number of waiting records.
+        """
+
+        stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def emit(self, record):
+        if self._closed:
+            return
+
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        try:
+            self._queue.put_nowait(document)
+        except queue.Full:
+            self._stats["dropped"] += 1
+            return
+        self._ensure_thread()
+
+    def flush(self, timeout=None):
+        """Wait until records queued before the call are written.
+
+        Does nothing when handler is closed.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds.
+                'FLUSH_TIMEOUT' is used if not passed.
+        """
+
+        if self._closed:
+            return
+        if timeout is None:
+            timeout = self.FLUSH_TIMEOUT
+        self._flush(timeout)
+
+    def close(self):
+        if not self._closed:
+            # Mark as closed first so other flushes don't wait
+            self._closed = True
+            self._flush(self.EXIT_TIMEOUT)
+        super(BufferedMongoHandler, self).close()
+
+    def _flush(self, timeout):
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+
+        deadline = time.time() + timeout
+        event = threading.Event()
+        try:
+            self._queue.put(event, timeout=timeout)
+        except queue.Full:
+            return
+        event.wait(max(0, deadline - time.time()))
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._worker, name="BufferedMongoHandler"
+            )
+            thread.daemon = True
+            thread.start()
+            self._thread = thread
+
+    def _worker(self):
+        while True:
+            documents = []
+            events = []
+            item = self._queue.get()
+            deadline = time.time() + self._flush_interval
+            while True:
+                if isinstance(item, threading.Event):
+                    events.append(item)
+                    break
+
+                documents.append(item)
+                if len(documents) >= self._batch_size:
+                    break
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if documents:
+                self._write(documents)
+
+            for event in events:
+                event.set()
+
+    def _write(self, documents):
+        try:
+            self._collection.insert_many(documents, ordered=False)
+            self._stats["written"] += len(documents)
+            self._stats["batches"] += 1
+
+        except Exception:
+            self._stats["failed"] += len(documents)
+            sys.stderr.write(
+                "Failed to write {} log records to mongo\n{}".format(
+                    len(documents), traceback.format_exc()
+                )
+            )
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -220,6 +405,9 @@ class Logger:
     # Logging level - OPENPYPE_LOG_LEVEL
     log_level = None
 
+    # Mongo handler shared by all loggers
+    _mongo_handler = None
+
     # Data same for all record documents
     process_data = None
     # Cached process name or ability to set different process name
@@ -238,7 +426,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, (BufferedMongoHandler, MongoHandler)):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -285,22 +473,17 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
-
-        return MongoHandler(**kwargs)
+        if cls._mongo_handler is None:
+            client = cls.get_log_mongo_connection()
+            collection = (
+                client[cls.log_database_name][cls.log_collection_name]
+            )
+            handler = BufferedMongoHandler(collection)
+            handler.setFormatter(MongoFormatter())
+            # Write waiting records on process exit
+            atexit.register(handler.close)
+            cls._mongo_handler = handler
+        return cls._mongo_handler
 
     @classmethod
     def _get_console_handler(cls):
@@ -335,8 +518,7 @@ class Logger:
             use_mongo_logging = False
         else:
             use_mongo_logging = (
-                log4mongo is not None
-                and os.environ.get("OPENPYPE_LOG_TO_SERVER") == "1"
+                os.environ.get("OPENPYPE_LOG_TO_SERVER") == "1"
             )
 
         # Set mongo id for process (ONLY ONCE)
@@ -462,9 +644,8 @@ class Logger:
         if not cls.log_database_name:
             raise ValueError("Database name for logs is not set")
 
-        client = log4mongo.handlers._connection
-        if not client:
-            client = cls.get_log_mongo_connection()
+        client = cls.get_log_mongo_connection()
+        if log4mongo is not None and not log4mongo.handlers._connection:
             # Set the client inside log4mongo handlers to not create another
             # mongo db connection.
             log4mongo.handlers._connection = client
@@ -3,6 +3,7 @@ import re
 import copy
 import numbers
 import collections
+import threading
 
 import six
 
@@ -11,6 +12,9 @@ KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
 
+# Maximum number of parsed templates kept in memory
+TEMPLATE_PARTS_CACHE_SIZE = 1024
+
 
 def merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
@@ -80,8 +84,51 @@ class TemplateUnsolved(Exception):
         )
 
 
+class _TemplatePartsCache(object):
+    """Bounded LRU cache of parsed template parts keyed by template string.
+
+    Parsed parts are immutable so they can be shared by all 'StringTemplate'
+    objects created from the same template string.
+
+    Args:
+        max_size (int): Maximum number of cached templates.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, template):
+        with self._lock:
+            parts = self._items.pop(template, None)
+            if parts is not None:
+                self._items[template] = parts
+            return parts
+
+    def set(self, template, parts):
+        with self._lock:
+            self._items.pop(template, None)
+            self._items[template] = parts
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_template_parts_cache = _TemplatePartsCache(TEMPLATE_PARTS_CACHE_SIZE)
+
+
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Template string is parsed only once per process. Parsed parts are cached
+    by template string, so creating multiple objects of the same template
+    is cheap.
+    """
+
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -89,6 +136,23 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        parts = _template_parts_cache.get(template)
+        if parts is None:
+            parts = self.parse_template(template)
+            _template_parts_cache.set(template, parts)
+        self._parts = parts
+
+    @classmethod
+    def parse_template(cls, template):
+        """Parse template string into parts used for formatting.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            tuple[Union[str, FormattingPart, OptionalPart]]: Parsed parts.
+        """
+
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +183,12 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return tuple(cls.find_optional_parts(new_parts))
+
+    @staticmethod
+    def clear_cache():
+        """Clear cache of parsed templates."""
+        _template_parts_cache.clear()
 
     def __str__(self):
         return self.template
@@ -151,6 +220,21 @@ class StringTemplate(object):
             TemplateResult: Filled or partially filled template containing all
                 data needed or missing for filling template.
         """
+        solved_result = self._format_solved(data)
+        if solved_result is not None:
+            return solved_result
+        return self._format_full(data)
+
+    def _format_full(self, data):
+        """Format template and track missing keys and invalid types.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+
+        Returns:
+            TemplateResult: Filled or partially filled template.
+        """
+
         result = TemplatePartResult()
         for part in self._parts:
             if isinstance(part, six.string_types):
@@ -177,6 +261,105 @@ class StringTemplate(object):
             invalid_types
         )
 
+    def _format_solved(self, data):
+        """Format template in case all required keys are available.
+
+        Most of templates are fully solved with passed data. In that case is
+        not needed to track missing keys or invalid types of all parts.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+
+        Returns:
+            Union[TemplateResult, None]: Result of formatting or None if
+                any required key is missing or has invalid type.
+        """
+
+        return self._format_solved_parts(self._parts, data, {})
+
+    def _format_solved_parts(self, parts, data, used_values):
+        output = []
+        for part in parts:
+            if isinstance(part, six.string_types):
+                output.append(part)
+                continue
+
+            value = part.format_solved(data, used_values)
+            if value is None:
+                return None
+            output.append(value)
+
+        clean_used_values = {}
+        for keys, value in used_values.items():
+            subdict = clean_used_values
+            for key in keys[:-1]:
+                if key not in subdict:
+                    subdict[key] = {}
+                subdict = subdict[key]
+            subdict[keys[-1]] = value
+
+        return TemplateResult(
+            "".join(output),
+            self.template,
+            True,
+            clean_used_values,
+            [],
+            {}
+        )
+
+    def format_sequence(self, data, frames, frame_key="frame"):
+        """Format template for each frame of a sequence.
+
+        Parts of template which do not use the frame key are formatted only
+        once. Only parts using the frame key are formatted for each frame.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+            frames (Iterable[Any]): Values of frame key for each output.
+            frame_key (str): Key under which is frame value in template
+                data. Can be used for 'udim' too.
+
+        Returns:
+            list[TemplateResult]: Result for each frame.
+        """
+
+        static_used_values = {}
+        parts = []
+        for part in self._parts:
+            if (
+                isinstance(part, six.string_types)
+                or part.uses_key(frame_key)
+            ):
+                parts.append(part)
+                continue
+
+            value = part.format_solved(data, static_used_values)
+            # Some required key is missing or has invalid type
+            if value is None:
+                parts = None
+                break
+            parts.append(value)
+
+        frame_data = copy.copy(data)
+        output = []
+        for frame in frames:
+            frame_data[frame_key] = frame
+            result = None
+            if parts is not None:
+                result = self._format_solved_parts(
+                    parts, frame_data, dict(static_used_values)
+                )
+            if result is None:
+                result = self._format_full(frame_data)
+            output.append(result)
+        return output
+
+    def format_sequence_strict(self, *args, **kwargs):
+        results = self.format_sequence(*args, **kwargs)
+        for result in results:
+            result.validate()
+        return results
+
     def format_strict(self, *args, **kwargs):
         result = self.format(*args, **kwargs)
         result.validate()
@@ -192,6 +375,11 @@ class StringTemplate(object):
         objected_template = cls(template)
         return objected_template.format_strict(data)
 
+    @classmethod
+    def format_sequence_template(cls, template, data, frames, **kwargs):
+        objected_template = cls(template)
+        return objected_template.format_sequence(data, frames, **kwargs)
+
     @staticmethod
     def find_optional_parts(parts):
         new_parts = []
@@ -370,6 +558,24 @@ class TemplatesDict(object):
         output.strict = strict
         return output
 
+    def format_sequence(self, template, data, frames, frame_key="frame"):
+        """Format single template for each frame of a sequence.
+
+        Args:
+            template (Union[str, StringTemplate]): Template to format.
+            data (dict): Containing keys to be filled into template.
+            frames (Iterable[Any]): Values of frame key for each output.
+            frame_key (str): Key under which is frame value in template
+                data.
+
+        Returns:
+            list[TemplateResult]: Result for each frame.
+        """
+
+        if not isinstance(template, StringTemplate):
+            template = self._create_template_object(template)
+        return template.format_sequence(data, frames, frame_key)
+
 
 class TemplateResult(str):
     """Result of template format with most of information in.
@@ -704,6 +910,27 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        key = template[1:-1]
+        # check if key expects subdictionary keys (e.g. project[name])
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+
+        # Keys under which is used value stored in result (same logic as in
+        #   'TemplatePartResult.split_keys_to_subdicts')
+        used_value_key = existence_check
+        key_padding = list(KEY_PADDING_PATTERN.findall(used_value_key))
+        if key_padding:
+            used_value_key = key_padding[0]
+
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+        self._used_value_keys = tuple(
+            SUB_DICT_PATTERN.findall(used_value_key)
+        )
+
     @property
     def template(self):
         return self._template
@@ -711,19 +938,19 @@ class FormattingPart:
     def __repr__(self):
         return "<Format:{}>".format(self._template)
 
+    def uses_key(self, key):
+        """Part is using passed key of formatting data."""
+        return bool(self._key_subdict) and self._key_subdict[0] == key
+
     def __str__(self):
         return self._template
 
     @staticmethod
     def validate_value_type(value):
         """Check if value can be used for formatting of single key."""
-        if isinstance(value, (numbers.Number, FormatObject)):
-            return True
-
-        for inh_class in type(value).mro():
-            if inh_class in six.string_types:
-                return True
-        return False
+        return isinstance(
+            value, six.string_types + (numbers.Number, FormatObject)
+        )
 
     def format(self, data, result):
         """Format the formattings string.
@@ -732,17 +959,13 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -805,6 +1028,46 @@ class FormattingPart:
 
         return result
 
+    def format_solved(self, data, used_values):
+        """Format the formatting string only if value is available.
+
+        Args:
+            data (dict): Data that should be used for formatting.
+            used_values (dict): Used values are stored there by tuple of
+                subdictionary keys.
+
+        Returns:
+            Union[str, None]: Formatted value or None if key is missing
+                or value has invalid type.
+        """
+
+        key_subdict = self._key_subdict
+        if not key_subdict or not self._used_value_keys:
+            return None
+
+        value = data
+        for sub_key in key_subdict:
+            if (
+                value is None
+                or not hasattr(value, "items")
+                or sub_key not in value
+            ):
+                return None
+            value = value.get(sub_key)
+
+        if not self.validate_value_type(value):
+            return None
+
+        fill_data = value
+        for used_key in reversed(key_subdict[1:]):
+            fill_data = {used_key: fill_data}
+
+        formatted_value = self.template.format(
+            **{key_subdict[0]: fill_data}
+        )
+        used_values[self._used_value_keys] = formatted_value
+        return formatted_value
+
 
 class OptionalPart:
     """Template part which contains optional formatting strings.
@@ -817,7 +1080,7 @@ class OptionalPart:
     """
 
     def __init__(self, parts):
-        self._parts = parts
+        self._parts = tuple(parts)
 
     @property
     def parts(self):
@@ -829,6 +1092,16 @@ class OptionalPart:
     def __repr__(self):
         return "<Optional:{}>".format("".join([str(p) for p in self._parts]))
 
+    def uses_key(self, key):
+        """Any of parts is using passed key of formatting data."""
+        for part in self._parts:
+            if (
+                not isinstance(part, six.string_types)
+                and part.uses_key(key)
+            ):
+                return True
+        return False
+
     def format(self, data, result):
         new_result = TemplatePartResult(True)
         for part in self._parts:
@@ -840,3 +1113,30 @@ class OptionalPart:
         if new_result.solved:
             result.add_output(new_result)
         return result
+
+    def format_solved(self, data, used_values):
+        """Format optional part without tracking missing keys.
+
+        Args:
+            data (dict): Data that should be used for formatting.
+            used_values (dict): Used values are stored there by tuple of
+                subdictionary keys.
+
+        Returns:
+            str: Formatted value or empty string if part can't be filled.
+        """
+
+        part_used_values = {}
+        output = []
+        for part in self._parts:
+            if isinstance(part, six.string_types):
+                output.append(part)
+                continue
+
+            value = part.format_solved(data, part_used_values)
+            if value is None:
+                return ""
+            output.append(value)
+
+        used_values.update(part_used_values)
+        return "".join(output)
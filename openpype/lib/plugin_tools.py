@@ -3,9 +3,20 @@
 import os
 import logging
 import re
+import hashlib
+import threading
+import collections
 
 log = logging.getLogger(__name__)
 
+# Size of chunks read from file when content hash is calculated
+CONTENT_HASH_CHUNK_SIZE = 1024 * 1024
+# Maximum number of cached content hashes
+CONTENT_HASH_CACHE_SIZE = 10000
+
+_content_hash_cache = collections.OrderedDict()
+_content_hash_lock = threading.Lock()
+
 
 def prepare_template_data(fill_pairs):
     """
@@ -70,3 +81,54 @@ def source_hash(filepath, *args):
     time = str(os.path.getmtime(filepath))
     size = str(os.path.getsize(filepath))
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
+
+
+def _get_content_hash_obj():
+    # 'blake2b' is not available in Python 2
+    if hasattr(hashlib, "blake2b"):
+        return "blake2b", hashlib.blake2b(digest_size=32)
+    return "sha256", hashlib.sha256()
+
+
+def get_file_content_hash(filepath):
+    """Hash of file content.
+
+    Unlike 'source_hash' the hash does not depend on file name or location,
+    so identical files have the same hash. File is read in chunks so memory
+    usage does not depend on file size.
+
+    Hash is cached per process by file identity (device, inode, modification
+    time and size) so the same file is read only once.
+
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        str: Hash with used algorithm as prefix e.g. 'blake2b:<hexdigest>'.
+    """
+
+    stat = os.stat(filepath)
+    cache_key = (stat.st_dev, stat.st_ino, stat.st_mtime, stat.st_size)
+    # Inode is not available on some platforms
+    if not stat.st_ino:
+        cache_key += (os.path.normcase(os.path.abspath(filepath)), )
+
+    with _content_hash_lock:
+        content_hash = _content_hash_cache.get(cache_key)
+    if content_hash is not None:
+        return content_hash
+
+    algorithm, hash_obj = _get_content_hash_obj()
+    with open(filepath, "rb") as stream:
+        while True:
+            chunk = stream.read(CONTENT_HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            hash_obj.update(chunk)
+    content_hash = "{}:{}".format(algorithm, hash_obj.hexdigest())
+
+    with _content_hash_lock:
+        _content_hash_cache[cache_key] = content_hash
+        while len(_content_hash_cache) > CONTENT_HASH_CACHE_SIZE:
+            _content_hash_cache.popitem(last=False)
+    return content_hash
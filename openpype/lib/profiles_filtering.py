@@ -1,8 +1,17 @@
 import re
 import logging
+import threading
+import collections
 
 log = logging.getLogger(__name__)
 
+# Patterns matching only themselves, compared as strings
+_LITERAL_PATTERN_REGEX = re.compile(r"^[\w\- ]+$")
+# Maximum number of cached compiled profiles
+MAX_COMPILED_PROFILES = 256
+# Maximum number of cached matches of values per compiled profiles
+MAX_CACHED_MATCHES = 10000
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -116,6 +125,290 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+class _ProfilesKeyIndex(object):
+    """Index of profiles by values of one key.
+
+    Profiles are split to profiles matching any value (key is not set,
+    is empty or contains "*"), profiles indexed by literal values and
+    profiles with regex patterns which must be checked.
+
+    Args:
+        profiles (list[dict]): Profile definitions.
+        key (str): Key of profile.
+    """
+
+    def __init__(self, profiles, key):
+        self.any_matching = set()
+        self._by_value = collections.defaultdict(set)
+        self._regexes = []
+        for idx, profile in enumerate(profiles):
+            in_list = profile.get(key)
+            if not in_list:
+                self.any_matching.add(idx)
+                continue
+
+            if not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if "*" in in_list:
+                self.any_matching.add(idx)
+                continue
+
+            regexes = []
+            for item in in_list:
+                if not item:
+                    continue
+                try:
+                    regex = re.compile(item)
+                except TypeError:
+                    print((
+                        "Invalid type \"{}\" value \"{}\"."
+                        " Expected string based object. Skipping."
+                    ).format(str(type(item)), str(item)))
+                    continue
+
+                if _LITERAL_PATTERN_REGEX.match(item):
+                    self._by_value[item].add(idx)
+                else:
+                    regexes.append(regex)
+
+            if regexes:
+                self._regexes.append((idx, regexes))
+
+    def get_matching(self, value):
+        """Indexes of profiles matching value.
+
+        Args:
+            value (str): Value of key.
+
+        Returns:
+            tuple[set[int], set[int]]: Indexes of profiles matching any value
+                and indexes of profiles matching the value explicitly.
+        """
+        if not value:
+            return self.any_matching, set()
+
+        matching = set(self._by_value.get(value, ()))
+        for idx, regexes in self._regexes:
+            if idx in matching:
+                continue
+            for regex in regexes:
+                if hasattr(regex, "fullmatch"):
+                    result = regex.fullmatch(value)
+                else:
+                    result = fullmatch(regex, value)
+                if result:
+                    matching.add(idx)
+                    break
+        return self.any_matching, matching
+
+
+class CompiledProfiles(object):
+    """Profiles prepared for repeated filtering.
+
+    Patterns of profiles are compiled once and profiles are indexed by
+    values of filtered keys, so filtering does not validate every profile
+    with every query. Result is the same as result of 'filter_profiles'.
+
+    Profiles must not be modified after the object is created.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+    """
+
+    def __init__(self, profiles_data):
+        self._profiles = list(profiles_data or [])
+        self._indexes = {}
+        self._matches_cache = {}
+        self._lock = threading.Lock()
+
+    @property
+    def profiles(self):
+        return self._profiles
+
+    def _get_key_index(self, key):
+        key_index = self._indexes.get(key)
+        if key_index is None:
+            key_index = _ProfilesKeyIndex(self._profiles, key)
+            self._indexes[key] = key_index
+        return key_index
+
+    def _get_matching(self, key, value):
+        cache_key = (key, value)
+        matching = self._matches_cache.get(cache_key)
+        if matching is None:
+            with self._lock:
+                matching = self._get_key_index(key).get_matching(value)
+                if len(self._matches_cache) >= MAX_CACHED_MATCHES:
+                    self._matches_cache.clear()
+                self._matches_cache[cache_key] = matching
+        return matching
+
+    def filter(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if
+                is available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+        if not self._profiles:
+            return None
+
+        try:
+            for value in key_values.values():
+                hash(value)
+        except TypeError:
+            # Unhashable values can't be indexed
+            return _filter_profiles(
+                self._profiles, key_values, keys_order, logger
+            )
+
+        if not logger:
+            logger = log
+
+        keys_order = _prepare_keys_order(key_values, keys_order)
+        log_parts = " | ".join([
+            "{}: \"{}\"".format(*item)
+            for item in key_values.items()
+        ])
+        logger.debug(
+            "Looking for matching profile for: {}".format(log_parts)
+        )
+
+        candidates = None
+        explicit_matches = []
+        for key in keys_order:
+            any_matching, matching = self._get_matching(key, key_values[key])
+            explicit_matches.append(matching)
+            if candidates is None:
+                candidates = any_matching | matching
+            else:
+                candidates &= any_matching | matching
+            if not candidates:
+                break
+
+        if candidates is None:
+            candidates = set(range(len(self._profiles)))
+
+        matching_profiles = None
+        highest_profile_points = -1
+        for idx in sorted(candidates):
+            profile_scores = [
+                idx in matching
+                for matching in explicit_matches
+            ]
+            profile_points = sum(profile_scores)
+            if profile_points < highest_profile_points:
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            matching_profiles.append((self._profiles[idx], profile_scores))
+
+        return _select_profile(matching_profiles, log_parts, logger)
+
+
+class _CompiledProfilesCache(object):
+    """Compiled profiles of recently filtered profile lists.
+
+    Lists are identified by id. Reference to list is kept so the id is not
+    reused while cached and ids of profiles are compared to detect
+    replaced profiles. Content of profiles is not compared, so changes of
+    profile dictionaries in place are not detected.
+    """
+
+    def __init__(self):
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, profiles_data):
+        key = id(profiles_data)
+        profile_ids = tuple(id(profile) for profile in profiles_data)
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                cached_data, cached_ids, compiled = item
+                if cached_data is profiles_data and cached_ids == profile_ids:
+                    # Move to end as most recently used
+                    self._items[key] = self._items.pop(key)
+                    return compiled
+
+            compiled = CompiledProfiles(profiles_data)
+            self._items.pop(key, None)
+            self._items[key] = (profiles_data, profile_ids, compiled)
+            while len(self._items) > MAX_COMPILED_PROFILES:
+                self._items.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_compiled_profiles_cache = _CompiledProfilesCache()
+
+
+def get_compiled_profiles(profiles_data):
+    """Compiled profiles of profiles list.
+
+    Compiled profiles are cached for recently used lists of profiles, e.g.
+    profiles from settings used by publish plugins.
+
+    Cached compiled profiles are used while the list contains the same
+    profile objects. Profile dictionaries must not be modified in place,
+    pass new list or new profile dictionaries instead.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+
+    Returns:
+        CompiledProfiles: Compiled profiles.
+    """
+    return _compiled_profiles_cache.get(profiles_data)
+
+
+def _prepare_keys_order(key_values, keys_order):
+    if not keys_order:
+        return tuple(key_values.keys())
+
+    _keys_order = list(keys_order)
+    # Make all keys from `key_values` are passed
+    for key in key_values.keys():
+        if key not in _keys_order:
+            _keys_order.append(key)
+    return tuple(_keys_order)
+
+
+def _select_profile(matching_profiles, log_parts, logger):
+    if not matching_profiles:
+        logger.debug(
+            "None of profiles match your setup. {}".format(log_parts)
+        )
+        return None
+
+    if len(matching_profiles) > 1:
+        logger.debug(
+            "More than one profile match your setup. {}".format(log_parts)
+        )
+
+    profile = _profile_exclusion(matching_profiles, logger)
+    if profile:
+        logger.debug(
+            "Profile selected: {}".format(profile)
+        )
+    return profile
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -134,6 +427,11 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     profiles with same score then first in order is used (order of profiles
     matter).
 
+    Profiles passed as list are compiled once and the compiled profiles are
+    reused for the same list object with the same profile objects. Profile
+    dictionaries of the list must not be modified in place between calls,
+    otherwise result may be based on their previous content.
+
     Args:
         profiles_data (list): Profile definitions as dictionaries.
         key_values (dict): Mapping of Key <-> Value. Key is checked if is
@@ -149,18 +447,26 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
+    if not isinstance(profiles_data, list):
+        return _filter_profiles(profiles_data, key_values, keys_order, logger)
+
+    return get_compiled_profiles(profiles_data).filter(
+        key_values, keys_order, logger
+    )
+
+
+def _filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
+    """Filter profiles validating each profile.
+
+    Used when values can't be used with 'CompiledProfiles'.
+    """
+    if not profiles_data:
+        return None
+
     if not logger:
         logger = log
 
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
+    keys_order = _prepare_keys_order(key_values, keys_order)
 
     log_parts = " | ".join([
         "{}: \"{}\"".format(*item)
@@ -208,20 +514,4 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
         if profile_points == highest_profile_points:
             matching_profiles.append((profile, profile_scores))
 
-    if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.debug(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
-        logger.debug(
-            "Profile selected: {}".format(profile)
-        )
-    return profile
+    return _select_profile(matching_profiles, log_parts, logger)
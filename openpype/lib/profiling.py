@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """Provide profiling decorator."""
 import os
+import sys
 import cProfile
+import contextlib
 
 
 def do_profile(fn, to_file=None):
@@ -27,3 +29,21 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+@contextlib.contextmanager
+def startup_phase(name):
+    """Measure a startup phase when startup profiling is enabled.
+
+    Startup profiler is started by `start.py` (see
+    `igniter.startup_profiler`). Does nothing if profiler is not running.
+
+    Args:
+        name (str): Name of the phase.
+    """
+    startup_profiler = sys.modules.get("igniter.startup_profiler")
+    if startup_profiler is None:
+        yield
+    else:
+        with startup_profiler.phase(name):
+            yield
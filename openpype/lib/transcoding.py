@@ -4,11 +4,24 @@ import logging
 import json
 import collections
 import tempfile
+import uuid
+import shutil
+import hashlib
 import subprocess
 import platform
+import multiprocessing
 
 import xml.etree.ElementTree
 
+import appdirs
+import clique
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 hosts without 'futures' backport convert serially
+    ThreadPoolExecutor = None
+
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
@@ -18,6 +31,15 @@ from .vendor_bin_utils import (
 
 # Max length of string that is supported by ffmpeg
 MAX_FFMPEG_STRING_LEN = 8196
+# Maximum number of parallel oiiotool processes if not defined
+#   by environment variable 'OPENPYPE_TRANSCODING_WORKERS'
+MAX_TRANSCODING_WORKERS = 16
+# Number of frame chunks per worker, more chunks balance load between
+#   workers, less chunks avoid overhead of process start
+CHUNKS_PER_WORKER = 4
+# Default maximum size of conversion cache in GB if not defined
+#   by environment variable 'OPENPYPE_CONVERSION_CACHE_MAX_SIZE'
+CONVERSION_CACHE_MAX_SIZE = 50
 # Not allowed symbols in attributes for ffmpeg
 NOT_ALLOWED_FFMPEG_CHARS = ("\"", )
 
@@ -584,7 +606,8 @@ def convert_for_ffmpeg(
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -603,10 +626,13 @@ def convert_input_paths_for_ffmpeg(
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of parallel oiiotool
+            processes. Contiguous frames are converted by one process.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
             Currently is supported only ".exr" extension.
+        RuntimeError: If conversion of any frame failed.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
@@ -653,55 +679,73 @@ def convert_input_paths_for_ffmpeg(
         # - this option is crashing if used on multipart exrs
         input_arg += ":ch={}".format(input_channels_str)
 
-    for input_path in input_paths:
+    # Arguments after input are same for all frames
+    conversion_args = [
+        # Tell oiiotool which channels should be put to top stack
+        #   (and output)
+        "--ch", channels_arg,
+        # Use first subimage
+        "--subimage", "0"
+    ]
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing unallowed symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            conversion_args.extend(["--eraseattrib", attr_name])
+
+    max_workers = get_transcoding_max_workers(max_workers)
+    chunks = _split_paths_to_frame_chunks(
+        input_paths, max_workers * CHUNKS_PER_WORKER
+    )
+    threads_args = []
+    if max_workers > 1:
+        # Don't let each oiiotool process use all cores
+        threads = max(1, multiprocessing.cpu_count() // max_workers)
+        threads_args = ["--threads", str(threads)]
+
+    commands = []
+    for label, input_path, frame_range in chunks:
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
             "oiiotool",
             # Don't add any additional attributes
             "--nosoftwareattrib",
         )
+        oiio_cmd.extend(threads_args)
+        # Process frame range in one process
+        if frame_range is not None:
+            oiio_cmd.extend(["--frames", frame_range])
+
         # Add input compression if available
         if compression:
             oiio_cmd.extend(["--compression", compression])
 
-        oiio_cmd.extend([
-            input_arg, input_path,
-            # Tell oiiotool which channels should be put to top stack
-            #   (and output)
-            "--ch", channels_arg,
-            # Use first subimage
-            "--subimage", "0"
-        ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing unallowed symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend([input_arg, input_path])
+        oiio_cmd.extend(conversion_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -709,9 +753,347 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        commands.append((label, oiio_cmd))
+
+    run_oiio_commands(commands, max_workers, logger=logger)
+
+
+def get_transcoding_max_workers(max_workers=None):
+    """Number of oiiotool processes which can run in parallel.
+
+    Value can be defined with 'OPENPYPE_TRANSCODING_WORKERS' environment
+    variable, otherwise is based on cpu count.
+
+    Args:
+        max_workers (Optional[int]): Explicitly requested number of workers.
+
+    Returns:
+        int: Number of workers.
+    """
+    if not max_workers:
+        max_workers = os.getenv("OPENPYPE_TRANSCODING_WORKERS")
+    if max_workers:
+        return max(1, int(max_workers))
+    return max(1, min(multiprocessing.cpu_count(), MAX_TRANSCODING_WORKERS))
+
+
+def _split_paths_to_frame_chunks(input_paths, chunks_count):
+    """Group paths of frames to contiguous frame ranges.
+
+    Frame ranges are split to chunks which can be converted by single
+    oiiotool process using its frame range syntax.
+
+    Args:
+        input_paths (list[str]): Input paths.
+        chunks_count (int): Expected number of chunks to balance work.
+
+    Returns:
+        list[tuple[str, str, Union[str, None]]]: Label, input path and frame
+            range. Input path contains '%0Nd' frame wildcard if frame range
+            is filled.
+    """
+    sequences, remainders = clique.assemble(
+        input_paths,
+        patterns=[clique.PATTERNS["frames"]],
+        minimum_items=2,
+        assume_padded_when_ambiguous=True
+    )
+    output = [
+        (os.path.basename(path), path, None)
+        for path in remainders
+    ]
+    ranges = []
+    for collection in sequences:
+        # Paths containing oiiotool wildcard characters can't use frame
+        #   range syntax
+        if any(
+            char in collection.head or char in collection.tail
+            for char in ("%", "#", "@")
+        ):
+            output.extend(
+                (os.path.basename(path), path, None)
+                for path in collection
+            )
+            continue
+        for sub_collection in collection.separate():
+            ranges.append((collection, sorted(sub_collection.indexes)))
+
+    frames_count = sum(len(indexes) for _, indexes in ranges)
+    chunk_size = max(1, -(-frames_count // max(1, chunks_count)))
+    for collection, indexes in ranges:
+        if collection.padding:
+            frame_wildcard = "%0{}d".format(collection.padding)
+        else:
+            frame_wildcard = "%d"
+        input_path = "{}{}{}".format(
+            collection.head, frame_wildcard, collection.tail
+        )
+        for idx in range(0, len(indexes), chunk_size):
+            chunk = indexes[idx:idx + chunk_size]
+            if len(chunk) == 1:
+                path = collection.format("{head}{padding}{tail}") % chunk[0]
+                output.append((os.path.basename(path), path, None))
+                continue
+            frame_range = "{}-{}".format(chunk[0], chunk[-1])
+            label = "{} [{}]".format(
+                os.path.basename(input_path), frame_range
+            )
+            output.append((label, input_path, frame_range))
+    return output
+
+
+class _OutputCollector:
+    """Logger-like object collecting output of a subprocess."""
+
+    def __init__(self):
+        self.lines = []
+
+    def debug(self, msg, *args, **kwargs):
+        self.lines.append(msg)
+
+    info = debug
+    warning = debug
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+
+def run_oiio_commands(commands, max_workers=None, logger=None):
+    """Run oiiotool commands in parallel.
+
+    Output of each command is logged at once when it finishes, so outputs
+    of parallel processes are not mixed. All commands run even if some
+    fail and errors are raised together at the end.
+
+    Args:
+        commands (list[tuple[str, list[str]]]): Label used in logs and
+            command arguments.
+        max_workers (Optional[int]): Maximum number of parallel processes.
+        logger (Optional[logging.Logger]): Logger used for logging.
+
+    Raises:
+        RuntimeError: When any of commands failed. Message contains labels
+            and errors of failed commands.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    def _run(command):
+        label, oiio_cmd = command
+        collector = _OutputCollector()
+        run_subprocess(oiio_cmd, logger=collector)
+        return collector.lines
+
+    def _log_command(label, oiio_cmd):
+        logger.debug("Conversion command ({}): {}".format(
+            label, " ".join(oiio_cmd)
+        ))
+
+    max_workers = min(get_transcoding_max_workers(max_workers), len(commands))
+    failed = []
+    if max_workers < 2 or ThreadPoolExecutor is None:
+        for label, oiio_cmd in commands:
+            _log_command(label, oiio_cmd)
+            try:
+                run_subprocess(oiio_cmd, logger=logger)
+            except RuntimeError as exc:
+                failed.append((label, exc))
+
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for command in commands:
+                _log_command(*command)
+                futures.append(executor.submit(_run, command))
+
+            for (label, _), future in zip(commands, futures):
+                try:
+                    lines = future.result()
+                except RuntimeError as exc:
+                    failed.append((label, exc))
+                    continue
+                if lines:
+                    logger.debug("Output of {}:\n{}".format(
+                        label, "\n".join(lines)
+                    ))
+
+    if failed:
+        for label, exc in failed:
+            logger.error("Conversion of {} failed: {}".format(label, exc))
+        raise RuntimeError("Conversion failed for: {}".format(
+            ", ".join(label for label, _ in failed)
+        ))
+
+
+def get_conversion_cache_dir():
+    """Directory of local cache of converted files.
+
+    Can be changed with 'OPENPYPE_CONVERSION_CACHE_DIR' environment variable.
+
+    Returns:
+        str: Path to directory.
+    """
+    cache_dir = os.getenv("OPENPYPE_CONVERSION_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"), "conversion_cache"
+    )
+
+
+class ConversionCache(object):
+    """Local cache of results of file conversions.
+
+    Converted file is stored under key created from source path and
+    conversion hash. The conversion hash must change when source file or
+    conversion arguments change, e.g. 'openpype.lib.source_hash' of source
+    with converter arguments. Unchanged sources are not converted again
+    across publishes.
+
+    Args:
+        root (Optional[str]): Cache directory. Uses
+            'get_conversion_cache_dir' if not passed.
+        max_size (Optional[float]): Maximum size of cache in GB used
+            by 'prune'.
+    """
+
+    def __init__(self, root=None, max_size=None):
+        if root is None:
+            root = get_conversion_cache_dir()
+        if max_size is None:
+            max_size = float(
+                os.getenv("OPENPYPE_CONVERSION_CACHE_MAX_SIZE")
+                or CONVERSION_CACHE_MAX_SIZE
+            )
+        self._root = root
+        self._max_size = max_size
+
+    @property
+    def root(self):
+        return self._root
+
+    def get_cache_path(self, source, conversion_hash, ext):
+        """Path of cached file.
+
+        Args:
+            source (str): Path to source file.
+            conversion_hash (str): Hash of source and conversion arguments.
+            ext (str): Extension of converted file.
+
+        Returns:
+            str: Path to cached file, file may not exist.
+        """
+        source = os.path.normcase(os.path.abspath(source))
+        key = hashlib.sha1(
+            "{}|{}".format(source, conversion_hash).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self._root, key[:2], key + ext)
+
+    def copy_cached(self, source, conversion_hash, destination):
+        """Copy cached file to destination if is available.
+
+        Args:
+            source (str): Path to source file.
+            conversion_hash (str): Hash of source and conversion arguments.
+            destination (str): Path where converted file is expected.
+
+        Returns:
+            bool: Cached file was copied.
+        """
+        ext = os.path.splitext(destination)[1]
+        cache_path = self.get_cache_path(source, conversion_hash, ext)
+        if not os.path.exists(cache_path):
+            return False
+
+        dirpath = os.path.dirname(destination)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+        shutil.copyfile(cache_path, destination)
+        # Mark cached file as used for 'prune'
+        try:
+            os.utime(cache_path, None)
+        except OSError:
+            pass
+        return True
+
+    def store(self, source, conversion_hash, path):
+        """Store converted file to cache.
+
+        Args:
+            source (str): Path to source file.
+            conversion_hash (str): Hash of source and conversion arguments.
+            path (str): Path to converted file.
+        """
+        ext = os.path.splitext(path)[1]
+        cache_path = self.get_cache_path(source, conversion_hash, ext)
+        dirpath = os.path.dirname(cache_path)
+        if not os.path.exists(dirpath):
+            try:
+                os.makedirs(dirpath)
+            except OSError:
+                # Created by other process
+                if not os.path.isdir(dirpath):
+                    raise
+
+        # Copy to temp file first so other processes never read
+        #   incomplete file
+        tmp_path = "{}.{}.tmp".format(cache_path, uuid.uuid4().hex)
+        shutil.copyfile(path, tmp_path)
+        try:
+            os.replace(tmp_path, cache_path)
+        except AttributeError:
+            # Python 2
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            os.rename(tmp_path, cache_path)
+
+    def convert(self, source, conversion_hash, destination, convert_func):
+        """Create converted file using cache.
+
+        Args:
+            source (str): Path to source file.
+            conversion_hash (str): Hash of source and conversion arguments.
+            destination (str): Path where converted file is expected.
+            convert_func (Callable[[], Any]): Function which converts source
+                to destination. Called only if result is not cached.
+
+        Returns:
+            bool: Cached result was used.
+        """
+        if self.copy_cached(source, conversion_hash, destination):
+            return True
+        convert_func()
+        if os.path.exists(destination):
+            self.store(source, conversion_hash, destination)
+        return False
+
+    def prune(self):
+        """Remove least recently used files over maximum size of cache."""
+        if not os.path.exists(self._root):
+            return
+
+        files = []
+        total_size = 0
+        for root, _, filenames in os.walk(self._root):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                total_size += stat.st_size
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        max_size = self._max_size * (1024 ** 3)
+        if total_size <= max_size:
+            return
+
+        files.sort()
+        for _, size, path in files:
+            if total_size <= max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
 
 
 # FFMPEG functions
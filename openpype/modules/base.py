@@ -5,7 +5,10 @@ import os
 import sys
 import json
 import time
+import hashlib
 import inspect
+import tempfile
+import functools
 import logging
 import platform
 import threading
@@ -38,6 +41,7 @@ from openpype.lib import (
     import_module_from_dirpath,
 )
 from openpype.lib.openpype_version import is_staging_enabled
+from openpype.lib.profiling import startup_phase
 
 from .interfaces import (
     OpenPypeInterface,
@@ -60,6 +64,13 @@ IGNORED_DEFAULT_FILENAMES = (
     "default_modules",
 )
 
+# Path to manifest of modules or "0" to disable usage of the manifest
+# - manifest is invalidated when any python file of modules changes
+MODULES_MANIFEST_ENV_KEY = "OPENPYPE_MODULES_MANIFEST"
+MODULES_MANIFEST_VERSION = 1
+# Number of modules settings variants with stored disabled modules
+MAX_MANIFEST_SETTINGS_VARIANTS = 10
+
 
 # Inherit from `object` for Python 2 hosts
 class _ModuleClass(object):
@@ -77,12 +88,16 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Loaders of modules which are imported on first access
+        super(_ModuleClass, self).__setattr__("__lazy__", dict())
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in self.__lazy__ and self.load_lazy(attr_name):
+                return self.__attributes__[attr_name]
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
                 self.name, attr_name
@@ -93,8 +108,40 @@ class _ModuleClass(object):
         for module in self.values():
             yield module
 
+    def add_lazy(self, attr_name, loader):
+        """Register loader of module imported on first access.
+
+        Args:
+            attr_name (str): Name of module.
+            loader (Callable[[], None]): Function which imports the module
+                and stores it to this object.
+        """
+        self.__lazy__.setdefault(attr_name, []).append(loader)
+
+    def has_lazy(self, attr_name):
+        return attr_name in self.__lazy__
+
+    def load_lazy(self, attr_name):
+        """Import module registered with 'add_lazy'.
+
+        Returns:
+            bool: Module is available.
+        """
+        with _LoadCache.lazy_lock:
+            loaders = self.__lazy__.pop(attr_name, None) or []
+            for loader in loaders:
+                loader()
+        return attr_name in self.__attributes__
+
+    def _load_all_lazy(self):
+        for attr_name in tuple(self.__lazy__.keys()):
+            self.load_lazy(attr_name)
+
     def __setattr__(self, attr_name, value):
-        if attr_name in self.__attributes__:
+        if (
+            attr_name in self.__attributes__
+            and self.__attributes__[attr_name] is not value
+        ):
             self.log.warning(
                 "Duplicated name \"{}\" in {}. Overriding.".format(
                     self.name, attr_name
@@ -117,15 +164,20 @@ class _ModuleClass(object):
         return self._log
 
     def get(self, key, default=None):
+        if key not in self.__attributes__ and key in self.__lazy__:
+            self.load_lazy(key)
         return self.__attributes__.get(key, default)
 
     def keys(self):
+        self._load_all_lazy()
         return self.__attributes__.keys()
 
     def values(self):
+        self._load_all_lazy()
         return self.__attributes__.values()
 
     def items(self):
+        self._load_all_lazy()
         return self.__attributes__.items()
 
 
@@ -161,8 +213,428 @@ class _InterfacesClass(_ModuleClass):
 class _LoadCache:
     interfaces_lock = threading.Lock()
     modules_lock = threading.Lock()
+    lazy_lock = threading.RLock()
     interfaces_loaded = False
     modules_loaded = False
+    manifest = None
+
+
+class _LazyModulesFinder(object):
+    """Import hook for modules which were not imported yet.
+
+    Modules are stored to 'sys.modules' under '<modules key>.<name>' when
+    are imported. Lazy loaded modules are imported by this finder when
+    are imported with import statement, e.g.
+    'from openpype_modules.ftrack import FTRACK_MODULE_DIR'.
+    """
+
+    def __init__(self, modules_key):
+        self._modules_key = modules_key
+        self._modules = {}
+        self._specs = {}
+
+    def _load(self, fullname):
+        parts = fullname.split(".")
+        if len(parts) != 2 or parts[0] != self._modules_key:
+            return None
+
+        parent = sys.modules.get(self._modules_key)
+        if (
+            not isinstance(parent, _ModuleClass)
+            or not parent.has_lazy(parts[1])
+        ):
+            return None
+        parent.load_lazy(parts[1])
+        return sys.modules.get(fullname)
+
+    def find_spec(self, fullname, path=None, target=None):
+        module = self._load(fullname)
+        if module is None:
+            return None
+
+        import importlib.util
+
+        # Import system would use spec of module from 'sys.modules' and
+        #   execute the module again
+        self._modules[fullname] = sys.modules.pop(fullname)
+        self._specs[id(module)] = getattr(module, "__spec__", None)
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        return self._modules.pop(spec.name)
+
+    def exec_module(self, module):
+        # Module is already imported, only restore spec changed by import
+        module.__spec__ = self._specs.pop(id(module), None)
+
+    # Python 2 import hook
+    def find_module(self, fullname, path=None):
+        if self._load(fullname) is None:
+            return None
+        return self
+
+    def load_module(self, fullname):
+        return sys.modules[fullname]
+
+
+def _install_lazy_modules_finder(modules_key):
+    for finder in sys.meta_path:
+        if isinstance(finder, _LazyModulesFinder):
+            return
+    sys.meta_path.append(_LazyModulesFinder(modules_key))
+
+
+class _ModulesManifest(object):
+    """Cached information about modules classes.
+
+    Manifest stores names of module classes available in each imported
+    python module so modules don't have to be imported to find them. It
+    also stores which module classes are disabled for modules settings
+    so they don't have to be imported at all.
+
+    Manifest is valid only for fingerprint of modules directories
+    (OpenPype version, paths and modification times).
+
+    Args:
+        path (str): Path to manifest file.
+        fingerprint (str): Fingerprint of modules directories.
+        modules (list[list]): Names of python modules with names of module
+            classes and their names.
+        disabled (list[list]): Pairs of modules settings hash and ids of
+            disabled module classes.
+        failed (list[str]): Names of python modules which failed to import.
+        settings_defs (list[list]): Names of python modules with names of
+            settings definition classes.
+    """
+
+    def __init__(
+        self,
+        path,
+        fingerprint,
+        modules=None,
+        disabled=None,
+        failed=None,
+        settings_defs=None
+    ):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.modules = modules or []
+        self.failed = failed or []
+        self.settings_defs = settings_defs or []
+        self._disabled = collections.OrderedDict(disabled or [])
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        """Load manifest from file.
+
+        Returns:
+            Union[_ModulesManifest, None]: Manifest or None if file does not
+                exist or is not valid for the fingerprint.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as stream:
+                data = json.load(stream)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if (
+            data.get("version") != MODULES_MANIFEST_VERSION
+            or data.get("fingerprint") != fingerprint
+        ):
+            return None
+        return cls(
+            path,
+            fingerprint,
+            data["modules"],
+            data["disabled"],
+            data["failed"],
+            data["settings_defs"]
+        )
+
+    @classmethod
+    def create(cls, path, fingerprint, openpype_modules, failed):
+        """Create manifest from imported modules.
+
+        Args:
+            path (str): Path to manifest file.
+            fingerprint (str): Fingerprint of modules directories.
+            openpype_modules (_ModuleClass): Imported modules.
+            failed (list[str]): Names of python modules which failed to
+                import.
+        """
+        manifest = cls(path, fingerprint, failed=failed)
+        manifest.add_modules(openpype_modules)
+        return manifest
+
+    def add_modules(self, openpype_modules, module_names=None):
+        """Add imported modules to manifest.
+
+        Args:
+            openpype_modules (_ModuleClass): Imported modules.
+            module_names (Optional[Iterable[str]]): Names of python modules
+                to add. All modules are added if not passed.
+        """
+        self.modules.extend(
+            self.get_modules_data(openpype_modules, module_names)
+        )
+        self.settings_defs.extend(
+            self.get_settings_defs_data(openpype_modules, module_names)
+        )
+        if module_names is not None:
+            self.failed = [
+                name
+                for name in self.failed
+                if name not in module_names
+            ]
+
+    @staticmethod
+    def get_modules_data(openpype_modules, module_names=None):
+        """Prepare manifest data of imported modules.
+
+        Args:
+            openpype_modules (_ModuleClass): Imported modules.
+            module_names (Optional[Iterable[str]]): Names of python modules
+                to process. All modules are processed if not passed.
+
+        Returns:
+            list[list]: Names of python modules with names of module classes
+                and names of modules.
+        """
+        if module_names is None:
+            module_names = list(openpype_modules.keys())
+
+        output = []
+        for module_name in module_names:
+            module = openpype_modules.get(module_name)
+            if module is None:
+                continue
+            classes = []
+            for attr_name, modules_item in _get_module_classes(module):
+                name = getattr(modules_item, "name", None)
+                if not isinstance(name, six.string_types):
+                    name = None
+                classes.append([attr_name, name])
+            output.append([module_name, classes])
+        return output
+
+    @staticmethod
+    def get_settings_defs_data(openpype_modules, module_names=None):
+        """Prepare manifest data of settings definitions.
+
+        Args:
+            openpype_modules (_ModuleClass): Imported modules.
+            module_names (Optional[Iterable[str]]): Names of python modules
+                to process. All modules are processed if not passed.
+
+        Returns:
+            list[list]: Names of python modules with names of settings
+                definition classes.
+        """
+        if module_names is None:
+            module_names = list(openpype_modules.keys())
+
+        output = []
+        for module_name in module_names:
+            module = openpype_modules.get(module_name)
+            if module is None:
+                continue
+            attr_names = [
+                attr_name
+                for attr_name, _ in _get_module_settings_def_classes(module)
+            ]
+            if attr_names:
+                output.append([module_name, attr_names])
+        return output
+
+    def get_disabled(self, settings_hash):
+        """Ids of module classes disabled by settings.
+
+        Returns:
+            Union[set[str], None]: Ids of classes or None if are not known.
+        """
+        class_ids = self._disabled.get(settings_hash)
+        if class_ids is None:
+            return None
+        return set(class_ids)
+
+    def set_disabled(self, settings_hash, class_ids):
+        self._disabled.pop(settings_hash, None)
+        self._disabled[settings_hash] = list(sorted(class_ids))
+        while len(self._disabled) > MAX_MANIFEST_SETTINGS_VARIANTS:
+            self._disabled.popitem(last=False)
+
+    def save(self):
+        data = {
+            "version": MODULES_MANIFEST_VERSION,
+            "fingerprint": self.fingerprint,
+            "modules": self.modules,
+            "disabled": [list(item) for item in self._disabled.items()],
+            "failed": self.failed,
+            "settings_defs": self.settings_defs,
+        }
+        dirpath = os.path.dirname(os.path.abspath(self.path))
+        try:
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+            # Write to temp file first so other processes never read
+            #   partially written manifest
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".modules_manifest", dir=dirpath
+            )
+            with os.fdopen(fd, "w") as stream:
+                json.dump(data, stream)
+            if hasattr(os, "replace"):
+                os.replace(tmp_path, self.path)
+            else:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                os.rename(tmp_path, self.path)
+        except (IOError, OSError):
+            Logger.get_logger("ModulesLoader").debug(
+                "Failed to save modules manifest {}".format(self.path),
+                exc_info=True
+            )
+
+
+def get_modules_manifest_path():
+    """Path to manifest of modules.
+
+    Path can be changed with 'OPENPYPE_MODULES_MANIFEST' environment
+    variable, value "0" disables usage of manifest.
+
+    Returns:
+        Union[str, None]: Path to manifest or None if manifest is disabled.
+    """
+    value = os.getenv(MODULES_MANIFEST_ENV_KEY)
+    if value == "0":
+        return None
+    if value:
+        return value
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "modules_manifest.json"
+    )
+
+
+def _get_modules_fingerprint(module_entries, loaded_names):
+    from openpype.version import __version__
+
+    items = [
+        __version__,
+        AYON_SERVER_ENABLED,
+        list(sys.version_info[:2]),
+        list(sorted(loaded_names)),
+    ]
+    # Order of entries is not stable between processes
+    for entry in sorted(module_entries, key=lambda item: item["path"]):
+        items.append([
+            entry["kind"],
+            entry["path"],
+            _get_module_entry_stat(entry)
+        ])
+    return hashlib.sha256(
+        json.dumps(items).encode("utf-8")
+    ).hexdigest()
+
+
+def _get_module_entry_stat(entry):
+    """Latest modification time and number of python files of an entry.
+
+    All python files of a package are used, so change of any submodule
+    invalidates the manifest. Modification time of directories is not used
+    because it is changed when '__pycache__' is created.
+
+    Returns:
+        list[Union[float, int, None]]: Modification time and files count.
+    """
+
+    path = entry["path"]
+    if not entry["is_dir"]:
+        try:
+            return [os.path.getmtime(path), 1]
+        except OSError:
+            return [None, 0]
+
+    mtime = None
+    count = 0
+    for root, dirnames, filenames in os.walk(path):
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if dirname != "__pycache__"
+        ]
+        for filename in filenames:
+            if not filename.endswith(".py"):
+                continue
+            try:
+                file_mtime = os.path.getmtime(os.path.join(root, filename))
+            except OSError:
+                continue
+            count += 1
+            if mtime is None or file_mtime > mtime:
+                mtime = file_mtime
+    return [mtime, count]
+
+
+def _get_settings_hash(modules_settings):
+    data = json.dumps(
+        [AYON_SERVER_ENABLED, modules_settings],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _get_module_classes(module, log=None):
+    """Module classes available in python module.
+
+    Args:
+        module (ModuleType): Python module.
+        log (Optional[logging.Logger]): Logger used to log abstract
+            classes.
+
+    Returns:
+        list[tuple[str, type]]: Attribute names and module classes which
+            are not abstract.
+    """
+    output = []
+    # Go through globals in `pype.modules`
+    for name in dir(module):
+        modules_item = getattr(module, name, None)
+        # Filter globals that are not classes which inherit from
+        #   OpenPypeModule
+        if (
+            not inspect.isclass(modules_item)
+            or modules_item is OpenPypeModule
+            or modules_item is OpenPypeAddOn
+            or not issubclass(modules_item, OpenPypeModule)
+        ):
+            continue
+
+        # Check if class is abstract (Developing purpose)
+        if inspect.isabstract(modules_item):
+            if log is None:
+                continue
+            # Find abstract attributes by convention on `abc` module
+            not_implemented = []
+            for attr_name in dir(modules_item):
+                attr = getattr(modules_item, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
+
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {}."
+                " Missing implementations: {}"
+            ).format(name, ", ".join(not_implemented)))
+            continue
+        output.append((name, modules_item))
+    return output
 
 
 def get_default_modules_dir():
@@ -300,7 +772,7 @@ def load_modules(force=False):
     load_interfaces(force)
 
     if not _LoadCache.modules_lock.locked():
-        with _LoadCache.modules_lock:
+        with _LoadCache.modules_lock, startup_phase("modules.discovery"):
             _load_modules()
             _LoadCache.modules_loaded = True
     else:
@@ -466,6 +938,73 @@ def _load_modules():
     addons_dir = os.path.join(os.path.dirname(current_dir), "addons")
     module_dirs.append(addons_dir)
 
+    module_entries = _get_module_entries(
+        module_dirs, current_dir, hosts_dir, ignore_addon_names, log
+    )
+
+    manifest = None
+    manifest_path = get_modules_manifest_path()
+    if manifest_path:
+        fingerprint = _get_modules_fingerprint(
+            module_entries, openpype_modules.keys()
+        )
+        manifest = _ModulesManifest.load(manifest_path, fingerprint)
+
+    if manifest is not None:
+        # Modules which failed to import are imported on each start so
+        #   the errors are visible and fixed modules are added to manifest
+        fixed_names = []
+        failed_names = set(manifest.failed)
+        for entry in module_entries:
+            if entry["name"] not in failed_names:
+                continue
+            if _import_module_entry(openpype_modules, modules_key, entry, log):
+                fixed_names.append(entry["name"])
+
+        if fixed_names:
+            manifest.add_modules(openpype_modules, fixed_names)
+            manifest.save()
+
+        # Import modules on first access
+        for entry in module_entries:
+            if entry["name"] in failed_names:
+                continue
+            openpype_modules.add_lazy(
+                entry["name"],
+                functools.partial(
+                    _import_module_entry,
+                    openpype_modules, modules_key, entry, log
+                )
+            )
+        _install_lazy_modules_finder(modules_key)
+        _LoadCache.manifest = manifest
+        return
+
+    _LoadCache.manifest = None
+    failed_names = []
+    for entry in module_entries:
+        if not _import_module_entry(
+            openpype_modules, modules_key, entry, log
+        ):
+            failed_names.append(entry["name"])
+
+    if manifest_path:
+        manifest = _ModulesManifest.create(
+            manifest_path, fingerprint, openpype_modules, failed_names
+        )
+        manifest.save()
+        _LoadCache.manifest = manifest
+
+
+def _get_module_entries(
+    module_dirs, current_dir, hosts_dir, ignore_addon_names, log
+):
+    """Find python modules which should be imported as OpenPype modules.
+
+    Returns:
+        list[dict[str, Any]]: Information about python modules to import.
+    """
+    output = []
     processed_paths = set()
     for dirpath in frozenset(module_dirs):
         # Skip already processed paths
@@ -499,7 +1038,8 @@ def _load_modules():
                 continue
 
             # Validations
-            if os.path.isdir(fullpath):
+            is_dir = os.path.isdir(fullpath)
+            if is_dir:
                 # Check existence of init file
                 init_path = os.path.join(fullpath, "__init__.py")
                 if not os.path.exists(init_path):
@@ -512,50 +1052,80 @@ def _load_modules():
             elif ext not in (".py", ):
                 continue
 
-            # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
-            try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
+            if is_in_current_dir:
+                kind = "default"
+            elif is_in_host_dir:
+                kind = "host"
+            else:
+                kind = "dynamic"
+
+            output.append({
+                "name": basename,
+                "kind": kind,
+                "dirpath": dirpath,
+                "filename": filename,
+                "path": fullpath,
+                "is_dir": is_dir,
+            })
+    return output
 
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
 
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
+def _import_module_entry(openpype_modules, modules_key, entry, log):
+    """Import python module found by '_get_module_entries'.
 
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+    Returns:
+        bool: Module was imported without errors.
+    """
+    basename = entry["name"]
+    kind = entry["kind"]
+    # TODO add more logic how to define if folder is module or not
+    # - check manifest and content of manifest
+    try:
+        # Don't import dynamically current directory modules
+        if kind == "default":
+            import_str = "openpype.modules.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            default_module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = default_module
+            setattr(openpype_modules, basename, default_module)
+
+        elif kind == "host":
+            import_str = "openpype.hosts.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            # Until all hosts are converted to be able use them as
+            #   modules is this error check needed
+            try:
+                default_module = __import__(
+                    import_str, fromlist=("", )
+                )
+                sys.modules[new_import_str] = default_module
+                setattr(openpype_modules, basename, default_module)
 
             except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+                log.warning(
+                    "Failed to import host folder {}".format(basename),
+                    exc_info=True
+                )
+
+        elif entry["is_dir"]:
+            import_module_from_dirpath(
+                entry["dirpath"], entry["filename"], modules_key
+            )
+
+        else:
+            module = import_filepath(entry["path"])
+            setattr(openpype_modules, basename, module)
+
+    except Exception:
+        if kind == "default":
+            msg = "Failed to import default module '{}'.".format(
+                basename
+            )
+        else:
+            msg = "Failed to import module '{}'.".format(entry["path"])
+        log.error(msg, exc_info=True)
+        return False
+    return True
 
 
 @six.add_metaclass(ABCMeta)
@@ -680,6 +1250,62 @@ class OpenPypeAddOn(OpenPypeModule):
         pass
 
 
+class _DeferredModule(object):
+    """Placeholder of module disabled by settings which was not imported.
+
+    Module is imported and initialized when any other attribute than
+    'name', 'enabled' or 'id' is accessed. Placeholder is then replaced
+    with the module in manager.
+
+    Disabled modules are stored in manifest per hash of modules settings,
+    so enabled state of a module must depend only on 'modules_settings'
+    passed to 'initialize'. Modules deciding enabled state from other
+    sources (e.g. environment variables) are not supported, usage of
+    manifest can be disabled with 'OPENPYPE_MODULES_MANIFEST=0'.
+
+    Args:
+        manager (ModulesManager): Manager that created the placeholder.
+        class_id (str): Id of module class in manifest.
+        name (str): Module name.
+        modules_settings (dict[str, Any]): Settings of modules.
+    """
+
+    enabled = False
+
+    def __init__(self, manager, class_id, name, modules_settings):
+        self.manager = manager
+        self.name = name
+        self.id = uuid4()
+        self._class_id = class_id
+        self._modules_settings = modules_settings
+        self._module = None
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self._class_id)
+
+    def get_module(self):
+        """Import and initialize module.
+
+        Returns:
+            OpenPypeModule: Initialized module.
+        """
+        if self._module is None:
+            import openpype_modules
+
+            module_name, attr_name = self._class_id.rsplit(".", 1)
+            modules_item = getattr(openpype_modules[module_name], attr_name)
+            module = modules_item(self.manager, self._modules_settings)
+            module._id = self.id
+            self.manager._replace_deferred_module(self, module)
+            self._module = module
+        return self._module
+
+    def __getattr__(self, attr_name):
+        if attr_name.startswith("__"):
+            raise AttributeError(attr_name)
+        return getattr(self.get_module(), attr_name)
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
@@ -756,46 +1382,58 @@ class ModulesManager:
         time_start = time.time()
         prev_start_time = time_start
 
-        module_classes = []
-        for module in openpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   OpenPypeModule
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, OpenPypeModule)
-                ):
-                    continue
+        manifest = _LoadCache.manifest
+        settings_hash = disabled_ids = None
+        if manifest is not None:
+            settings_hash = _get_settings_hash(modules_settings)
+            disabled_ids = manifest.get_disabled(settings_hash)
+
+        # Items are class id, module class and module name
+        module_items = []
+        if manifest is None:
+            for module in openpype_modules:
+                for _, modules_item in _get_module_classes(module, self.log):
+                    module_items.append((None, modules_item, None))
 
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
+        else:
+            for module_name, classes in manifest.modules:
+                for attr_name, name in classes:
+                    class_id = "{}.{}".format(module_name, attr_name)
+                    # Don't import modules disabled by settings
+                    if (
+                        name
+                        and disabled_ids is not None
+                        and class_id in disabled_ids
+                    ):
+                        module_items.append((class_id, None, name))
+                        continue
+
+                    module = openpype_modules.get(module_name)
+                    modules_item = getattr(module, attr_name, None)
+                    if modules_item is None:
+                        self.log.warning(
+                            "Module class {} was not found.".format(class_id)
                         )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
-                module_classes.append(modules_item)
+                        continue
+                    module_items.append((class_id, modules_item, None))
+
+        disabled_class_ids = set()
+        for class_id, modules_item, module_name in module_items:
+            if modules_item is None:
+                module = _DeferredModule(
+                    self, class_id, module_name, modules_settings
+                )
+                self.modules.append(module)
+                self.modules_by_id[module.id] = module
+                self.modules_by_name[module.name] = module
+                self.log.debug("[ ] {} (not imported)".format(class_id))
+                continue
 
-        for modules_item in module_classes:
             try:
                 name = modules_item.__name__
                 # Try initialize module
-                module = modules_item(self, modules_settings)
+                with startup_phase("modules.initialize.{}".format(name)):
+                    module = modules_item(self, modules_settings)
                 # Store initialized object
                 self.modules.append(module)
                 self.modules_by_id[module.id] = module
@@ -803,6 +1441,8 @@ class ModulesManager:
                 enabled_str = "X"
                 if not module.enabled:
                     enabled_str = " "
+                    if class_id is not None:
+                        disabled_class_ids.add(class_id)
                 self.log.debug("[{}] {}".format(enabled_str, name))
 
                 now = time.time()
@@ -815,10 +1455,21 @@ class ModulesManager:
                     exc_info=True
                 )
 
+        if manifest is not None and disabled_ids is None:
+            manifest.set_disabled(settings_hash, disabled_class_ids)
+            manifest.save()
+
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
+    def _replace_deferred_module(self, deferred_module, module):
+        """Replace placeholder of not imported module with the module."""
+        self.modules[self.modules.index(deferred_module)] = module
+        self.modules_by_id.pop(deferred_module.id, None)
+        self.modules_by_id[module.id] = module
+        self.modules_by_name[module.name] = module
+
     def connect_modules(self):
         """Trigger connection with other enabled modules.
 
@@ -831,7 +1482,10 @@ class ModulesManager:
         self.log.debug("Has {} enabled modules.".format(len(enabled_modules)))
         for module in enabled_modules:
             try:
-                module.connect_with_modules(enabled_modules)
+                with startup_phase("modules.connect.{}".format(
+                    module.__class__.__name__
+                )):
+                    module.connect_with_modules(enabled_modules)
             except Exception:
                 self.log.error(
                     "BUG: Module failed on connection with other modules.",
@@ -1242,7 +1896,10 @@ class TrayModulesManager(ModulesManager):
         for module in self.get_enabled_tray_modules():
             try:
                 module._tray_manager = self.tray_manager
-                module.tray_init()
+                with startup_phase("tray.init.{}".format(
+                    module.__class__.__name__
+                )):
+                    module.tray_init()
                 module.tray_initialized = True
             except Exception:
                 self.log.warning(
@@ -1360,41 +2017,82 @@ def get_module_settings_defs():
 
     log = Logger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
-        for attr_name in dir(raw_module):
-            attr = getattr(raw_module, attr_name)
-            if (
-                not inspect.isclass(attr)
-                or attr is ModuleSettingsDef
-                or not issubclass(attr, ModuleSettingsDef)
-            ):
-                continue
-
-            if inspect.isabstract(attr):
-                # Find missing implementations by convention on `abc` module
-                not_implemented = []
-                for attr_name in dir(attr):
-                    attr = getattr(attr, attr_name, None)
-                    abs_method = getattr(
-                        attr, "__isabstractmethod__", None
+    manifest = _LoadCache.manifest
+    if manifest is None:
+        for raw_module in openpype_modules:
+            settings_defs.extend(
+                attr
+                for _, attr in _get_module_settings_def_classes(
+                    raw_module, log
+                )
+            )
+        return settings_defs
+
+    # Import only modules with settings definitions
+    for module_name, attr_names in manifest.settings_defs:
+        raw_module = openpype_modules.get(module_name)
+        for attr_name in attr_names:
+            attr = getattr(raw_module, attr_name, None)
+            if attr is None:
+                log.warning(
+                    "Settings definition {}.{} was not found.".format(
+                        module_name, attr_name
                     )
-                    if attr and abs_method:
-                        not_implemented.append(attr_name)
-
-                # Log missing implementations
-                log.warning((
-                    "Skipping abstract Class: {} in module {}."
-                    " Missing implementations: {}"
-                ).format(
-                    attr_name, raw_module.__name__, ", ".join(not_implemented)
-                ))
+                )
                 continue
-
             settings_defs.append(attr)
 
     return settings_defs
 
 
+def _get_module_settings_def_classes(raw_module, log=None):
+    """Settings definition classes available in python module.
+
+    Args:
+        raw_module (ModuleType): Python module.
+        log (Optional[logging.Logger]): Logger used to log abstract
+            classes.
+
+    Returns:
+        list[tuple[str, type]]: Attribute names and settings definition
+            classes which are not abstract.
+    """
+    output = []
+    for attr_name in dir(raw_module):
+        attr = getattr(raw_module, attr_name)
+        if (
+            not inspect.isclass(attr)
+            or attr is ModuleSettingsDef
+            or not issubclass(attr, ModuleSettingsDef)
+        ):
+            continue
+
+        if inspect.isabstract(attr):
+            if log is None:
+                continue
+            # Find missing implementations by convention on `abc` module
+            not_implemented = []
+            for item_name in dir(attr):
+                item = getattr(attr, item_name, None)
+                abs_method = getattr(
+                    item, "__isabstractmethod__", None
+                )
+                if item and abs_method:
+                    not_implemented.append(item_name)
+
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {} in module {}."
+                " Missing implementations: {}"
+            ).format(
+                attr_name, raw_module.__name__, ", ".join(not_implemented)
+            ))
+            continue
+
+        output.append((attr_name, attr))
+    return output
+
+
 @six.add_metaclass(ABCMeta)
 class BaseModuleSettingsDef:
     """Definition of settings for OpenPype module or AddOn."""
@@ -14,7 +14,6 @@ from collections import OrderedDict
 
 import six
 import attr
-import requests
 
 import pyblish.api
 from openpype.pipeline.publish import (
@@ -27,8 +26,24 @@ from openpype.pipeline.publish.lib import (
 )
 from openpype import AYON_SERVER_ENABLED
 
+from .deadline_client import (
+    DeadlineClient,
+    create_session,
+    get_verify_ssl,
+)
+
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
+# Session shared by requests to reuse connections
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        _session = create_session()
+    return _session
+
 
 def requests_post(*args, **kwargs):
     """Wrap request post method.
@@ -44,11 +59,10 @@ def requests_post(*args, **kwargs):
 
     """
     if 'verify' not in kwargs:
-        kwargs['verify'] = False if os.getenv("OPENPYPE_DONT_VERIFY_SSL",
-                                              True) else True  # noqa
+        kwargs['verify'] = get_verify_ssl()
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.post(*args, **kwargs)
+    return _get_session().post(*args, **kwargs)
 
 
 def requests_get(*args, **kwargs):
@@ -65,11 +79,10 @@ def requests_get(*args, **kwargs):
 
     """
     if 'verify' not in kwargs:
-        kwargs['verify'] = False if os.getenv("OPENPYPE_DONT_VERIFY_SSL",
-                                              True) else True  # noqa
+        kwargs['verify'] = get_verify_ssl()
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.get(*args, **kwargs)
+    return _get_session().get(*args, **kwargs)
 
 
 class DeadlineKeyValueVar(dict):
@@ -579,8 +592,45 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             KnownPublishError: if submission fails.
 
         """
-        url = "{}/api/jobs".format(self._deadline_url)
-        response = requests_post(url, json=payload)
+        response = self.deadline_client.submit_job(payload)
+        result = self._process_submit_response(payload, response)
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = result
+
+        return result["_id"]
+
+    def submit_jobs(self, payloads):
+        """Submit multiple payloads to Deadline concurrently.
+
+        Args:
+            payloads (list[dict]): Payloads of jobs.
+
+        Returns:
+            list[str]: Resulting Deadline job ids in order of payloads.
+
+        Throws:
+            KnownPublishError: if any submission fails.
+
+        """
+        if not payloads:
+            return []
+
+        results = self.deadline_client.submit_jobs(
+            payloads, self._process_submit_response
+        )
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = results[-1]
+
+        return [result["_id"] for result in results]
+
+    @property
+    def deadline_client(self):
+        """Client of Deadline Web Service with pooled connections."""
+        return DeadlineClient.get_client(self._deadline_url)
+
+    def _process_submit_response(self, payload, response):
         if not response.ok:
             self.log.error("Submission failed!")
             self.log.error(response.status_code)
@@ -595,8 +645,4 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             msg += "Try restarting the Deadline Webservice."
             self.log.warning(msg, exc_info=True)
             raise KnownPublishError("Broken response from DL")
-
-        # for submit publish job
-        self._instance.data["deadlineSubmissionJob"] = result
-
-        return result["_id"]
+        return result
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""Client of Deadline Web Service with pooled connections."""
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 hosts without 'futures' backport submit sequentially
+    ThreadPoolExecutor = None
+
+# Maximum number of concurrent requests of one client
+MAX_WORKERS = 8
+# Number of retries of failed connections and unavailable service
+MAX_RETRIES = 3
+# Backoff between retries is 'factor * (2 ** retry)' seconds
+BACKOFF_FACTOR = 0.5
+# Timeout of one request in seconds
+TIMEOUT = 10
+
+
+# Response statuses of unavailable service which are retried
+RETRY_STATUSES = (502, 503, 504)
+# Response statuses retried for POST requests
+# - only when the service refused the request, gateway errors can happen
+#   after the job was already created and repeated POST would submit
+#   a duplicated job
+POST_RETRY_STATUSES = (503, )
+
+
+class _Retry(Retry):
+    """Retry which does not repeat POST requests on gateway errors."""
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if (
+            method.upper() == "POST"
+            and status_code not in POST_RETRY_STATUSES
+        ):
+            return False
+        return super(_Retry, self).is_retry(
+            method, status_code, has_retry_after
+        )
+
+
+def _create_retry(retries):
+    kwargs = {
+        "total": retries,
+        "connect": retries,
+        # Do not repeat requests which could be processed by the service
+        "read": 0,
+        "status": retries,
+        "backoff_factor": BACKOFF_FACTOR,
+        "status_forcelist": RETRY_STATUSES,
+        "raise_on_status": False,
+    }
+    methods = frozenset(("GET", "POST", "PUT", "DELETE"))
+    try:
+        return _Retry(allowed_methods=methods, **kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        return _Retry(method_whitelist=methods, **kwargs)
+
+
+def get_verify_ssl():
+    """Should be SSL certificates verified.
+
+    Verification is disabled if ``OPENPYPE_DONT_VERIFY_SSL`` environment
+    variable is set. This is useful when Deadline server is running with
+    self-signed certificates.
+    """
+    return False if os.getenv("OPENPYPE_DONT_VERIFY_SSL", True) else True
+
+
+def create_session(max_workers=None, retries=None):
+    """Requests session with connection pool and retries.
+
+    Args:
+        max_workers (Optional[int]): Size of connection pool.
+        retries (Optional[int]): Number of retries.
+
+    Returns:
+        requests.Session: Session object.
+    """
+
+    if max_workers is None:
+        max_workers = MAX_WORKERS
+    if retries is None:
+        retries = MAX_RETRIES
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=max_workers,
+        max_retries=_create_retry(retries)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class DeadlineClient(object):
+    """Client of Deadline Web Service.
+
+    Requests share pooled connections of one session and failed connections
+    are retried with backoff. Multiple jobs can be submitted concurrently
+    with bounded number of parallel requests.
+
+    Use 'get_client' to reuse client of a web service url.
+
+    Args:
+        url (str): Deadline Web Service url.
+        max_workers (Optional[int]): Maximum number of concurrent requests.
+        retries (Optional[int]): Number of retries of failed requests.
+        timeout (Optional[float]): Timeout of a request in seconds.
+    """
+
+    _clients = {}
+    _clients_lock = threading.Lock()
+
+    def __init__(self, url, max_workers=None, retries=None, timeout=None):
+        if max_workers is None:
+            max_workers = MAX_WORKERS
+        if timeout is None:
+            timeout = TIMEOUT
+        self._url = url.rstrip("/")
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._session = create_session(max_workers, retries)
+
+    @classmethod
+    def get_client(cls, url):
+        """Shared client of a Deadline Web Service url.
+
+        Args:
+            url (str): Deadline Web Service url.
+
+        Returns:
+            DeadlineClient: Client object.
+        """
+
+        key = url.rstrip("/")
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                client = cls(key)
+                cls._clients[key] = client
+        return client
+
+    @property
+    def url(self):
+        return self._url
+
+    def request(self, method, path, **kwargs):
+        """Send request to web service.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path of endpoint, e.g. 'api/jobs'.
+            **kwargs (Any): Keyword arguments for 'requests'.
+
+        Returns:
+            requests.Response: Response of web service.
+        """
+
+        kwargs.setdefault("verify", get_verify_ssl())
+        kwargs.setdefault("timeout", self._timeout)
+        url = "{}/{}".format(self._url, path.lstrip("/"))
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def submit_job(self, payload):
+        """Submit job payload.
+
+        Args:
+            payload (dict): Job payload with 'JobInfo' and 'PluginInfo'.
+
+        Returns:
+            requests.Response: Response of web service.
+        """
+
+        return self.post("api/jobs", json=payload)
+
+    def submit_jobs(self, payloads, callback=None):
+        """Submit multiple job payloads concurrently.
+
+        Args:
+            payloads (list[dict]): Job payloads.
+            callback (Optional[Callable[[dict, requests.Response], Any]]):
+                Function processing payload and its response. Its return
+                value is returned instead of the response.
+
+        Returns:
+            list[Any]: Responses or callback results in order of payloads.
+        """
+
+        def _submit(payload):
+            response = self.submit_job(payload)
+            if callback is None:
+                return response
+            return callback(payload, response)
+
+        payloads = list(payloads)
+        max_workers = min(self._max_workers, len(payloads))
+        if ThreadPoolExecutor is None or max_workers < 2:
+            return [_submit(payload) for payload in payloads]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_submit, payload)
+                for payload in payloads
+            ]
+            try:
+                # Raise first error in order of payloads
+                return [future.result() for future in futures]
+            except Exception:
+                # Don't submit remaining jobs
+                for future in futures:
+                    future.cancel()
+                raise
@@ -8,6 +8,7 @@ import traceback
 
 from bson.objectid import ObjectId
 from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
 
 import arrow
 import ftrack_api
@@ -38,6 +39,91 @@ from openpype_modules.ftrack.lib.avalon_sync import (
 )
 
 
+# Maximum number of asset documents kept in memory between events
+MAX_CACHED_ASSET_DOCS = 200000
+# Cached documents are reloaded at least once per this time in seconds
+CACHED_ENTITIES_MAX_AGE = 10 * 60
+
+
+def _apply_set_changes(doc, set_data):
+    """Apply '$set' part of mongo update to a document in memory."""
+    for key, value in set_data.items():
+        parts = key.split(".")
+        target = doc
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = copy.deepcopy(value)
+
+
+class AvalonEntitiesCache:
+    """Project and asset documents of projects kept between events.
+
+    Documents are stored with revision of project collection and are
+    returned only if revision did not change. Documents are modified in
+    memory by the event handler together with changes in database.
+
+    Least recently used projects are removed when number of cached asset
+    documents exceeds the limit.
+
+    Args:
+        max_docs (int): Maximum number of cached asset documents.
+        max_age (float): Time in seconds after which are documents loaded
+            again from database.
+    """
+
+    def __init__(self, max_docs=None, max_age=None):
+        if max_docs is None:
+            max_docs = MAX_CACHED_ASSET_DOCS
+        if max_age is None:
+            max_age = CACHED_ENTITIES_MAX_AGE
+        self._max_docs = max_docs
+        self._max_age = max_age
+        self._items = collections.OrderedDict()
+
+    def get(self, project_name, revision):
+        """Cached project and asset documents.
+
+        Args:
+            project_name (str): Project name.
+            revision (Any): Current revision of project collection.
+
+        Returns:
+            Union[tuple[dict, list[dict]], None]: Project document with
+                asset documents or None if are not cached or are outdated.
+        """
+
+        item = self._items.pop(project_name, None)
+        if item is None or revision is None:
+            return None
+
+        item_revision, stored, entities = item
+        if (
+            item_revision != revision
+            or time.time() - stored > self._max_age
+        ):
+            return None
+        self._items[project_name] = item
+        return entities
+
+    def set(self, project_name, revision, entities):
+        self._items.pop(project_name, None)
+        project_doc, asset_docs = entities
+        if project_doc is None or len(asset_docs) > self._max_docs:
+            return
+
+        self._items[project_name] = (revision, time.time(), entities)
+        docs_count = sum(
+            len(item[2][1])
+            for item in self._items.values()
+        )
+        while docs_count > self._max_docs:
+            _, item = self._items.popitem(last=False)
+            docs_count -= len(item[2][1])
+
+    def remove(self, project_name):
+        self._items.pop(project_name, None)
+
+
 class SyncToAvalonEvent(BaseEvent):
     interest_entTypes = ["show", "task"]
     ignore_ent_types = ["Milestone"]
@@ -90,6 +176,7 @@ class SyncToAvalonEvent(BaseEvent):
         self.debug_sync_types = collections.defaultdict(list)
 
         self.dbcon = AvalonMongoDB()
+        self._entities_cache = AvalonEntitiesCache()
         # Set processing session to not use global
         self.set_process_session(session)
         super().__init__(session)
@@ -158,11 +245,47 @@ class SyncToAvalonEvent(BaseEvent):
             project_name = self.cur_project["full_name"]
             self.dbcon.install()
             self.dbcon.Session["AVALON_PROJECT"] = project_name
-            avalon_project = get_project(project_name)
-            avalon_entities = list(get_assets(project_name))
-            self._avalon_ents = (avalon_project, avalon_entities)
+            self._avalon_ents = self._entities_cache.get(
+                project_name, self._get_project_revision(project_name)
+            )
+            if self._avalon_ents is None:
+                avalon_project = get_project(project_name)
+                avalon_entities = list(get_assets(project_name))
+                self._avalon_ents = (avalon_project, avalon_entities)
         return self._avalon_ents
 
+    def _get_project_revision(self, project_name):
+        """Revision of project collection.
+
+        Revision is sum of write operations counters of project collection
+        from 'top' command, so any change in the collection changes it.
+
+        Returns:
+            Union[int, None]: Revision or None if is not available.
+        """
+
+        database = self.dbcon.database
+        try:
+            totals = database.client.admin.command("top")["totals"]
+        except PyMongoError:
+            return None
+
+        values = totals.get("{}.{}".format(database.name, project_name), {})
+        return sum(
+            values.get(key, {}).get("count", 0)
+            for key in ("insert", "update", "remove")
+        )
+
+    def _store_avalon_entities(self):
+        """Keep project and asset documents for next events."""
+        if self._avalon_ents is None:
+            return
+        project_name = self.cur_project["full_name"]
+        revision = self._get_project_revision(project_name)
+        if revision is None:
+            return
+        self._entities_cache.set(project_name, revision, self._avalon_ents)
+
     @property
     def avalon_ents_by_name(self):
         if self._avalon_ents_by_name is None:
@@ -833,6 +956,7 @@ class SyncToAvalonEvent(BaseEvent):
             self.process_task_updates()
             if self.updates:
                 self.update_entities()
+            self._store_avalon_entities()
             time_8 = time.time()
 
             time_removed = time_2 - time_1
@@ -852,6 +976,8 @@ class SyncToAvalonEvent(BaseEvent):
             ))
 
         except Exception:
+            # Documents in memory may not match database
+            self._entities_cache.remove(ft_project["full_name"])
             msg = "An error has happened during synchronization"
             self.report_items["error"][msg].append((
                 str(traceback.format_exc()).replace("\n", "<br>")
@@ -2465,6 +2591,7 @@ class SyncToAvalonEvent(BaseEvent):
             Resets self.updates afterwards.
         """
         mongo_changes_bulk = []
+        changes_by_entity = []
         for mongo_id, changes in self.updates.items():
             avalon_ent = self.avalon_ents_by_id[mongo_id]
             is_project = avalon_ent["type"] == "project"
@@ -2472,11 +2599,15 @@ class SyncToAvalonEvent(BaseEvent):
             mongo_changes_bulk.append(
                 UpdateOne({"_id": mongo_id}, change_data)
             )
+            changes_by_entity.append((avalon_ent, change_data["$set"]))
 
         if not mongo_changes_bulk:
             return
 
         self.dbcon.bulk_write(mongo_changes_bulk)
+        # Keep documents in memory up to date
+        for avalon_ent, set_data in changes_by_entity:
+            _apply_set_changes(avalon_ent, set_data)
         self.updates = collections.defaultdict(dict)
 
     @property
@@ -2678,6 +2809,15 @@ class SyncToAvalonEvent(BaseEvent):
         if mongo_changes_bulk:
             self.dbcon.bulk_write(mongo_changes_bulk)
 
+        # Keep documents in memory up to date
+        for ftrack_id, mongo_id in ftrack_mongo_mapping_found.items():
+            avalon_ent = self.avalon_ents_by_id.get(mongo_id)
+            if avalon_ent is not None:
+                _apply_set_changes(
+                    avalon_ent,
+                    {"data.tasks": tasks_per_ftrack_id[ftrack_id]}
+                )
+
     def _mongo_id_configuration(
         self,
         ent_info,
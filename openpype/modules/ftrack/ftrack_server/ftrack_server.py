@@ -61,6 +61,10 @@ class FtrackServer:
         self.session = None
 
     def set_files(self, paths):
+        self.register_handlers(self.session, paths)
+
+    def register_handlers(self, session, paths):
+        """Register event handlers from paths to a session."""
         # Iterate all paths
         register_functions = []
         for path in paths:
@@ -105,7 +109,7 @@ class FtrackServer:
 
         for filepath, register_func in register_functions:
             try:
-                register_func(self.session)
+                register_func(session)
             except Exception:
                 self.log.warning(
                     "\"{}\" - register was not successful".format(filepath),
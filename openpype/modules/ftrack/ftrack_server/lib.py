@@ -111,18 +111,273 @@ class StorerEventHub(SocketBaseEventHub):
         )
 
 
+def get_event_project_id(event_data):
+    """Ftrack project id of stored event.
+
+    Args:
+        event_data (dict[str, Any]): Stored event data.
+
+    Returns:
+        Union[str, None]: Project id or None if event is not related to
+            a project.
+    """
+
+    data = event_data.get("data") or {}
+    entities = list(data.get("entities") or [])
+    entities.extend(data.get("selection") or [])
+    for entity in entities:
+        if entity.get("entityType") == "show":
+            return entity.get("entityId")
+        for parent in entity.get("parents") or []:
+            if parent.get("entityType") == "show":
+                return parent.get("entityId")
+    return None
+
+
+class StoredEventsQueue(object):
+    """Stored events waiting for processing split by project.
+
+    Events of a project are returned in order in which were added. Projects
+    take turns so events of a busy project don't delay events of other
+    projects.
+
+    Workers processing events in parallel use 'acquire' and 'release' so
+    only one event of a project is processed at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._events_by_project = collections.OrderedDict()
+        self._busy_projects = set()
+        self._depth = 0
+
+    def __len__(self):
+        return self._depth
+
+    def put(self, project_id, item):
+        with self._lock:
+            events = self._events_by_project.get(project_id)
+            if events is None:
+                events = collections.deque()
+                self._events_by_project[project_id] = events
+            events.append(item)
+            self._depth += 1
+            self._not_empty.notify()
+
+    def get(self, timeout=None):
+        """Get next event.
+
+        Args:
+            timeout (Optional[float]): Wait for an event for this time.
+
+        Returns:
+            Union[Any, None]: Next item or None if queue is empty.
+        """
+
+        with self._lock:
+            if not self._depth and timeout:
+                self._not_empty.wait(timeout)
+            if not self._depth:
+                return None
+
+            project_id = next(iter(self._events_by_project))
+            return self._pop_project_event(project_id)
+
+    def acquire(self, timeout=None):
+        """Get next event of a project which has no event in process.
+
+        Project of returned event must be released with 'release' once the
+        event is processed.
+
+        Args:
+            timeout (Optional[float]): Wait for an event for this time.
+
+        Returns:
+            Union[tuple[Union[str, None], Any], None]: Project id with next
+                item or None if there is no event of free project.
+        """
+
+        deadline = None
+        if timeout:
+            deadline = time.time() + timeout
+
+        with self._lock:
+            while True:
+                for project_id in self._events_by_project:
+                    if project_id not in self._busy_projects:
+                        self._busy_projects.add(project_id)
+                        return (
+                            project_id, self._pop_project_event(project_id)
+                        )
+
+                if deadline is None:
+                    return None
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self._not_empty.wait(remaining)
+
+    def release(self, project_id):
+        """Event of project acquired by 'acquire' was processed."""
+        with self._lock:
+            self._busy_projects.discard(project_id)
+            if project_id in self._events_by_project:
+                self._not_empty.notify()
+
+    def _pop_project_event(self, project_id):
+        events = self._events_by_project.pop(project_id)
+        item = events.popleft()
+        self._depth -= 1
+        # Move project to the end so other projects are processed next
+        if events:
+            self._events_by_project[project_id] = events
+        return item
+
+
+class ProcessEventWorker(threading.Thread):
+    """Thread processing stored events with its own ftrack session.
+
+    Each worker has own session with own set of event handlers because
+    ftrack session is not thread safe. Worker takes events of projects
+    which are not processed by other workers, so events of a project are
+    processed in order and events of different projects in parallel.
+
+    Args:
+        stored_events (StoredEventsQueue): Queue of stored events.
+        session_factory (Callable[[], ftrack_api.Session]): Creates session
+            with registered event handlers.
+        processed_queue (queue.Queue): Processed events with their lag are
+            put to the queue.
+        stop_event (threading.Event): Stop processing when is set.
+    """
+
+    # Wait for an event for this time before stop event is checked
+    get_timeout = 0.2
+
+    def __init__(
+        self, stored_events, session_factory, processed_queue, stop_event
+    ):
+        super(ProcessEventWorker, self).__init__()
+        self.daemon = True
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._stored_events = stored_events
+        self._session_factory = session_factory
+        self._processed_queue = processed_queue
+        self._stop_event = stop_event
+
+    def run(self):
+        try:
+            session = self._session_factory()
+        except Exception:
+            self.log.error(
+                "Failed to create session of event worker", exc_info=True
+            )
+            return
+
+        try:
+            while not self._stop_event.is_set():
+                item = self._stored_events.acquire(self.get_timeout)
+                if item is None:
+                    continue
+
+                project_id, (event, stored) = item
+                try:
+                    session.event_hub._handle(event)
+                except Exception:
+                    self.log.warning(
+                        "Failed to process event", exc_info=True
+                    )
+                finally:
+                    self._stored_events.release(project_id)
+                lag = None
+                if stored is not None:
+                    lag = (
+                        datetime.datetime.utcnow() - stored
+                    ).total_seconds()
+                self._processed_queue.put((event, lag))
+        finally:
+            session.close()
+
+
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in mongo by event storer.
+
+    New stored events are received from mongo change stream, unprocessed
+    events are polled from collection if change streams are not available
+    (mongo is not a replica set). Events are handled in order per project
+    and projects take turns. Processed events are marked in batches and
+    old processed events are removed periodically.
+
+    If session factory is set with 'set_worker_session_factory', events are
+    processed by pool of workers, each with its own session, so events of
+    different projects are processed in parallel. Otherwise are events
+    processed by session of the hub in the thread calling 'wait'.
+    """
+
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Events marked as processed in one write
+    ack_batch_size = 100
+    # Maximum time in seconds processed events are not marked
+    ack_interval = 1.0
+    # How often are removed processed events older than 3 days
+    cleanup_interval = 60 * 60
+    # How often are logged queue metrics
+    metrics_interval = 60
+    # Poll interval if change streams are not available
+    poll_interval = 0.5
+    # Default number of workers processing events of projects in parallel
+    workers_count = 4
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
 
+        self._stored_events = StoredEventsQueue()
+        # Ids of events in queue or processed but not marked in mongo
+        self._pending_ids = set()
+        self._pending_lock = threading.Lock()
+        self._acks = []
+        self._last_ack = time.time()
+        self._last_cleanup = None
+        self._last_metrics = time.time()
+        self._metrics = {
+            "processed": 0,
+            "lag": 0.0,
+            "max_lag": 0.0,
+        }
+        self._reader_thread = None
+        self._reader_stopped = threading.Event()
+        self._reader_error = None
+        self._session_factory = None
+        self._workers = []
+        self._workers_stopped = threading.Event()
+        self._processed_queue = queue.Queue()
+        # Events are published from worker threads
+        self._publish_lock = threading.Lock()
+
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
+    def set_worker_session_factory(self, session_factory, workers_count=None):
+        """Process events in parallel by workers with own sessions.
+
+        Args:
+            session_factory (Callable[[], ftrack_api.Session]): Creates
+                session with registered event handlers for a worker. Is
+                called in worker thread.
+            workers_count (Optional[int]): Number of workers, at most this
+                number of projects is processed at once.
+        """
+
+        if workers_count is None:
+            workers_count = self.workers_count
+        self._session_factory = session_factory
+        self.workers_count = max(int(workers_count), 1)
+
     def prepare_dbcon(self):
         try:
             database_name, collection_name = get_ftrack_event_mongo_info()
@@ -145,6 +400,19 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+    def get_metrics(self):
+        """Metrics of processed events.
+
+        Returns:
+            dict[str, Any]: Number of processed events, number of events
+                waiting in queue, lag of last processed event and maximum
+                lag since metrics were logged in seconds.
+        """
+
+        metrics = dict(self._metrics)
+        metrics["queue_depth"] = len(self._stored_events)
+        return metrics
+
     def wait(self, duration=None):
         """Overridden wait
         Event are loaded from Mongo DB when queue is empty. Handled event is
@@ -152,72 +420,288 @@ class ProcessEventHub(SocketBaseEventHub):
         """
         started = time.time()
         self.prepare_dbcon()
+        self._start_reader()
+        self._start_workers()
+        try:
+            while True:
+                if self._reader_error is not None:
+                    self._on_mongo_error()
+
+                # Events of event hub itself (e.g. disconnection)
+                try:
+                    event = self._event_queue.get_nowait()
+                except queue.Empty:
+                    event = None
+
+                if event is not None:
+                    self._handle_event(event, None)
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        break
+
+                elif not self._workers:
+                    item = self._stored_events.get(timeout=0.1)
+                    if item is not None:
+                        self._handle_event(*item)
+
+                else:
+                    self._collect_processed(timeout=0.1)
+                    if not any(worker.is_alive() for worker in self._workers):
+                        self.pypelog.error(
+                            "All event workers have stopped, exiting."
+                        )
+                        break
+
+                self._process_schedule()
+
+                if duration is not None:
+                    if (time.time() - started) > duration:
+                        break
+        finally:
+            self._stop_workers()
+            self._stop_reader()
+            self._flush_acks()
+
+    def _publish(self, event, synchronous=False, **kwargs):
+        if synchronous:
+            return super(ProcessEventHub, self)._publish(
+                event, synchronous=synchronous, **kwargs
+            )
+
+        with self._publish_lock:
+            return super(ProcessEventHub, self)._publish(event, **kwargs)
+
+    def _handle_event(self, event, stored):
+        self._handle(event)
+
+        lag = None
+        if stored is not None:
+            lag = (datetime.datetime.utcnow() - stored).total_seconds()
+        self._event_processed(event, lag)
+
+    def _event_processed(self, event, lag):
+        if lag is not None:
+            self._metrics["lag"] = lag
+            self._metrics["max_lag"] = max(self._metrics["max_lag"], lag)
+        self._metrics["processed"] += 1
+
+        mongo_id = event["data"].get("_event_mongo_id")
+        if mongo_id is not None:
+            self._acks.append(mongo_id)
+
+    def _collect_processed(self, timeout=None):
+        """Collect events processed by workers to mark them in mongo."""
+        try:
+            if timeout:
+                item = self._processed_queue.get(timeout=timeout)
+            else:
+                item = self._processed_queue.get_nowait()
+        except queue.Empty:
+            return
+
         while True:
+            self._event_processed(*item)
             try:
-                event = self._event_queue.get(timeout=0.1)
+                item = self._processed_queue.get_nowait()
             except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
-                try:
-                    self._handle(event)
+                break
 
-                    mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
+    def _start_workers(self):
+        if self._session_factory is None:
+            return
 
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+        self._workers_stopped.clear()
+        self._workers = [
+            ProcessEventWorker(
+                self._stored_events,
+                self._session_factory,
+                self._processed_queue,
+                self._workers_stopped
+            )
+            for _ in range(self.workers_count)
+        ]
+        for worker in self._workers:
+            worker.start()
 
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
-
-            if duration is not None:
-                if (time.time() - started) > duration:
-                    break
-
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
+    def _stop_workers(self):
+        if not self._workers:
+            return
+
+        self._workers_stopped.set()
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        # Mark events processed while workers were stopping
+        self._collect_processed()
+
+    def _process_schedule(self):
+        now = time.time()
+        if self._acks and (
+            len(self._acks) >= self.ack_batch_size
+            or now - self._last_ack >= self.ack_interval
+            # Nothing else to do
+            or not len(self._stored_events)
+        ):
+            self._flush_acks()
+
+        if (
+            self._last_cleanup is None
+            or now - self._last_cleanup >= self.cleanup_interval
+        ):
+            self.cleanup_events()
+
+        if now - self._last_metrics >= self.metrics_interval:
+            self._last_metrics = now
+            metrics = self.get_metrics()
+            self.pypelog.info((
+                "Processed events: {processed}, queue depth: {queue_depth},"
+                " lag: {lag:.2f}s (max {max_lag:.2f}s)"
+            ).format(**metrics))
+            self._metrics["max_lag"] = 0.0
+
+    def _flush_acks(self):
+        """Mark processed events in mongo."""
+        self._last_ack = time.time()
+        if not self._acks:
+            return
+
+        acks, self._acks = self._acks, []
+        try:
+            self.dbcon.update_many(
+                {"_id": {"$in": acks}},
+                {"$set": {"pype_data.is_processed": True}}
+            )
+        except pymongo.errors.AutoReconnect:
+            self._on_mongo_error()
+
+        with self._pending_lock:
+            self._pending_ids.difference_update(acks)
+
+    def _on_mongo_error(self):
+        self.pypelog.error((
+            "Mongo server \"{}\" is not responding, exiting."
+        ).format(os.environ["OPENPYPE_MONGO"]))
+        sys.exit(0)
+
+    def cleanup_events(self):
+        """Remove processed events older than 3 days."""
+        self._last_cleanup = time.time()
         ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
-            [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
+    def _start_reader(self):
+        self._reader_stopped.clear()
+        self._reader_thread = threading.Thread(
+            target=self._read_stored_events
+        )
+        self._reader_thread.daemon = True
+        self._reader_thread.start()
 
-        found = False
-        for event_data in not_processed_events:
-            new_event_data = {
-                k: v for k, v in event_data.items()
-                if k not in ["_id", "pype_data"]
-            }
+    def _stop_reader(self):
+        self._reader_stopped.set()
+        if self._reader_thread is not None:
+            self._reader_thread.join()
+            self._reader_thread = None
+
+    def _read_stored_events(self):
+        """Add new stored events to queue until reader is stopped."""
+        try:
             try:
-                event = ftrack_api.event.base.Event(**new_event_data)
-                event["data"]["_event_mongo_id"] = event_data["_id"]
-            except Exception:
-                self.logger.exception(L(
-                    'Failed to convert payload into event: {0}',
+                self._watch_stored_events()
+                return
+            except pymongo.errors.AutoReconnect:
+                raise
+            except pymongo.errors.PyMongoError as exc:
+                self.pypelog.info((
+                    "Change streams are not available ({}),"
+                    " polling stored events."
+                ).format(exc))
+
+            while not self._reader_stopped.is_set():
+                if len(self._stored_events) or not self.load_events(100):
+                    self._reader_stopped.wait(self.poll_interval)
+
+        except pymongo.errors.AutoReconnect as exc:
+            self._reader_error = exc
+
+    def _watch_stored_events(self):
+        pipeline = [
+            {"$match": {"operationType": {"$in": ["insert", "replace"]}}}
+        ]
+        with self.dbcon.watch(pipeline, max_await_time_ms=500) as stream:
+            # Load events stored before stream was opened
+            self.load_events()
+            while not self._reader_stopped.is_set() and stream.alive:
+                change = stream.try_next()
+                if change is None:
+                    continue
+                event_data = change.get("fullDocument")
+                if (
                     event_data
-                ))
-                continue
-            found = True
-            self._event_queue.put(event)
+                    and not event_data["pype_data"]["is_processed"]
+                ):
+                    self._add_stored_event(event_data)
+
+    def load_events(self, limit=None):
+        """Load not processed events sorted by stored date.
+
+        Args:
+            limit (Optional[int]): Maximum number of loaded events.
+
+        Returns:
+            bool: Some events were added to queue.
+        """
 
+        with self._pending_lock:
+            pending_ids = list(self._pending_ids)
+
+        query = {"pype_data.is_processed": False}
+        if pending_ids:
+            query["_id"] = {"$nin": pending_ids}
+
+        not_processed_events = self.dbcon.find(query).sort(
+            [("pype_data.stored", pymongo.ASCENDING)]
+        )
+        if limit:
+            not_processed_events = not_processed_events.limit(limit)
+
+        found = False
+        for event_data in not_processed_events:
+            if self._add_stored_event(event_data):
+                found = True
         return found
 
+    def _add_stored_event(self, event_data):
+        mongo_id = event_data["_id"]
+        with self._pending_lock:
+            if mongo_id in self._pending_ids:
+                return False
+            self._pending_ids.add(mongo_id)
+
+        new_event_data = {
+            k: v for k, v in event_data.items()
+            if k not in ["_id", "pype_data"]
+        }
+        try:
+            event = ftrack_api.event.base.Event(**new_event_data)
+            event["data"]["_event_mongo_id"] = mongo_id
+        except Exception:
+            # Event stays in pending ids so it's not loaded again
+            self.logger.exception(L(
+                'Failed to convert payload into event: {0}',
+                event_data
+            ))
+            return False
+
+        self._stored_events.put(
+            get_event_project_id(event_data),
+            (event, event_data["pype_data"].get("stored"))
+        )
+        return True
+
     def _handle_packet(self, code, packet_identifier, path, data):
         """Override `_handle_packet` which skip events and extend heartbeat"""
         code_name = self._code_name_mapping[code]
@@ -227,6 +711,35 @@ class ProcessEventHub(SocketBaseEventHub):
         return super()._handle_packet(code, packet_identifier, path, data)
 
 
+class ProcessWorkerEventHub(ftrack_api.event.hub.EventHub):
+    """Event hub of event worker session which is not connected to server.
+
+    Events are not received by the hub, they're passed to '_handle' by event
+    worker. Events published by event handlers are sent to server using
+    connected event hub of event processor.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._parent_hub = kwargs.pop("parent_hub")
+        super(ProcessWorkerEventHub, self).__init__(*args, **kwargs)
+
+    def _publish(self, event, synchronous=False, callback=None, on_reply=None):
+        if synchronous:
+            return super(ProcessWorkerEventHub, self)._publish(
+                event, synchronous=synchronous
+            )
+
+        # Subscriptions of worker are not registered on server
+        if event["topic"].startswith("ftrack.meta."):
+            raise ftrack_api.exception.EventHubConnectionError(
+                "Event worker hub is not connected to server."
+            )
+
+        return self._parent_hub._publish(
+            event, callback=callback, on_reply=on_reply
+        )
+
+
 class CustomEventHubSession(ftrack_api.session.Session):
     '''An isolated session for interaction with an ftrack server.'''
     def __init__(
@@ -406,3 +919,13 @@ class SocketSession(CustomEventHubSession):
             self._api_key,
             sock=self.sock
         )
+
+
+class ProcessWorkerSession(CustomEventHubSession):
+    def _create_event_hub(self):
+        return ProcessWorkerEventHub(
+            self._server_url,
+            self._api_user,
+            self._api_key,
+            parent_hub=self.kwargs["parent_hub"]
+        )
@@ -3,6 +3,7 @@ import sys
 import signal
 import socket
 import datetime
+import functools
 
 import ftrack_api
 
@@ -10,6 +11,7 @@ from openpype_modules.ftrack.ftrack_server.ftrack_server import FtrackServer
 from openpype_modules.ftrack.ftrack_server.lib import (
     SocketSession,
     ProcessEventHub,
+    ProcessWorkerSession,
     TOPIC_STATUS_SERVER
 )
 from openpype.modules import ModulesManager
@@ -64,6 +66,14 @@ def register(session):
     )
 
 
+def create_worker_session(server, parent_session):
+    """Session with registered event handlers for an event worker."""
+    session = ProcessWorkerSession(parent_hub=parent_session.event_hub)
+    register(session)
+    server.register_handlers(session, server.handler_paths)
+    return session
+
+
 def main(args):
     log = Logger.get_logger("Event processor")
 
@@ -91,6 +101,10 @@ def main(args):
         server = FtrackServer(
             ftrack_module.server_event_handlers_paths
         )
+        # Events of different projects are processed in parallel by workers
+        session.event_hub.set_worker_session_factory(
+            functools.partial(create_worker_session, server, session)
+        )
         log.debug("Launched Ftrack Event processor")
         server.run_server(session)
 
@@ -1,4 +1,5 @@
 import json
+import collections
 
 from aiohttp.web_response import Response
 
@@ -34,6 +35,10 @@ class JobQueueResource:
 
     async def post_job(self, request):
         data = await request.json()
+        # List of jobs is created at once and ids are returned as list
+        if isinstance(data, list):
+            return self._post_jobs(data)
+
         host_name = data.get("host_name")
         if not host_name:
             return Response(
@@ -43,6 +48,33 @@ class JobQueueResource:
         job = self._job_queue.create_job(host_name, data)
         return Response(status=201, text=job.id)
 
+    def _post_jobs(self, jobs_data):
+        jobs_by_host_name = collections.defaultdict(list)
+        for idx, job_data in enumerate(jobs_data):
+            host_name = job_data.get("host_name")
+            if not host_name:
+                return Response(
+                    status=400,
+                    message=(
+                        "Key \"host_name\" not filled in job {}."
+                    ).format(idx)
+                )
+            jobs_by_host_name[host_name].append((idx, job_data))
+
+        job_ids = [None] * len(jobs_data)
+        for host_name, items in jobs_by_host_name.items():
+            jobs = self._job_queue.create_jobs(
+                host_name, [job_data for _, job_data in items]
+            )
+            for (idx, _), job in zip(items, jobs):
+                job_ids[idx] = job.id
+
+        return Response(
+            status=201,
+            body=self.encode(job_ids),
+            content_type="application/json"
+        )
+
     async def get_job(self, request):
         job_id = request.match_info["job_id"]
         content = self._job_queue.get_job_status(job_id)
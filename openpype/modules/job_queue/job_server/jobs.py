@@ -1,4 +1,6 @@
-import datetime
+import time
+import heapq
+import itertools
 import collections
 from uuid import uuid4
 
@@ -6,7 +8,14 @@ from uuid import uuid4
 class Job:
     """Job related to specific host name.
 
-    Data must contain everything needed to finish the job.
+    Data must contain everything needed to finish the job. Optional keys
+    of data define scheduling of the job:
+    - "priority" (int): Jobs with higher priority are assigned first.
+        Default is 0.
+    - "max_attempts" (int): How many times is job started before is marked
+        as failed. Default is 1.
+    - "timeout" (float): Seconds after which is started job considered as
+        failed. No timeout by default.
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
@@ -16,7 +25,7 @@ class Job:
             job_id = str(uuid4())
         self._id = job_id
         if created_time is None:
-            created_time = datetime.datetime.now()
+            created_time = time.time()
         self._created_time = created_time
         self._started_time = None
         self._done_time = None
@@ -24,6 +33,11 @@ class Job:
         self.data = data
         self._result_data = None
 
+        self.priority = int(data.get("priority") or 0)
+        self.max_attempts = max(int(data.get("max_attempts") or 1), 1)
+        self.timeout = data.get("timeout")
+        self._attempts = 0
+
         self._started = False
         self._done = False
         self._errored = False
@@ -36,9 +50,8 @@ class Job:
         if self._done_time is None:
             return True
 
-        now = datetime.datetime.now()
-        delta = now - self._done_time
-        return delta.days < self.keep_in_memory_days
+        delta = time.time() - self._done_time
+        return delta < self.keep_in_memory_days * 24 * 60 * 60
 
     @property
     def id(self):
@@ -48,6 +61,22 @@ class Job:
     def done(self):
         return self._done
 
+    @property
+    def attempts(self):
+        return self._attempts
+
+    @property
+    def started_time(self):
+        return self._started_time
+
+    @property
+    def worker(self):
+        return self._worker
+
+    def can_retry(self):
+        """Job can be started again after failed attempt."""
+        return not self._deleted and self._attempts < self.max_attempts
+
     def reset(self):
         self._started = False
         self._started_time = None
@@ -56,7 +85,7 @@ class Job:
         self._errored = False
         self._message = None
 
-        self._worker = None
+        self.set_worker(None)
 
     @property
     def started(self):
@@ -68,6 +97,7 @@ class Job:
 
     def set_deleted(self):
         self._deleted = True
+        self._done_time = time.time()
         self.set_worker(None)
 
     def set_worker(self, worker):
@@ -75,24 +105,36 @@ class Job:
             return
 
         if self._worker is not None:
-            self._worker.set_current_job(None)
+            self._worker.remove_job(self)
 
         self._worker = worker
         if worker is not None:
-            worker.set_current_job(self)
+            worker.add_job(self)
 
     def set_started(self):
-        self._started_time = datetime.datetime.now()
+        self._started_time = time.time()
         self._started = True
+        self._attempts += 1
 
     def set_done(self, success=True, message=None, data=None):
         self._done = True
-        self._done_time = datetime.datetime.now()
+        self._done_time = time.time()
         self._errored = not success
         self._message = message
         self._result_data = data
-        if self._worker is not None:
-            self._worker.set_current_job(None)
+        self.set_worker(None)
+
+    def get_state(self):
+        state = "waiting"
+        if self._deleted:
+            state = "deleted"
+        elif self._errored:
+            state = "error"
+        elif self._done:
+            state = "done"
+        elif self._started:
+            state = "started"
+        return state
 
     def status(self):
         worker_id = None
@@ -105,38 +147,99 @@ class Job:
         }
         output["message"] = self._message or None
 
-        state = "waiting"
-        if self._deleted:
-            state = "deleted"
-        elif self._errored:
-            state = "error"
-        elif self._done:
-            state = "done"
-        elif self._started:
-            state = "started"
-
         output["result"] = self._result_data
 
-        output["state"] = state
+        output["state"] = self.get_state()
+        output["priority"] = self.priority
+        output["attempts"] = self._attempts
 
         return output
 
+    def to_data(self):
+        """Job data which can be stored and used to recreate the job."""
+        return {
+            "id": self._id,
+            "host_name": self.host_name,
+            "data": self.data,
+            "state": self.get_state(),
+            "priority": self.priority,
+            "attempts": self._attempts,
+            "created": self._created_time,
+            "started_time": self._started_time,
+            "done_time": self._done_time,
+            "message": self._message,
+            "result": self._result_data,
+        }
+
+    @classmethod
+    def from_data(cls, job_data):
+        """Recreate job from data created by 'to_data'."""
+        job = cls(
+            job_data["host_name"],
+            job_data["data"],
+            job_data["id"],
+            job_data["created"]
+        )
+        state = job_data["state"]
+        job._attempts = job_data["attempts"]
+        job._started_time = job_data["started_time"]
+        job._done_time = job_data["done_time"]
+        job._message = job_data["message"]
+        job._result_data = job_data["result"]
+        job._started = state != "waiting"
+        job._done = state in ("done", "error")
+        job._errored = state == "error"
+        job._deleted = state == "deleted"
+        return job
+
 
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
     Also asign jobs to a worker.
+
+    Waiting jobs are in priority queue per host name and workers with free
+    slots are tracked per host name, so assignment touches only hosts with
+    waiting jobs. Changes of jobs are written to store if is passed.
+
+    Args:
+        store (Optional[JobStore]): Durable storage of jobs.
     """
     old_jobs_check_minutes_interval = 30
-
-    def __init__(self):
-        self._last_old_jobs_check = datetime.datetime.now()
+    # Jobs of hosts without workers are not failed until workers have time
+    #   to connect after server start
+    workers_wait_seconds = 60
+
+    def __init__(self, store=None):
+        self._store = store
+        self._started_time = time.time()
+        self._last_old_jobs_check = time.time()
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        self._job_queue_by_host_name = collections.defaultdict(list)
+        self._queue_counter = itertools.count()
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._free_workers_by_host_name = collections.defaultdict(
+            collections.OrderedDict
+        )
+        self._started_jobs = {}
+        self._assigned_jobs = []
+        self._changed_jobs = {}
+
+        if store is not None:
+            self._restore_jobs()
+
+    def _restore_jobs(self):
+        """Load unfinished jobs from store and add them to queue."""
+        for job_data in self._store.get_jobs(("waiting", "started")):
+            job = Job.from_data(job_data)
+            self._jobs_by_id[job.id] = job
+            # Workers are not connected, start the job again
+            job.reset()
+            self._enqueue(job)
+
+        if self._jobs_by_id:
+            print("Restored {} jobs".format(len(self._jobs_by_id)))
 
     def workers(self):
         """All currently registered workers."""
@@ -147,81 +250,169 @@ class JobQueue:
         print("Added new worker for \"{}\"".format(host_name))
         self._workers_by_id[worker.id] = worker
         self._workers_by_host_name[host_name].append(worker)
+        self._update_free_worker(worker)
 
     def get_worker(self, worker_id):
         return self._workers_by_id.get(worker_id)
 
     def remove_worker(self, worker):
-        # Look if worker had assigned job to do
-        job = worker.current_job
-        if job is not None and not job.done:
-            # Reset job
-            job.set_worker(None)
-            job.reset()
-            # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
+        # Look if worker had assigned jobs to do
+        for job in tuple(worker.current_jobs):
+            if not job.done:
+                # Add job back to queue
+                self._requeue(job)
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
         host_name = worker.host_name
         if worker in self._workers_by_host_name[host_name]:
             self._workers_by_host_name[host_name].remove(worker)
+        self._free_workers_by_host_name[host_name].pop(worker.id, None)
+        self._assigned_jobs = [
+            (_worker, job)
+            for _worker, job in self._assigned_jobs
+            if _worker is not worker
+        ]
+        self._flush_changes()
 
         print("Removed worker for \"{}\"".format(host_name))
 
     def assign_jobs(self):
-        """Try to assign job for each idle worker.
+        """Try to assign jobs to free slots of workers.
 
         Error all jobs without needed worker.
         """
-        available_host_names = set()
-        for worker in self._workers_by_id.values():
-            host_name = worker.host_name
-            available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
-                        break
-
+        self._check_timeouts()
         for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
+            if not self._workers_by_host_name.get(host_name):
+                wait_time = time.time() - self._started_time
+                if wait_time > self.workers_wait_seconds:
+                    self._fail_host_jobs(host_name)
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
-            message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
-                if not job.deleted:
-                    job.set_done(False, message)
+            free_workers = self._free_workers_by_host_name[host_name]
+            while free_workers:
+                job = self._pop_job(host_name)
+                if job is None:
+                    break
+                # Take worker from start and put it to the end if has more
+                #   free slots to spread jobs across workers
+                _, worker = free_workers.popitem(last=False)
+                job.set_worker(worker)
+                self._assigned_jobs.append((worker, job))
+                self._update_free_worker(worker)
+
         self._remove_old_jobs()
+        self._flush_changes()
+
+    def pop_assigned_jobs(self):
+        """Jobs assigned to workers which should be sent to them.
+
+        Returns:
+            list[tuple[Worker, Job]]: Worker and job assigned to it.
+        """
+
+        assigned_jobs = [
+            (worker, job)
+            for worker, job in self._assigned_jobs
+            if job.worker is worker
+        ]
+        self._assigned_jobs = []
+        return assigned_jobs
+
+    def job_sent(self, job, success):
+        """Job was sent to worker.
+
+        Args:
+            job (Job): Job which was sent.
+            success (bool): Worker accepted the job.
+        """
+
+        if job.worker is None:
+            return
+
+        if success:
+            job.set_started()
+            self._started_jobs[job.id] = job
+            self._changed_jobs[job.id] = job
+        else:
+            # Worker is busy, job will be assigned again
+            self._requeue(job)
+        self._flush_changes()
+
+    def job_done(
+        self, job_id, success, message=None, data=None, worker_id=None
+    ):
+        """Worker finished a job.
+
+        Failed job is added back to queue if can be retried.
+
+        Args:
+            job_id (str): Id of finished job.
+            success (bool): Job finished successfully.
+            message (Optional[str]): Message of the result.
+            data (Optional[Any]): Result data.
+            worker_id (Optional[str]): Id of worker reporting the result.
+                Report is ignored if job is not assigned to the worker,
+                e.g. timed out job which was assigned to other worker.
+
+        Returns:
+            bool: Report was accepted.
+        """
+
+        job = self._jobs_by_id.get(job_id)
+        if job is None:
+            return False
+
+        worker = job.worker
+        if worker_id is not None and (
+            worker is None or worker.id != worker_id
+        ):
+            print((
+                "Ignored result of job \"{}\" from worker \"{}\" which"
+                " is not assigned to the job"
+            ).format(job_id, worker_id))
+            return False
+
+        self._started_jobs.pop(job.id, None)
+        if not success and job.can_retry():
+            print("Job \"{}\" failed, retrying: {}".format(job.id, message))
+            self._requeue(job)
+        else:
+            job.set_done(success, message, data)
+            self._changed_jobs[job.id] = job
+
+        if worker is not None:
+            self._update_free_worker(worker)
+        self._flush_changes()
+        return True
 
     def get_jobs(self):
         return self._jobs_by_id.values()
 
     def get_job(self, job_id):
         """Job by it's id."""
-        return self._jobs_by_id.get(job_id)
+        job = self._jobs_by_id.get(job_id)
+        if job is None and self._store is not None:
+            job_data = self._store.get_job(job_id)
+            if job_data is not None:
+                job = Job.from_data(job_data)
+        return job
 
     def create_job(self, host_name, job_data):
         """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
-        self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
-        return job
-
-    def _remove_old_jobs(self):
-        """Once in specific time look if should remove old finished jobs."""
-        delta = datetime.datetime.now() - self._last_old_jobs_check
-        if delta.seconds < self.old_jobs_check_minutes_interval:
-            return
-
-        for job_id in tuple(self._jobs_by_id.keys()):
-            job = self._jobs_by_id[job_id]
-            if not job.keep_in_memory():
-                self._jobs_by_id.pop(job_id)
+        return self.create_jobs(host_name, [job_data])[0]
+
+    def create_jobs(self, host_name, jobs_data):
+        """Create new jobs from passed data and add them to queue."""
+        jobs = []
+        for job_data in jobs_data:
+            job = Job(host_name, job_data)
+            self._jobs_by_id[job.id] = job
+            self._enqueue(job)
+            jobs.append(job)
+        self._flush_changes()
+        return jobs
 
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
@@ -229,12 +420,105 @@ class JobQueue:
         if job is None:
             return
 
+        worker = job.worker
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        self._started_jobs.pop(job.id, None)
+        self._changed_jobs[job.id] = job
+        if worker is not None:
+            self._update_free_worker(worker)
+        self._flush_changes()
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
-        job = self._jobs_by_id.get(job_id)
+        job = self.get_job(job_id)
         if job is None:
             return {}
         return job.status()
+
+    def _enqueue(self, job):
+        heapq.heappush(
+            self._job_queue_by_host_name[job.host_name],
+            (-job.priority, next(self._queue_counter), job)
+        )
+        self._changed_jobs[job.id] = job
+
+    def _pop_job(self, host_name):
+        queue = self._job_queue_by_host_name.get(host_name)
+        while queue:
+            job = heapq.heappop(queue)[-1]
+            if not job.deleted:
+                if not queue:
+                    self._job_queue_by_host_name.pop(host_name)
+                return job
+
+        self._job_queue_by_host_name.pop(host_name, None)
+        return None
+
+    def _requeue(self, job):
+        worker = job.worker
+        self._started_jobs.pop(job.id, None)
+        job.reset()
+        self._enqueue(job)
+        if worker is not None:
+            self._update_free_worker(worker)
+
+    def _update_free_worker(self, worker):
+        free_workers = self._free_workers_by_host_name[worker.host_name]
+        free_workers.pop(worker.id, None)
+        if worker.id in self._workers_by_id and worker.free_slots() > 0:
+            free_workers[worker.id] = worker
+
+    def _fail_host_jobs(self, host_name):
+        message = ("Not available workers for \"{}\"").format(host_name)
+        while True:
+            job = self._pop_job(host_name)
+            if job is None:
+                break
+            job.set_done(False, message)
+            self._changed_jobs[job.id] = job
+
+    def _check_timeouts(self):
+        now = time.time()
+        for job in tuple(self._started_jobs.values()):
+            if not job.timeout or now - job.started_time < job.timeout:
+                continue
+
+            worker = job.worker
+            self._started_jobs.pop(job.id)
+            if job.can_retry():
+                print("Job \"{}\" timed out, retrying".format(job.id))
+                self._requeue(job)
+            else:
+                job.set_done(False, "Job timed out")
+                self._changed_jobs[job.id] = job
+
+            if worker is not None:
+                self._update_free_worker(worker)
+
+    def _flush_changes(self):
+        """Write changed jobs to store."""
+        if not self._changed_jobs:
+            return
+
+        jobs = list(self._changed_jobs.values())
+        self._changed_jobs = {}
+        if self._store is not None:
+            self._store.save_jobs(job.to_data() for job in jobs)
+
+    def _remove_old_jobs(self):
+        """Once in specific time look if should remove old finished jobs."""
+        delta = time.time() - self._last_old_jobs_check
+        if delta < self.old_jobs_check_minutes_interval * 60:
+            return
+
+        self._last_old_jobs_check = time.time()
+        for job_id in tuple(self._jobs_by_id.keys()):
+            job = self._jobs_by_id[job_id]
+            if not job.keep_in_memory():
+                self._jobs_by_id.pop(job_id)
+
+        if self._store is not None:
+            self._store.remove_done_jobs(
+                time.time() - Job.keep_in_memory_days * 24 * 60 * 60
+            )
@@ -5,6 +5,7 @@ import logging
 from aiohttp import web
 
 from .jobs import JobQueue
+from .store import JobStore
 from .job_queue_route import JobQueueResource
 from .workers_rpc_route import WorkerRpc
 
@@ -13,7 +14,7 @@ log = logging.getLogger(__name__)
 
 class WebServerManager:
     """Manger that care about web server thread."""
-    def __init__(self, port, host, loop=None):
+    def __init__(self, port, host, loop=None, jobs_db=None):
         self.port = port
         self.host = host
         self.app = web.Application()
@@ -21,7 +22,7 @@ class WebServerManager:
             loop = asyncio.new_event_loop()
 
         # add route with multiple methods for single "external app"
-        self.webserver_thread = WebServerThread(self, loop)
+        self.webserver_thread = WebServerThread(self, loop, jobs_db)
 
     @property
     def url(self):
@@ -61,7 +62,7 @@ class WebServerManager:
 
 class WebServerThread(threading.Thread):
     """ Listener for requests in thread."""
-    def __init__(self, manager, loop):
+    def __init__(self, manager, loop, jobs_db=None):
         super(WebServerThread, self).__init__()
 
         self._is_running = False
@@ -71,7 +72,9 @@ class WebServerThread(threading.Thread):
         self.runner = None
         self.site = None
 
-        job_queue = JobQueue()
+        self.job_store = JobStore(jobs_db)
+        log.info("Jobs are stored to \"{}\"".format(self.job_store.path))
+        job_queue = JobQueue(self.job_store)
         self.job_queue_route = JobQueueResource(job_queue, manager)
         self.workers_route = WorkerRpc(job_queue, manager, loop=loop)
 
@@ -108,6 +111,7 @@ class WebServerThread(threading.Thread):
             )
         finally:
             self.loop.close()
+            self.job_store.close()
 
         self._is_running = False
         log.info("Web server stopped")
@@ -0,0 +1,160 @@
+import os
+import json
+import sqlite3
+import threading
+
+import appdirs
+
+
+def get_default_store_path():
+    """Default path to database file of jobs."""
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "job_queue",
+        "jobs.db"
+    )
+
+
+class JobStore:
+    """Durable storage of jobs in SQLite database.
+
+    Jobs are stored as rows with serialized data so queued and running jobs
+    can be restored when server is restarted.
+
+    Args:
+        path (Optional[str]): Path to database file. Default path in user
+            data directory is used if not passed. Use ":memory:" for
+            in-memory database.
+    """
+
+    columns = (
+        "id",
+        "host_name",
+        "state",
+        "priority",
+        "created",
+        "done",
+        "data",
+    )
+
+    def __init__(self, path=None):
+        if path is None:
+            path = get_default_store_path()
+
+        if path != ":memory:":
+            dirpath = os.path.dirname(os.path.abspath(path))
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            cursor = self._connection.cursor()
+            if path != ":memory:":
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY,"
+                " host_name TEXT NOT NULL,"
+                " state TEXT NOT NULL,"
+                " priority INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " done REAL,"
+                " data TEXT NOT NULL"
+                ")"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state)"
+            )
+            self._connection.commit()
+
+    @property
+    def path(self):
+        return self._path
+
+    def save_jobs(self, jobs_data):
+        """Insert or update jobs in one transaction.
+
+        Args:
+            jobs_data (Iterable[dict[str, Any]]): Data of jobs created by
+                'Job.to_data'.
+        """
+
+        rows = [
+            (
+                job_data["id"],
+                job_data["host_name"],
+                job_data["state"],
+                job_data["priority"],
+                job_data["created"],
+                job_data["done_time"],
+                json.dumps(job_data),
+            )
+            for job_data in jobs_data
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO jobs ({}) VALUES ({})".format(
+                    ", ".join(self.columns),
+                    ", ".join("?" for _ in self.columns)
+                ),
+                rows
+            )
+            self._connection.commit()
+
+    def get_job(self, job_id):
+        """Data of job by id.
+
+        Returns:
+            Union[dict[str, Any], None]: Job data or None if not found.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM jobs WHERE id = ?", (job_id, )
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def get_jobs(self, states):
+        """Data of jobs with passed states ordered by creation.
+
+        Args:
+            states (Iterable[str]): Job states.
+
+        Returns:
+            list[dict[str, Any]]: Jobs data.
+        """
+
+        states = list(states)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM jobs WHERE state IN ({})"
+                " ORDER BY created".format(", ".join("?" for _ in states)),
+                states
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def remove_done_jobs(self, before):
+        """Remove jobs finished before a time.
+
+        Args:
+            before (float): Timestamp.
+        """
+
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM jobs WHERE done IS NOT NULL AND done < ?",
+                (before, )
+            )
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
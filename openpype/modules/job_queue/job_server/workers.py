@@ -11,25 +11,35 @@ class WorkerState:
 
 
 class Worker:
-    """Worker that can handle jobs of specific host."""
-    def __init__(self, host_name, http_request):
+    """Worker that can handle jobs of specific host.
+
+    Worker can work on multiple jobs at once if has more slots.
+    """
+    def __init__(self, host_name, http_request, slots=1):
         self._id = None
         self.host_name = host_name
         self._http_request = http_request
         self._state = WorkerState.IDLE
-        self._job = None
+        self._slots = max(int(slots or 1), 1)
+        self._jobs = []
+        self._sent_job_ids = set()
 
         # Give ability to send requests to worker
         http_request.request_id = str(uuid4())
         http_request.pending_requests = {}
 
-    async def send_job(self):
-        if self._job is not None:
+    async def send_job(self, job=None):
+        if job is None:
+            job = self.current_job
+
+        if job is not None and job in self._jobs:
             data = {
-                "job_id": self._job.id,
+                "job_id": job.id,
                 "worker_id": self.id,
-                "data": self._job.data
+                "data": job.data
             }
+            self._sent_job_ids.add(job.id)
+            self._state = WorkerState.JOB_SENT
             return await self.call("start_job", data)
         return False
 
@@ -74,9 +84,22 @@ class Worker:
     def state(self):
         return self._state
 
+    @property
+    def slots(self):
+        return self._slots
+
+    def free_slots(self):
+        return self._slots - len(self._jobs)
+
+    @property
+    def current_jobs(self):
+        return list(self._jobs)
+
     @property
     def current_job(self):
-        return self._job
+        if self._jobs:
+            return self._jobs[0]
+        return None
 
     @property
     def http_request(self):
@@ -103,19 +126,39 @@ class Worker:
     def is_working(self):
         return self._state is WorkerState.JOB_SENT
 
-    def set_current_job(self, job):
-        if job is self._job:
+    def add_job(self, job):
+        if job in self._jobs:
             return
 
-        self._job = job
-        if job is None:
+        self._jobs.append(job)
+        if self._state is WorkerState.IDLE:
+            self._state = WorkerState.JOB_ASSIGNED
+        job.set_worker(self)
+
+    def remove_job(self, job):
+        if job not in self._jobs:
+            return
+
+        self._jobs.remove(job)
+        self._sent_job_ids.discard(job.id)
+        if not self._jobs:
             self._set_idle()
-        else:
+        elif not self._sent_job_ids:
             self._state = WorkerState.JOB_ASSIGNED
-            job.set_worker(self)
+        job.set_worker(None)
+
+    def set_current_job(self, job):
+        """Backwards compatible way to set single job of worker."""
+        for current_job in tuple(self._jobs):
+            if current_job is not job:
+                self.remove_job(current_job)
+
+        if job is not None:
+            self.add_job(job)
 
     def _set_idle(self):
-        self._job = None
+        self._jobs = []
+        self._sent_job_ids = set()
         self._state = WorkerState.IDLE
 
     def set_working(self):
@@ -30,8 +30,8 @@ class WorkerRpc(JsonRpc):
         )
 
     # Panel routes for tools
-    async def register_worker(self, request, host_name):
-        worker = Worker(host_name, request.http_request)
+    async def register_worker(self, request, host_name, slots=1):
+        worker = Worker(host_name, request.http_request, slots)
         self._job_queue.add_worker(worker)
         return worker.id
 
@@ -49,24 +49,32 @@ class WorkerRpc(JsonRpc):
             await asyncio.sleep(5)
 
     async def job_done(self, worker_id, job_id, success, message, data):
-        worker = self._job_queue.get_worker(worker_id)
-        if worker is not None:
-            worker.set_current_job(None)
-
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
-        return True
+        return self._job_queue.job_done(
+            job_id, success, message, data, worker_id
+        )
 
     async def send_jobs(self):
-        invalid_workers = []
-        for worker in self._job_queue.workers():
-            if worker.job_assigned() and not worker.is_working():
-                try:
-                    await worker.send_job()
+        assigned_jobs = self._job_queue.pop_assigned_jobs()
+        if not assigned_jobs:
+            return
 
-                except ConnectionResetError:
+        results = await asyncio.gather(
+            *[worker.send_job(job) for worker, job in assigned_jobs],
+            return_exceptions=True
+        )
+        invalid_workers = []
+        for (worker, job), result in zip(assigned_jobs, results):
+            if isinstance(result, ConnectionResetError):
+                if worker not in invalid_workers:
                     invalid_workers.append(worker)
+                continue
+
+            if isinstance(result, BaseException):
+                self.logger.warning(
+                    "Failed to send job to worker", exc_info=result
+                )
+                result = False
+            self._job_queue.job_sent(job, bool(result))
 
         for worker in invalid_workers:
             self._job_queue.remove_worker(worker)
@@ -1,5 +1,6 @@
 import sys
 import datetime
+import collections
 import asyncio
 import traceback
 
@@ -7,36 +8,45 @@ from aiohttp_json_rpc import JsonRpcClient
 
 
 class WorkerClient(JsonRpcClient):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, slots=1, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.add_methods(
             ("", self.start_job),
         )
-        self.current_job = None
+        self.current_jobs = collections.OrderedDict()
+        self._slots = slots
         self._id = None
 
+    @property
+    def current_job(self):
+        """First job in progress."""
+        for job_data in self.current_jobs.values():
+            return job_data
+        return None
+
     def set_id(self, worker_id):
         self._id = worker_id
 
     async def start_job(self, job_data):
-        if self.current_job is not None:
+        if len(self.current_jobs) >= self._slots:
             return False
 
         print("Got new job {}".format(str(job_data)))
-        self.current_job = job_data
+        self.current_jobs[job_data["job_id"]] = job_data
         return True
 
-    def finish_job(self, success, message, data):
+    def finish_job(self, success, message, data, job_id=None):
         asyncio.ensure_future(
-            self._finish_job(success, message, data),
+            self._finish_job(success, message, data, job_id),
             loop=self._loop
         )
 
-    async def _finish_job(self, success, message, data):
-        print("Current job", self.current_job)
-        job_id = self.current_job["job_id"]
-        self.current_job = None
+    async def _finish_job(self, success, message, data, job_id=None):
+        if job_id is None:
+            job_id = self.current_job["job_id"]
+        job_data = self.current_jobs.pop(job_id, None)
+        print("Finished job", job_data)
 
         return await self.call(
             "job_done", [self._id, job_id, success, message, data]
@@ -50,12 +60,16 @@ class WorkerJobsConnection:
 
     To be able receive jobs is needed to create a connection and then register
     as worker for specific host.
+
+    Worker with more slots receives multiple jobs at once. Jobs are then
+    finished by passing their id to 'finish_job'.
     """
     retry_time_seconds = 5
 
-    def __init__(self, server_url, host_name, loop=None):
+    def __init__(self, server_url, host_name, loop=None, slots=1):
         self.client = None
         self._loop = loop
+        self._slots = slots
 
         self._host_name = host_name
         self._server_url = server_url
@@ -79,15 +93,24 @@ class WorkerJobsConnection:
             return self.client.current_job
         return None
 
-    def finish_job(self, success=True, message=None, data=None):
-        """Worker finished job and sets the result which is send to server."""
+    @property
+    def current_jobs(self):
+        if self.client is not None:
+            return list(self.client.current_jobs.values())
+        return []
+
+    def finish_job(self, success=True, message=None, data=None, job_id=None):
+        """Worker finished job and sets the result which is send to server.
+
+        Job id must be passed if worker has more slots.
+        """
         if self.client is None:
             print((
                 "Couldn't sent job status to server because"
                 " client is not connected."
             ))
         else:
-            self.client.finish_job(success, message, data)
+            self.client.finish_job(success, message, data, job_id)
 
     async def main_loop(self, register_worker=True):
         """Main loop of connection which keep connection to server alive."""
@@ -111,7 +134,7 @@ class WorkerJobsConnection:
         self._is_running = False
 
     async def _connect(self):
-        self.client = WorkerClient()
+        self.client = WorkerClient(slots=self._slots)
         print("Connecting to {}".format(self._server_url))
         try:
             await self.client.connect_url(self._server_url)
@@ -170,7 +193,7 @@ class WorkerJobsConnection:
 
     async def _register_as_worker(self):
         worker_id = await self.client.call(
-            "register_worker", [self._host_name]
+            "register_worker", [self._host_name, self._slots]
         )
         self.client.set_id(worker_id)
         print(
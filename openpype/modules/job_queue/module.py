@@ -27,6 +27,15 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- jobs are stored to SQLite database so are not lost on server restart, path
+    to database file can be specified with '--jobs_db' (default is in user
+    data directory)
+
+### Job scheduling
+- jobs with higher "priority" in job data are assigned first
+- failed or timed out jobs are started again until "max_attempts" is reached
+- started job fails after "timeout" seconds if is set
+- worker can register with more slots to work on multiple jobs at once
 
 ### start_worker
 - start worker which will process jobs
@@ -146,6 +155,22 @@ class JobQueueModule(OpenPypeModule):
         post_request = requests.post(api_path, data=json.dumps(job_data))
         return str(post_request.content.decode())
 
+    def send_jobs(self, host_name, jobs_data):
+        """Send multiple jobs in one request.
+
+        Returns:
+            list[str]: Ids of created jobs.
+        """
+        import requests
+
+        jobs_data = [
+            dict(job_data or {}, host_name=host_name)
+            for job_data in jobs_data
+        ]
+        api_path = "{}/api/jobs".format(self._server_url)
+        post_request = requests.post(api_path, data=json.dumps(jobs_data))
+        return post_request.json()
+
     def get_job_status(self, job_id):
         import requests
 
@@ -165,10 +190,10 @@ class JobQueueModule(OpenPypeModule):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(cls, port=None, host=None, jobs_db=None):
         from .job_server import main
 
-        return main(port, host)
+        return main(port, host, jobs_db)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -227,8 +252,12 @@ def cli_main():
 )
 @click.option("--port", help="Server port")
 @click.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueModule.start_server(port, host)
+@click.option(
+    "--jobs_db",
+    help="Path to database file where jobs are stored."
+)
+def cli_start_server(port, host, jobs_db):
+    JobQueueModule.start_server(port, host, jobs_db)
 
 
 @cli_main.command(
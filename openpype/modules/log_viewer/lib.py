@@ -0,0 +1,226 @@
+import pymongo
+
+# Number of log records loaded at once
+LOGS_PAGE_SIZE = 500
+# Maximum number of processes shown at once
+MAX_PROCESSES = 1000
+
+PROCESS_KEYS = (
+    "hostname", "hostip", "username", "system_name", "process_name"
+)
+LOG_KEYS = (
+    "timestamp", "level", "thread", "threadName", "message", "loggerName",
+    "fileName", "module", "method", "lineNumber", "exception"
+)
+
+
+class LogsQuery:
+    """Queries of log collection for log viewer.
+
+    Process summaries are aggregated in database and log records of a
+    process are loaded in pages, so the whole collection is never loaded
+    to memory.
+
+    Args:
+        collection (pymongo.collection.Collection): Log collection.
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def ensure_indexes(self):
+        """Create indexes used by queries if are not created yet."""
+
+        self._collection.create_index(
+            [("process_id", pymongo.ASCENDING),
+             ("timestamp", pymongo.ASCENDING)],
+            name="process_id_timestamp"
+        )
+        self._collection.create_index(
+            [("timestamp", pymongo.DESCENDING)],
+            name="timestamp"
+        )
+
+    def get_distinct_values(self, key):
+        """Distinct values of a key in log records.
+
+        Args:
+            key (str): Key of log record.
+
+        Returns:
+            list[Any]: Values without empty values.
+        """
+
+        return [
+            value
+            for value in self._collection.distinct(key)
+            if value
+        ]
+
+    def get_processes(
+        self,
+        usernames=None,
+        hostnames=None,
+        start=None,
+        end=None,
+        limit=None
+    ):
+        """Summaries of processes which logged records.
+
+        Args:
+            usernames (Optional[Iterable[str]]): Filter by usernames.
+            hostnames (Optional[Iterable[str]]): Filter by hostnames.
+            start (Optional[datetime.datetime]): Records logged after.
+            end (Optional[datetime.datetime]): Records logged before.
+            limit (Optional[int]): Maximum number of processes.
+
+        Returns:
+            list[dict[str, Any]]: Process summaries sorted by start time
+                from the most recent. Each contain process data, 'started',
+                'last_log' and 'logs_count'.
+        """
+
+        if limit is None:
+            limit = MAX_PROCESSES
+
+        match = {"process_id": {"$ne": None}}
+        if usernames is not None:
+            match["username"] = {"$in": list(usernames)}
+        if hostnames is not None:
+            match["hostname"] = {"$in": list(hostnames)}
+        timestamp_filter = {}
+        if start is not None:
+            timestamp_filter["$gte"] = start
+        if end is not None:
+            timestamp_filter["$lte"] = end
+        if timestamp_filter:
+            match["timestamp"] = timestamp_filter
+
+        group = {
+            "_id": "$process_id",
+            "started": {"$min": "$timestamp"},
+            "last_log": {"$max": "$timestamp"},
+            "logs_count": {"$sum": 1},
+        }
+        for key in PROCESS_KEYS:
+            group[key] = {"$first": "${}".format(key)}
+
+        pipeline = [
+            {"$match": match},
+            {"$group": group},
+            {"$sort": {"started": pymongo.DESCENDING}},
+            {"$limit": limit},
+        ]
+        output = []
+        for doc in self._collection.aggregate(pipeline, allowDiskUse=True):
+            doc["process_id"] = doc.pop("_id")
+            output.append(doc)
+        return output
+
+    def get_process_logs(
+        self, process_id, after=None, limit=None, levels=None
+    ):
+        """Page of log records of a process sorted by time.
+
+        Args:
+            process_id (ObjectId): Process id.
+            after (Optional[tuple[datetime.datetime, ObjectId]]): Timestamp
+                and id of last record of previous page.
+            limit (Optional[int]): Maximum number of records.
+            levels (Optional[Iterable[str]]): Filter by levels of records.
+
+        Returns:
+            list[dict[str, Any]]: Log records.
+        """
+
+        if limit is None:
+            limit = LOGS_PAGE_SIZE
+
+        query_filter = {"process_id": process_id}
+        if levels is not None:
+            query_filter["level"] = {"$in": list(levels)}
+        if after is not None:
+            timestamp, log_id = after
+            query_filter["$or"] = [
+                {"timestamp": {"$gt": timestamp}},
+                {"timestamp": timestamp, "_id": {"$gt": log_id}},
+            ]
+
+        projection = {key: True for key in LOG_KEYS}
+        return list(
+            self._collection.find(query_filter, projection)
+            .sort([
+                ("timestamp", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ])
+            .limit(limit)
+        )
+
+
+class ProcessLogsPager:
+    """Load log records of a process page by page.
+
+    Args:
+        logs_query (LogsQuery): Query object.
+        process_id (ObjectId): Process id.
+        page_size (Optional[int]): Number of records in a page.
+        levels (Optional[Iterable[str]]): Load only records with levels.
+    """
+
+    def __init__(self, logs_query, process_id, page_size=None, levels=None):
+        if page_size is None:
+            page_size = LOGS_PAGE_SIZE
+        if levels is not None:
+            levels = set(levels)
+        self._logs_query = logs_query
+        self._process_id = process_id
+        self._page_size = page_size
+        self._levels = levels
+        self._last_key = None
+        self._finished = False
+
+    @property
+    def process_id(self):
+        return self._process_id
+
+    @property
+    def finished(self):
+        """All records were loaded."""
+        return self._finished
+
+    def reset(self):
+        """Load records from the first page again."""
+        self._last_key = None
+        self._finished = False
+
+    def set_levels(self, levels):
+        """Change levels of loaded records and reset the pager.
+
+        Args:
+            levels (Optional[Iterable[str]]): Levels of records, all
+                records are loaded if is None.
+        """
+        if levels is not None:
+            levels = set(levels)
+        self._levels = levels
+        self.reset()
+
+    def next_page(self):
+        """Load next page of log records.
+
+        Returns:
+            list[dict[str, Any]]: Log records, empty if all were loaded.
+        """
+
+        if self._finished:
+            return []
+
+        logs = self._logs_query.get_process_logs(
+            self._process_id, self._last_key, self._page_size, self._levels
+        )
+        if len(logs) < self._page_size:
+            self._finished = True
+        if logs:
+            last_log = logs[-1]
+            self._last_key = (last_log["timestamp"], last_log["_id"])
+        return logs
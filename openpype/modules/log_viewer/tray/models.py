@@ -1,7 +1,8 @@
-import collections
 from qtpy import QtCore, QtGui
 from openpype.lib import Logger
 
+from ..lib import LogsQuery, ProcessLogsPager
+
 
 class LogModel(QtGui.QStandardItemModel):
     COLUMNS = (
@@ -21,24 +22,16 @@ class LogModel(QtGui.QStandardItemModel):
         "system_name": "System name",
         "started": "Started at"
     }
-    process_keys = (
-        "process_id", "hostname", "hostip",
-        "username", "system_name", "process_name"
-    )
-    log_keys = (
-        "timestamp", "level", "thread", "threadName", "message", "loggerName",
-        "fileName", "module", "method", "lineNumber"
-    )
     default_value = "- Not set -"
 
-    ROLE_LOGS = QtCore.Qt.UserRole + 2
     ROLE_PROCESS_ID = QtCore.Qt.UserRole + 3
 
     def __init__(self, parent=None):
         super(LogModel, self).__init__(parent)
 
-        self.log_by_process = None
         self.dbcon = None
+        self.logs_query = None
+        self._filters = {}
 
         # Crash if connection is not possible to skip this module
         if not Logger.initialized:
@@ -49,6 +42,8 @@ class LogModel(QtGui.QStandardItemModel):
             Logger.bootstrap_mongo_log()
             database = connection[Logger.log_database_name]
             self.dbcon = database[Logger.log_collection_name]
+            self.logs_query = LogsQuery(self.dbcon)
+            self.logs_query.ensure_indexes()
 
     def headerData(self, section, orientation, role):
         if (
@@ -61,78 +56,53 @@ class LogModel(QtGui.QStandardItemModel):
 
         super(LogModel, self).headerData(section, orientation, role)
 
-    def add_process_logs(self, process_logs):
+    def get_distinct_values(self, key):
+        if self.logs_query is None:
+            return []
+        return self.logs_query.get_distinct_values(key)
+
+    def set_filters(
+        self, usernames=None, hostnames=None, start=None, end=None
+    ):
+        """Filters used on refresh.
+
+        Args:
+            usernames (Optional[Iterable[str]]): Show only these users.
+            hostnames (Optional[Iterable[str]]): Show only these hosts.
+            start (Optional[datetime.datetime]): Logged after.
+            end (Optional[datetime.datetime]): Logged before.
+        """
+
+        self._filters = {
+            "usernames": usernames,
+            "hostnames": hostnames,
+            "start": start,
+            "end": end,
+        }
+
+    def create_logs_pager(self, process_id):
+        """Pager loading log records of a process."""
+        return ProcessLogsPager(self.logs_query, process_id)
+
+    def add_process(self, process_info):
         items = []
         first_item = True
         for key in self.COLUMNS:
-            display_value = str(process_logs[key])
+            display_value = str(process_info.get(key) or self.default_value)
             item = QtGui.QStandardItem(display_value)
             if first_item:
                 first_item = False
-                item.setData(process_logs["_logs"], self.ROLE_LOGS)
-                item.setData(process_logs["process_id"], self.ROLE_PROCESS_ID)
+                item.setData(process_info["process_id"], self.ROLE_PROCESS_ID)
             items.append(item)
         self.appendRow(items)
 
     def refresh(self):
-        self.log_by_process = collections.defaultdict(list)
-        self.process_info = {}
-
         self.clear()
         self.beginResetModel()
-        if self.dbcon:
-            result = self.dbcon.find({})
-            for item in result:
-                process_id = item.get("process_id")
-                # backwards (in)compatibility
-                if not process_id:
-                    continue
-
-                if process_id not in self.process_info:
-                    proc_dict = {"_logs": []}
-                    for key in self.process_keys:
-                        proc_dict[key] = (
-                            item.get(key) or self.default_value
-                        )
-                    self.process_info[process_id] = proc_dict
-
-                log_item = {}
-                for key in self.log_keys:
-                    log_item[key] = item.get(key) or self.default_value
-
-                if "exception" in item:
-                    log_item["exception"] = item["exception"]
-
-                self.process_info[process_id]["_logs"].append(log_item)
-
-        for item in self.process_info.values():
-            item["_logs"] = sorted(
-                item["_logs"], key=lambda item: item["timestamp"]
-            )
-            item["started"] = item["_logs"][0]["timestamp"]
-            self.add_process_logs(item)
+        if self.logs_query is not None:
+            for process_info in self.logs_query.get_processes(
+                **self._filters
+            ):
+                self.add_process(process_info)
 
         self.endResetModel()
-
-
-class LogsFilterProxy(QtCore.QSortFilterProxyModel):
-    def __init__(self, *args, **kwargs):
-        super(LogsFilterProxy, self).__init__(*args, **kwargs)
-        self.col_usernames = None
-        self.filter_usernames = set()
-
-    def update_users_filter(self, users):
-        self.filter_usernames = set()
-        for user in users or tuple():
-            self.filter_usernames.add(user)
-        self.invalidateFilter()
-
-    def filterAcceptsRow(self, source_row, source_parent):
-        if self.col_usernames is not None:
-            index = self.sourceModel().index(
-                source_row, self.col_usernames, source_parent
-            )
-            user = index.data(QtCore.Qt.DisplayRole)
-            if user not in self.filter_usernames:
-                return False
-        return True
@@ -1,7 +1,8 @@
+import datetime
 import html
 from qtpy import QtCore, QtWidgets
 import qtawesome
-from .models import LogModel, LogsFilterProxy
+from .models import LogModel
 
 
 class SearchComboBox(QtWidgets.QComboBox):
@@ -107,25 +108,37 @@ class CustomCombo(QtWidgets.QWidget):
 class LogsWidget(QtWidgets.QWidget):
     """A widget that lists the published subsets for an asset"""
 
+    periods = (
+        ("All time", None),
+        ("Last day", 1),
+        ("Last week", 7),
+        ("Last month", 30),
+    )
+
     def __init__(self, detail_widget, parent=None):
         super(LogsWidget, self).__init__(parent=parent)
 
         model = LogModel()
-        proxy_model = LogsFilterProxy()
+        proxy_model = QtCore.QSortFilterProxyModel()
         proxy_model.setSourceModel(model)
-        proxy_model.col_usernames = model.COLUMNS.index("username")
 
         filter_layout = QtWidgets.QHBoxLayout()
 
         user_filter = CustomCombo("Users", self)
-        users = model.dbcon.distinct("username")
-        user_filter.populate(users)
-        user_filter.selection_changed.connect(self._user_changed)
+        user_filter.populate(model.get_distinct_values("username"))
+        user_filter.selection_changed.connect(self._filters_changed)
+
+        host_filter = CustomCombo("Hosts", self)
+        host_filter.populate(model.get_distinct_values("hostname"))
+        host_filter.selection_changed.connect(self._filters_changed)
 
-        proxy_model.update_users_filter(users)
+        period_filter = QtWidgets.QComboBox(self)
+        for label, days in self.periods:
+            period_filter.addItem(label, days)
+        period_filter.currentIndexChanged.connect(self._filters_changed)
 
         level_filter = CustomCombo("Levels", self)
-        levels = model.dbcon.distinct("level")
+        levels = model.get_distinct_values("level")
         level_filter.addItems(levels)
         level_filter.selection_changed.connect(self._level_changed)
 
@@ -135,6 +148,8 @@ class LogsWidget(QtWidgets.QWidget):
         refresh_btn = QtWidgets.QPushButton(icon, "")
 
         filter_layout.addWidget(user_filter)
+        filter_layout.addWidget(host_filter)
+        filter_layout.addWidget(period_filter)
         filter_layout.addWidget(level_filter)
         filter_layout.addStretch(1)
         filter_layout.addWidget(refresh_btn)
@@ -170,6 +185,8 @@ class LogsWidget(QtWidgets.QWidget):
         self.view = view
 
         self.user_filter = user_filter
+        self.host_filter = host_filter
+        self.period_filter = period_filter
         self.level_filter = level_filter
 
         self.detail_widget = detail_widget
@@ -190,17 +207,39 @@ class LogsWidget(QtWidgets.QWidget):
     def _on_index_change(self, to_index, from_index):
         index = self._selected_log()
         if index:
-            logs = index.data(self.model.ROLE_LOGS)
+            process_id = index.data(self.model.ROLE_PROCESS_ID)
+            self.detail_widget.set_pager(
+                self.model.create_logs_pager(process_id)
+            )
         else:
-            logs = []
-        self.detail_widget.set_detail(logs)
+            self.detail_widget.set_pager(None)
 
-    def _user_changed(self):
+    def _get_checked_values(self, combo):
+        """Checked values or None if all values are checked."""
         checked_values = set()
-        for action in self.user_filter.items():
+        all_checked = True
+        for action in combo.items():
             if action.isChecked():
                 checked_values.add(action.text())
-        self.proxy_model.update_users_filter(checked_values)
+            else:
+                all_checked = False
+
+        if all_checked:
+            return None
+        return checked_values
+
+    def _filters_changed(self):
+        start = None
+        days = self.period_filter.currentData()
+        if days is not None:
+            start = datetime.datetime.now() - datetime.timedelta(days=days)
+
+        self.model.set_filters(
+            usernames=self._get_checked_values(self.user_filter),
+            hostnames=self._get_checked_values(self.host_filter),
+            start=start
+        )
+        self.refresh()
 
     def _level_changed(self):
         checked_values = set()
@@ -246,14 +285,23 @@ class OutputWidget(QtWidgets.QWidget):
         show_timecode_checkbox.stateChanged.connect(
             self.on_show_timecode_change
         )
+        output_text.verticalScrollBar().valueChanged.connect(
+            self._on_scroll
+        )
         self.setLayout(layout)
         self.output_text = output_text
         self.show_timecode_checkbox = show_timecode_checkbox
 
+        self.filter_levels = set()
+        self._levels = set()
+        self.las_logs = []
+        self._pager = None
+
         self.refresh()
 
     def refresh(self):
-        self.set_detail()
+        """Reload records from the first page."""
+        self._load_first_page()
 
     def show_timecode(self):
         return self.show_timecode_checkbox.isChecked()
@@ -262,24 +310,63 @@ class OutputWidget(QtWidgets.QWidget):
         self.set_detail(self.las_logs)
 
     def update_level_filter(self, levels):
-        self.filter_levels = set()
-        for level in levels or tuple():
-            self.filter_levels.add(level.lower())
-
-        self.set_detail(self.las_logs)
+        self._levels = set(levels or tuple())
+        self.filter_levels = {
+            level.lower()
+            for level in self._levels
+        }
+        # Levels are filtered in database so each page is full of shown
+        #   records and scrolling to the end of output loads next page
+        self._load_first_page()
 
     def add_line(self, line):
         self.output_text.append(line)
 
+    def set_pager(self, pager):
+        """Show log records loaded by pager.
+
+        Next pages are loaded when output is scrolled to the end.
+        """
+
+        self._pager = pager
+        self._load_first_page()
+
+    def _load_first_page(self):
+        pager = self._pager
+        if pager is None:
+            self.set_detail()
+            return
+
+        pager.set_levels(self._levels)
+        self.set_detail(pager.next_page())
+
+    def _on_scroll(self, value):
+        pager = self._pager
+        scroll_bar = self.output_text.verticalScrollBar()
+        if (
+            pager is None
+            or pager.finished
+            or value < scroll_bar.maximum()
+        ):
+            return
+
+        logs = pager.next_page()
+        self.las_logs.extend(logs)
+        # Keep scroll position so appended lines don't trigger next page
+        scroll_bar.blockSignals(True)
+        self._add_logs(logs)
+        scroll_bar.setValue(value)
+        scroll_bar.blockSignals(False)
+
     def set_detail(self, logs=None):
-        self.las_logs = logs
+        self.las_logs = list(logs or [])
         self.output_text.clear()
-        if not logs:
-            return
+        self._add_logs(self.las_logs)
 
+    def _add_logs(self, logs):
         show_timecode = self.show_timecode()
         for log in logs:
-            level = log["level"].lower()
+            level = (log.get("level") or "").lower()
             if level not in self.filter_levels:
                 continue
 
@@ -313,11 +400,11 @@ class OutputWidget(QtWidgets.QWidget):
                     " <font color=\"Lime\">]"
                 )
 
-            logger_name = log["loggerName"]
+            logger_name = log.get("loggerName")
             timestamp = ""
             if not show_timecode:
                 timestamp = log["timestamp"]
-            message = log["message"]
+            message = log.get("message") or ""
             exc = log.get("exception")
             if exc:
                 message = exc["message"]
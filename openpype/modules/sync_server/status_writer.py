@@ -0,0 +1,105 @@
+import time
+import threading
+from collections import OrderedDict, defaultdict
+
+from pymongo import UpdateOne
+
+from .utils import log
+
+# Buffered updates are written at least after this time in seconds
+FLUSH_INTERVAL = 2.0
+# Buffered updates are written when this number of updates is reached
+MAX_BUFFERED_UPDATES = 500
+
+
+class SyncStatusWriter:
+    """Buffer of sync status updates of files written in bulk.
+
+    Updates of a file on a site are stored by key. Progress updates of the
+    same file replace each other, so only last progress is written. Final
+    update (success or error) of a file removes its buffered progress.
+
+    Buffer is written with one 'bulk_write' per project when 'flush' is
+    called, when 'FLUSH_INTERVAL' passed from last write or when
+    'MAX_BUFFERED_UPDATES' is reached.
+
+    Args:
+        database (pymongo.database.Database): Database with projects.
+        flush_interval (Optional[float]): Maximum time in seconds for which
+            updates are buffered.
+    """
+
+    def __init__(self, database, flush_interval=None):
+        if flush_interval is None:
+            flush_interval = FLUSH_INTERVAL
+        self._database = database
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._updates = OrderedDict()
+        self._last_flush = time.time()
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._updates)
+
+    def add(self, project_name, representation_id, file_id, site,
+            update, array_filters, progress=False):
+        """Add update of file status.
+
+        Args:
+            project_name (str): Project name.
+            representation_id (ObjectId): Representation id.
+            file_id (Union[ObjectId, None]): File id in representation.
+            site (str): Site name.
+            update (dict): Update document.
+            array_filters (list[dict]): Array filters of the update.
+            progress (bool): Update is only progress information.
+        """
+
+        file_key = (project_name, representation_id, file_id, site)
+        operation = UpdateOne(
+            {"_id": representation_id},
+            update,
+            upsert=True,
+            array_filters=array_filters
+        )
+        with self._lock:
+            progress_key = file_key + ("progress", )
+            if progress:
+                # Keep position of previous progress update
+                key = progress_key
+            else:
+                self._updates.pop(progress_key, None)
+                self._counter += 1
+                key = file_key + (self._counter, )
+            self._updates[key] = (project_name, operation)
+            should_flush = (
+                len(self._updates) >= MAX_BUFFERED_UPDATES
+                or time.time() - self._last_flush >= self._flush_interval
+            )
+
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """Write buffered updates to database."""
+
+        # Keep order of writes if flush is called from multiple threads
+        with self._flush_lock:
+            with self._lock:
+                updates, self._updates = self._updates, OrderedDict()
+                self._last_flush = time.time()
+
+            if not updates:
+                return
+
+            operations_by_project = defaultdict(list)
+            for project_name, operation in updates.values():
+                operations_by_project[project_name].append(operation)
+
+            for project_name, operations in operations_by_project.items():
+                self._database[project_name].bulk_write(operations)
+                log.debug("Written {} sync status updates of {}".format(
+                    len(operations), project_name
+                ))
@@ -14,10 +14,14 @@ from openpype.pipeline import Anatomy
 from openpype.pipeline.load.utils import get_representation_path_with_anatomy
 
 from .utils import SyncStatus, ResumableError
+from .status_writer import FLUSH_INTERVAL
+
+# Files processed at once by a provider if not set in settings
+DEFAULT_CONCURRENCY = 3
 
 
 async def upload(module, project_name, file, representation, provider_name,
-                 remote_site_name, tree=None, preset=None):
+                 remote_site_name, tree=None, preset=None, folders=None):
     """
         Upload single 'file' of a 'representation' to 'provider'.
         Source url is taken from 'file' portion, where {root} placeholder
@@ -41,34 +45,40 @@ async def upload(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        folders (dictionary): futures of folder ids by path, each folder
+            is created only once per sync loop
 
     """
-    # create ids sequentially, upload file in parallel later
-    with module.lock:
-        # this part modifies structure on 'remote_site', only single
-        # thread can do that at a time, upload/download to prepared
-        # structure should be run in parallel
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  project_name,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name,
-            remote_site_name, remote_handler
+    loop = asyncio.get_running_loop()
+    # creation of provider and folders must not block event loop shared
+    # by all synchronized projects
+    remote_handler, local_file_path, remote_file_path = (
+        await loop.run_in_executor(
+            None,
+            _prepare_file_paths,
+            module,
+            project_name,
+            file,
+            provider_name,
+            remote_site_name,
+            tree,
+            preset
         )
+    )
 
-        target_folder = os.path.dirname(remote_file_path)
-        folder_id = remote_handler.create_folder(target_folder)
-
-        if not folder_id:
-            err = "Folder {} wasn't created. Check permissions.". \
-                format(target_folder)
-            raise NotADirectoryError(err)
+    target_folder = os.path.dirname(remote_file_path)
+    folder_id = await _get_folder(
+        folders,
+        target_folder,
+        _create_remote_folder,
+        module,
+        remote_handler
+    )
+    if not folder_id:
+        err = "Folder {} wasn't created. Check permissions.". \
+            format(target_folder)
+        raise NotADirectoryError(err)
 
-    loop = asyncio.get_running_loop()
     file_id = await loop.run_in_executor(None,
                                          remote_handler.upload_file,
                                          local_file_path,
@@ -89,7 +99,7 @@ async def upload(module, project_name, file, representation, provider_name,
 
 
 async def download(module, project_name, file, representation, provider_name,
-                   remote_site_name, tree=None, preset=None):
+                   remote_site_name, tree=None, preset=None, folders=None):
     """
         Downloads file to local folder denoted in representation.Context.
 
@@ -103,28 +113,32 @@ async def download(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        folders (dictionary): futures of created local folders by path,
+            each folder is created only once per sync loop
 
         Returns:
         (string) - 'name' of local file
     """
-    with module.lock:
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  project_name,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name, remote_site_name, remote_handler
+    loop = asyncio.get_running_loop()
+    remote_handler, local_file_path, remote_file_path = (
+        await loop.run_in_executor(
+            None,
+            _prepare_file_paths,
+            module,
+            project_name,
+            file,
+            provider_name,
+            remote_site_name,
+            tree,
+            preset
         )
+    )
 
-        local_folder = os.path.dirname(local_file_path)
-        os.makedirs(local_folder, exist_ok=True)
+    local_folder = os.path.dirname(local_file_path)
+    await _get_folder(folders, local_folder, _create_local_folder)
 
     local_site = module.get_active_site(project_name)
 
-    loop = asyncio.get_running_loop()
     file_id = await loop.run_in_executor(None,
                                          remote_handler.download_file,
                                          remote_file_path,
@@ -143,6 +157,83 @@ async def download(module, project_name, file, representation, provider_name,
     return file_id
 
 
+def _prepare_file_paths(module, project_name, file, provider_name,
+                        remote_site_name, tree, preset):
+    """Create provider of remote site and resolve paths of a file.
+
+    Provider is created for each file as provider clients (e.g. GDrive
+    service) are not thread safe, injected 'tree' is shared.
+
+    Returns:
+        tuple[AbstractProvider, str, str]: Provider of remote site, local
+            and remote path of the file.
+    """
+
+    remote_handler = lib.factory.get_provider(provider_name,
+                                              project_name,
+                                              remote_site_name,
+                                              tree=tree,
+                                              presets=preset)
+    local_file_path, remote_file_path = resolve_paths(
+        module, file.get("path", ""), project_name,
+        remote_site_name, remote_handler
+    )
+    return remote_handler, local_file_path, remote_file_path
+
+
+def _create_remote_folder(module, remote_handler, folder_path):
+    # this part modifies folder structure on remote site which is shared
+    # by all providers of the site, only single thread can do that at
+    # a time, upload/download to prepared structure run in parallel
+    with module.lock:
+        return remote_handler.create_folder(folder_path)
+
+
+def _create_local_folder(folder_path):
+    os.makedirs(folder_path, exist_ok=True)
+    return True
+
+
+async def _get_folder(folders, folder_path, func, *args):
+    """Create folder in executor only once per sync loop.
+
+    Files in the same folder wait for single creation of the folder.
+
+    Args:
+        folders (Union[dict[str, asyncio.Future], None]): Futures of
+            folders created in sync loop by path.
+        folder_path (str): Path to folder.
+        func (Callable): Function creating the folder, called with 'args'
+            and 'folder_path', returns folder id.
+
+    Returns:
+        Any: Id of folder, or None if folder was not created.
+    """
+
+    future = None
+    if folders is not None:
+        future = folders.get(folder_path)
+
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, func, *args, folder_path)
+        if folders is not None:
+            folders[folder_path] = future
+
+    folder_id = None
+    try:
+        folder_id = await future
+    finally:
+        # next file tries to create folder again
+        if (
+            not folder_id
+            and folders is not None
+            and folders.get(folder_path) is future
+        ):
+            folders.pop(folder_path)
+    return folder_id
+
+
 def resolve_paths(module, file_path, project_name,
                   remote_site_name=None, remote_handler=None):
     """
@@ -297,8 +388,67 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._get_max_workers()
+        )
         self.timer = None
+        self._provider_semaphores = {}
+        self._provider_budgets = {}
+
+    def _get_provider_concurrency(self, provider):
+        """Maximum number of files processed at once by a provider.
+
+        Args:
+            provider (str): Provider code ('gdrive', 'local_drive'...).
+
+        Returns:
+            int: Number of files processed at once.
+        """
+
+        limits = (
+            self.module.sync_system_settings.get("provider_concurrency")
+            or {}
+        )
+        return max(int(limits.get(provider) or DEFAULT_CONCURRENCY), 1)
+
+    def _get_max_workers(self):
+        """Number of threads which can be used by all providers at once."""
+        return sum(
+            self._get_provider_concurrency(provider)
+            for provider in lib.factory.providers
+        )
+
+    def _get_provider_semaphore(self, provider):
+        # Semaphores are shared across projects using the same provider
+        semaphore = self._provider_semaphores.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(
+                self._get_provider_concurrency(provider)
+            )
+            self._provider_semaphores[provider] = semaphore
+        return semaphore
+
+    def _take_provider_budget(self, provider):
+        """Take one file from number of files a provider can process in loop.
+
+        Budget is 'get_provider_batch_limit' of the provider, is based on
+        API quota of the provider and is shared by all projects using
+        the provider. Semaphore limits only files processed at once.
+
+        Args:
+            provider (str): Provider code ('gdrive', 'local_drive'...).
+
+        Returns:
+            bool: File can be processed in this loop.
+        """
+
+        budget = self._provider_budgets.get(provider)
+        if budget is None:
+            budget = lib.factory.get_provider_batch_limit(provider)
+        if budget <= 0:
+            return False
+        self._provider_budgets[provider] = budget - 1
+        return True
 
     def run(self):
         self.is_running = True
@@ -311,6 +461,7 @@ class SyncServerThread(threading.Thread):
 
             asyncio.ensure_future(self.check_shutdown(), loop=self.loop)
             asyncio.ensure_future(self.sync_loop(), loop=self.loop)
+            asyncio.ensure_future(self.flush_status_loop(), loop=self.loop)
             self.log.info("Sync Server Started")
             self.loop.run_forever()
         except Exception:
@@ -318,8 +469,18 @@ class SyncServerThread(threading.Thread):
                 "Sync Server service has failed", exc_info=True
             )
         finally:
+            # Write status updates buffered before the server stopped
+            self._flush_status_updates()
             self.loop.close()  # optional
 
+    def _flush_status_updates(self):
+        try:
+            self.module.flush_db_updates()
+        except Exception:
+            self.log.warning(
+                "Failed to write sync status updates", exc_info=True
+            )
+
     async def sync_loop(self):
         """
             Runs permanently, each time:
@@ -328,7 +489,8 @@ class SyncServerThread(threading.Thread):
                     credentials)
                 - for each project_name it looks for representations that
                   should be synced
-                - synchronize found collections
+                - synchronize found collections, projects are processed
+                  concurrently
                 - update representations - fills error messages for exceptions
                 - waits X seconds and repeat
         Returns:
@@ -339,122 +501,32 @@ class SyncServerThread(threading.Thread):
                 import time
                 start_time = time.time()
                 self.module.set_sync_project_settings()  # clean cache
-                project_name = None
-                enabled_projects = self.module.get_enabled_projects()
-                for project_name in enabled_projects:
-                    preset = self.module.sync_project_settings[project_name]
-
-                    local_site, remote_site = self._working_sites(project_name,
-                                                                  preset)
-                    if not all([local_site, remote_site]):
-                        continue
-
-                    sync_repres = self.module.get_sync_representations(
-                        project_name,
-                        local_site,
-                        remote_site
-                    )
-
-                    task_files_to_process = []
-                    files_processed_info = []
-                    # process only unique file paths in one batch
-                    # multiple representation could have same file path
-                    # (textures),
-                    # upload process can find already uploaded file and
-                    # reuse same id
-                    processed_file_path = set()
-
-                    site_preset = preset.get('sites')[remote_site]
-                    remote_provider = \
-                        self.module.get_provider_for_site(site=remote_site)
-                    handler = lib.factory.get_provider(remote_provider,
-                                                       project_name,
-                                                       remote_site,
-                                                       presets=site_preset)
-                    limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
-                    # first call to get_provider could be expensive, its
-                    # building folder tree structure in memory
-                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
-                    for sync in sync_repres:
-                        if limit <= 0:
-                            continue
-                        files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                # Each provider can process limited number of files in loop
+                self._provider_budgets = {}
+                enabled_projects = list(self.module.get_enabled_projects())
+                results = await asyncio.gather(
+                    *[
+                        self._sync_project(project_name)
+                        for project_name in enabled_projects
+                    ],
+                    return_exceptions=True
+                )
+                # Write last progress updates of the loop
+                self._flush_status_updates()
+                # Raise first failure after all projects finished
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
-                delay = self.module.get_loop_delay(project_name)
+                delay = min(
+                    (
+                        self.module.get_loop_delay(project_name)
+                        for project_name in enabled_projects
+                    ),
+                    default=self.module.get_loop_delay(None)
+                )
                 self.log.debug(
                     "Waiting for {} seconds to new loop".format(delay)
                 )
@@ -478,6 +550,159 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    async def _sync_project(self, project_name):
+        """Synchronize files of a project.
+
+        Files are admitted for processing when provider of remote site
+        has free slot, each file is stored to database once is processed.
+
+        Args:
+            project_name (str): Project name.
+        """
+
+        preset = self.module.sync_project_settings[project_name]
+
+        local_site, remote_site = self._working_sites(project_name, preset)
+        if not all([local_site, remote_site]):
+            return
+
+        sync_repres = self.module.get_sync_representations(
+            project_name,
+            local_site,
+            remote_site
+        )
+
+        site_preset = preset.get('sites')[remote_site]
+        remote_provider = self.module.get_provider_for_site(site=remote_site)
+        handler = lib.factory.get_provider(remote_provider,
+                                           project_name,
+                                           remote_site,
+                                           presets=site_preset)
+        semaphore = self._get_provider_semaphore(remote_provider)
+        loop = asyncio.get_running_loop()
+        tree = None
+        tree_loaded = False
+        # process only unique file paths in one loop
+        # multiple representation could have same file path (textures),
+        # upload process can find already uploaded file and reuse same id
+        processed_file_path = set()
+        # folders created during this loop
+        remote_folders = {}
+        local_folders = {}
+        tasks = set()
+        limit_reached = False
+        for sync in sync_repres:
+            if limit_reached:
+                break
+            for file in sync.get("files") or []:
+                # skip already processed files
+                file_path = file.get('path', '')
+                if file_path in processed_file_path:
+                    continue
+                status = self.module.check_status(
+                    file,
+                    local_site,
+                    remote_site,
+                    preset.get('config'))
+                if status == SyncStatus.DO_UPLOAD:
+                    func = upload
+                    site = remote_site
+                    folders = remote_folders
+                elif status == SyncStatus.DO_DOWNLOAD:
+                    func = download
+                    site = local_site
+                    folders = local_folders
+                else:
+                    continue
+
+                if not self._take_provider_budget(remote_provider):
+                    self.log.debug((
+                        "Reached limit of files for provider {} in this"
+                        " loop, rest of {} is synced in next loops"
+                    ).format(remote_provider, project_name))
+                    limit_reached = True
+                    break
+
+                processed_file_path.add(file_path)
+                # first call to get_tree could be expensive, its
+                # building folder tree structure in memory
+                # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+                if not tree_loaded:
+                    tree = await loop.run_in_executor(None, handler.get_tree)
+                    tree_loaded = True
+                # wait for free slot of the provider
+                await semaphore.acquire()
+                task = asyncio.create_task(self._process_file(
+                    semaphore,
+                    func(self.module,
+                         project_name,
+                         file,
+                         sync,
+                         remote_provider,
+                         remote_site,
+                         tree,
+                         site_preset,
+                         folders),
+                    project_name,
+                    file,
+                    sync,
+                    site
+                ))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+        self.module.flush_db_updates()
+        self.log.debug("Processed {} files of {}".format(
+            len(processed_file_path), project_name
+        ))
+
+    async def _process_file(
+        self, semaphore, coro, project_name, file, representation, site
+    ):
+        """Process file and store result to database.
+
+        Args:
+            semaphore (asyncio.Semaphore): Acquired slot of provider which
+                is released when file is processed.
+            coro (Coroutine): Upload or download coroutine.
+            project_name (str): Project name.
+            file (dict): File information from representation.
+            representation (dict): Representation of the file.
+            site (str): Site to which file is synchronized.
+        """
+
+        error = None
+        file_id = None
+        try:
+            file_id = await coro
+        except Exception as exc:
+            error = str(exc)
+        finally:
+            semaphore.release()
+
+        self.module.update_db(project_name,
+                              file_id,
+                              file,
+                              representation,
+                              site,
+                              error,
+                              buffered=True)
+
+    async def flush_status_loop(self):
+        """Periodically write buffered status updates.
+
+        Progress updates are written when next update is added, this makes
+        sure last progress of a file is written even if no other update
+        comes for a while.
+        """
+        while self.is_running:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            await self.loop.run_in_executor(
+                None, self._flush_status_updates
+            )
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -503,6 +728,7 @@ class SyncServerThread(threading.Thread):
         await self.loop.shutdown_asyncgens()
         # to really make sure everything else has time to stop
         self.executor.shutdown(wait=True)
+        self.module.flush_db_updates()
         await asyncio.sleep(0.07)
         self.loop.stop()
 
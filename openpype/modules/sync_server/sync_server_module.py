@@ -32,6 +32,7 @@ from openpype.settings.constants import (
 )
 
 from .providers.local_drive import LocalDriveHandler
+from .status_writer import SyncStatusWriter
 from .providers import lib
 
 from .utils import (
@@ -124,6 +125,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         # some parts of code need to run sequentially, not in async
         self.lock = None
+        self._status_writer = None
         self._sync_system_settings = None
         # settings for all enabled projects for sync
         self._sync_project_settings = None
@@ -1848,7 +1850,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         return SyncStatus.DO_NOTHING
 
     def update_db(self, project_name, new_file_id, file, representation,
-                  site, error=None, progress=None, priority=None):
+                  site, error=None, progress=None, priority=None,
+                  buffered=False):
         """
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
@@ -1863,6 +1866,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             error (string): exception message
             progress (float): 0-0.99 of progress of upload/download
             priority (int): 0-100 set priority
+            buffered (bool): write update later in bulk with other updates
+                (see 'flush_db_updates'), progress updates are always
+                buffered
 
         Returns:
             None
@@ -1886,23 +1892,36 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         elif priority is not None:
             update["$set"] = self._get_priority_dict(priority, file_id)
         else:
-            tries = self._get_tries_count(file, site)
-            tries += 1
-
-            update["$set"] = self._get_error_dict(error, tries)
+            update["$set"] = self._get_error_dict(error)
+            # increment in database as 'file' could be outdated
+            tries_key = "files.$[f].sites.$[s].tries"
+            update["$set"].pop(tries_key)
+            update["$inc"] = {tries_key: 1}
 
         arr_filter = [
             {'s.name': site}
         ]
         if file_id:
-            arr_filter.append({'f._id': ObjectId(file_id)})
+            file_id = ObjectId(file_id)
+            arr_filter.append({'f._id': file_id})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
+        if buffered or progress is not None:
+            self.status_writer.add(
+                project_name,
+                representation_id,
+                file_id,
+                site,
+                update,
+                arr_filter,
+                progress=progress is not None
+            )
+        else:
+            self.connection.database[project_name].update_one(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            )
 
         if progress is not None or priority is not None:
             return
@@ -1925,6 +1944,22 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             )
         )
 
+    @property
+    def status_writer(self):
+        """Buffer of file status updates written in bulk.
+
+        Returns:
+            SyncStatusWriter: Buffer of updates.
+        """
+        if self._status_writer is None:
+            self._status_writer = SyncStatusWriter(self.connection.database)
+        return self._status_writer
+
+    def flush_db_updates(self):
+        """Write buffered file status updates to database."""
+        if self._status_writer is not None:
+            self._status_writer.flush()
+
     def _get_file_info(self, files, _id):
         """
             Return record from list of records which name matches to 'provider'
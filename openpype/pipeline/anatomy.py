@@ -634,12 +634,40 @@ class AnatomyStringTemplate(StringTemplate):
 
         anatomy_templates = self.anatomy_templates
         if not data.get("root"):
-            data = copy.deepcopy(data)
+            # Shallow copy is enough as only 'root' key is added
+            data = copy.copy(data)
             data["root"] = anatomy_templates.anatomy.roots
         result = StringTemplate.format(self, data)
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_sequence(self, data, frames, frame_key="frame"):
+        """Format template for each frame and add 'root' key to data.
+
+        Args:
+            data (dict[str, Any]): Formatting data for template.
+            frames (Iterable[Any]): Values of frame key for each output.
+            frame_key (str): Key under which is frame value in template
+                data.
+
+        Returns:
+            list[AnatomyTemplateResult]: Formatting result for each frame.
+        """
+
+        anatomy_templates = self.anatomy_templates
+        if not data.get("root"):
+            data = copy.copy(data)
+            data["root"] = anatomy_templates.anatomy.roots
+
+        output = []
+        for result in StringTemplate.format_sequence(
+            self, data, frames, frame_key
+        ):
+            rootless_path = anatomy_templates.rootless_path_from_result(
+                result)
+            output.append(AnatomyTemplateResult(result, rootless_path))
+        return output
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -986,7 +1014,8 @@ class AnatomyTemplates(TemplatesDict):
         return output
 
     def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+        # Data are deep copied in 'TemplatesDict.format'
+        copy_data = copy.copy(data)
         roots = self.roots
         if roots:
             copy_data["root"] = roots
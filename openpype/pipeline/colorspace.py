@@ -2,23 +2,40 @@ from copy import deepcopy
 import re
 import os
 import json
+import atexit
+import hashlib
 import platform
 import contextlib
 import tempfile
+import threading
+import subprocess
+
+import appdirs
+
 from openpype import PACKAGE_DIR
 from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
     Logger
 )
 from openpype.pipeline import Anatomy
 
 log = Logger.get_logger(__name__)
 
+# Version of data stored in ocio cache, change when stored data change
+OCIO_CACHE_VERSION = 1
+# Prefix of ocio worker output lines with responses
+# - must match 'WORKER_RESPONSE_PREFIX' in 'openpype/scripts/ocio_wrapper.py'
+OCIO_WORKER_RESPONSE_PREFIX = "__OCIO_WORKER_RESPONSE__"
+
 
 class CashedData:
     remapping = None
+    ocio_data = {}
 
 
 @contextlib.contextmanager
@@ -206,6 +223,277 @@ def validate_imageio_colorspace_in_config(config_path, colorspace_name):
     return True
 
 
+def get_ocio_cache_dir():
+    """Directory where is stored introspected data of ocio configs.
+
+    Returns:
+        str: Path to directory.
+    """
+
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"), "ocio_cache"
+    )
+
+
+def _get_ocio_cache_key(config_path, data_type):
+    """Key of ocio config data based on path, modification time and size.
+
+    Returns:
+        Union[str, None]: Key or None if config file is not available.
+    """
+
+    config_path = os.path.normcase(os.path.abspath(config_path))
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+
+    key = "{}|{}|{}|{}|{}".format(
+        OCIO_CACHE_VERSION,
+        config_path,
+        stat.st_mtime,
+        stat.st_size,
+        data_type
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _get_cached_ocio_data(cache_key):
+    if cache_key in CashedData.ocio_data:
+        return deepcopy(CashedData.ocio_data[cache_key])
+
+    cache_path = os.path.join(
+        get_ocio_cache_dir(), "{}.json".format(cache_key)
+    )
+    try:
+        with open(cache_path, "r") as stream:
+            data = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return None
+
+    CashedData.ocio_data[cache_key] = data
+    return deepcopy(data)
+
+
+def _store_ocio_data(cache_key, data):
+    CashedData.ocio_data[cache_key] = deepcopy(data)
+
+    cache_dir = get_ocio_cache_dir()
+    cache_path = os.path.join(cache_dir, "{}.json".format(cache_key))
+    # Write to temp file and rename it so other processes don't read
+    #   partially written file
+    tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        with open(tmp_path, "w") as stream:
+            json.dump(data, stream)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        os.rename(tmp_path, cache_path)
+
+    except (IOError, OSError):
+        log.debug("Failed to store ocio cache file.", exc_info=True)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class _OCIOWorker:
+    """Long-lived process answering queries about ocio configs.
+
+    Used in hosts where PyOpenColorIO is not available, so the process is
+    started only once instead of a process per query.
+    """
+
+    _process = None
+    _stderr_path = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _start(cls):
+        # Cleanup after previous worker process
+        cls.stop()
+
+        env = clean_envs_for_openpype_process(os.environ)
+        if not is_running_from_build():
+            env.pop("OPENPYPE_VERSION", None)
+
+        args = get_openpype_execute_args(
+            "run", get_ocio_config_script_path(), "worker"
+        )
+        log.info("Starting ocio worker: {}".format(" ".join(args)))
+        # Output of worker is stored to log file so it is possible to tell
+        #   why the worker ended
+        stderr_fd, cls._stderr_path = tempfile.mkstemp(
+            prefix="ocio_worker_", suffix=".log"
+        )
+        try:
+            cls._process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr_fd,
+                env=env
+            )
+        finally:
+            os.close(stderr_fd)
+
+    @classmethod
+    def _get_stderr(cls):
+        if not cls._stderr_path:
+            return ""
+        try:
+            with open(cls._stderr_path, "r") as stream:
+                return stream.read()
+        except (IOError, OSError):
+            return ""
+
+    @classmethod
+    def stop(cls):
+        process = cls._process
+        cls._process = None
+        if process is not None and process.poll() is None:
+            # Worker stops when stdin is closed
+            process.stdin.close()
+
+        stderr_path = cls._stderr_path
+        cls._stderr_path = None
+        if stderr_path and os.path.exists(stderr_path):
+            try:
+                os.remove(stderr_path)
+            except (IOError, OSError):
+                pass
+
+    @classmethod
+    def query(cls, queries):
+        """Send batch of queries to worker.
+
+        Args:
+            queries (list[tuple[str, str]]): Config path and data type.
+
+        Returns:
+            list[dict[str, Any]]: Result of each query with "data" or
+                "error".
+
+        Raises:
+            RuntimeError: Worker process is not available.
+        """
+
+        request = json.dumps({
+            "queries": [
+                {"config_path": config_path, "data_type": data_type}
+                for config_path, data_type in queries
+            ]
+        })
+        with cls._lock:
+            if cls._process is None or cls._process.poll() is not None:
+                cls._start()
+
+            process = cls._process
+            try:
+                process.stdin.write((request + "\n").encode("utf-8"))
+                process.stdin.flush()
+                while True:
+                    line = process.stdout.readline()
+                    if not line:
+                        log.warning(
+                            "Ocio worker process ended. Output:\n{}".format(
+                                cls._get_stderr()
+                            )
+                        )
+                        raise RuntimeError("Ocio worker process ended.")
+                    line = line.decode("utf-8").strip()
+                    if line.startswith(OCIO_WORKER_RESPONSE_PREFIX):
+                        break
+
+            except (IOError, OSError, RuntimeError):
+                cls.stop()
+                raise RuntimeError("Ocio worker process is not available.")
+
+        response = json.loads(line[len(OCIO_WORKER_RESPONSE_PREFIX):])
+        return response["results"]
+
+
+atexit.register(_OCIOWorker.stop)
+
+
+def get_ocio_configs_data(queries):
+    """Get introspected data of ocio configs.
+
+    Data are cached in memory and on disk by config path, modification time
+    and size of config file so are shared across processes. Missing data
+    are collected at once using PyOpenColorIO if is available, or by ocio
+    worker process in Python 2 hosts.
+
+    Args:
+        queries (Iterable[tuple[str, str]]): Config path and data type
+            ("get_colorspace" or "get_views").
+
+    Returns:
+        list[Any]: Data for each query.
+    """
+
+    queries = list(queries)
+    output = [None] * len(queries)
+    missing = []
+    for idx, (config_path, data_type) in enumerate(queries):
+        cache_key = _get_ocio_cache_key(config_path, data_type)
+        data = None
+        if cache_key is not None:
+            data = _get_cached_ocio_data(cache_key)
+        if data is None:
+            missing.append((idx, cache_key))
+        else:
+            output[idx] = data
+
+    if not missing:
+        return output
+
+    missing_queries = [queries[idx] for idx, _ in missing]
+    if compatibility_check():
+        from openpype.scripts.ocio_wrapper import (
+            _get_colorspace_data,
+            _get_views_data
+        )
+
+        getters = {
+            "get_colorspace": _get_colorspace_data,
+            "get_views": _get_views_data,
+        }
+        results = [
+            {"data": getters[data_type](config_path)}
+            for config_path, data_type in missing_queries
+        ]
+
+    else:
+        # python environment is not compatible with PyOpenColorIO
+        # needs to be run in subprocess
+        try:
+            results = _OCIOWorker.query(missing_queries)
+        except RuntimeError:
+            log.warning(
+                "Ocio worker failed, using subprocess per query.",
+                exc_info=True
+            )
+            results = [
+                {"data": get_data_subprocess(config_path, data_type)}
+                for config_path, data_type in missing_queries
+            ]
+
+    for (idx, cache_key), result in zip(missing, results):
+        if "error" in result:
+            raise RuntimeError(
+                "Failed to get ocio data from '{}': {}".format(
+                    queries[idx][0], result["error"]
+                )
+            )
+        data = result["data"]
+        if cache_key is not None:
+            _store_ocio_data(cache_key, data)
+        output[idx] = data
+    return output
+
+
 def get_data_subprocess(config_path, data_type):
     """Get data via subprocess
 
@@ -264,14 +552,7 @@ def get_ocio_config_colorspaces(config_path):
     Returns:
         dict: colorspace and family in couple
     """
-    if not compatibility_check():
-        # python environment is not compatible with PyOpenColorIO
-        # needs to be run in subprocess
-        return get_colorspace_data_subprocess(config_path)
-
-    from openpype.scripts.ocio_wrapper import _get_colorspace_data
-
-    return _get_colorspace_data(config_path)
+    return get_ocio_configs_data([(config_path, "get_colorspace")])[0]
 
 
 def get_colorspace_data_subprocess(config_path):
@@ -300,14 +581,7 @@ def get_ocio_config_views(config_path):
     Returns:
         dict: `display/viewer` and viewer data
     """
-    if not compatibility_check():
-        # python environment is not compatible with PyOpenColorIO
-        # needs to be run in subprocess
-        return get_views_data_subprocess(config_path)
-
-    from openpype.scripts.ocio_wrapper import _get_views_data
-
-    return _get_views_data(config_path)
+    return get_ocio_configs_data([(config_path, "get_views")])[0]
 
 
 def get_views_data_subprocess(config_path):
@@ -21,10 +21,11 @@ from openpype.client.operations import (
 
 from openpype.client import (
     get_representations,
+    get_representations_by_file_hashes,
     get_subset_by_name,
     get_version_by_name,
 )
-from openpype.lib import source_hash
+from openpype.lib import source_hash, get_file_content_hash
 from openpype.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -144,6 +145,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # Number of files transferred in parallel
+    file_transfer_workers = 1
+    # Hardlink already published files with the same content instead of
+    #   copying them again
+    content_hash_dedup = False
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -174,9 +181,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.file_transfer_workers
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -266,6 +276,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         # Prepare all representations
         prepared_representations = []
+        transfers = []
         for repre in filtered_repres:
             # todo: reduce/simplify what is returned from this function
             prepared = self.prepare_representation(
@@ -278,7 +289,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             for src, dst in prepared["transfers"]:
                 # todo: add support for hardlink transfers
-                file_transactions.add(src, dst)
+                transfers.append((src, dst, FileTransaction.MODE_COPY))
 
             prepared_representations.append(prepared)
 
@@ -296,23 +307,45 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             for src, dst in instance.data.get(files_type, []):
                 self._validate_path_in_project_roots(anatomy, dst)
 
-                file_transactions.add(src, dst, mode=copy_mode)
+                transfers.append((src, dst, copy_mode))
                 resource_destinations.add(os.path.abspath(dst))
 
+        content_hashes = {}
+        if self.content_hash_dedup:
+            transfers, content_hashes = self.deduplicate_transfers(
+                project_name, anatomy, transfers
+            )
+
+        for src, dst, copy_mode in transfers:
+            file_transactions.add(src, dst, mode=copy_mode)
+
         # Bulk write to the database
-        # We write the subset and version to the database before the File
-        # Transaction to reduce the chances of another publish trying to
-        # publish to the same version number since that chance can greatly
-        # increase if the file transaction takes a long time.
-        op_session.commit()
+        # Commit of the subset and version is started before the File
+        # Transaction and runs in background while files are transferred.
+        # It reduces the chances of another publish trying to publish to
+        # the same version number, but the version is not guaranteed to be
+        # written before the transfer starts.
+        commit_future = op_session.commit_async()
+
+        # Process all file transfers of all integrations now
+        self.log.debug("Integrating source files to destination ...")
+        try:
+            file_transactions.process()
+        except Exception:
+            # Wait for the commit but keep the file transfer error as the
+            # reason of the failure
+            try:
+                commit_future.result()
+            except Exception:
+                self.log.error(
+                    "Failed to write to database", exc_info=True
+                )
+            raise
+        commit_future.result()
 
         self.log.info("Subset {subset[name]} and Version {version[name]} "
                       "written to database..".format(subset=subset,
                                                      version=version))
-
-        # Process all file transfers of all integrations now
-        self.log.debug("Integrating source files to destination ...")
-        file_transactions.process()
         self.log.debug(
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
@@ -336,9 +369,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
-        resource_file_infos = self.get_files_info(resource_destinations,
-                                                  sites=sites,
-                                                  anatomy=anatomy)
+        resource_file_infos = self.get_files_info(
+            resource_destinations,
+            sites=sites,
+            anatomy=anatomy,
+            content_hashes=content_hashes
+        )
 
         # Finalize the representations now the published files are integrated
         # Get 'files' info for representations and its attached resources
@@ -349,7 +385,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
+                destinations,
+                sites=sites,
+                anatomy=anatomy,
+                content_hashes=content_hashes
             )
 
             # Add the version resource file infos to each representation
@@ -728,22 +767,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            frame_key = "udim" if is_udim else "frame"
+            dst_filepaths = path_template_obj.format_sequence_strict(
+                template_data, destination_indexes, frame_key
+            )
+            # Keep last index in template data as it was filled per frame
+            template_data[frame_key] = destination_indexes[-1]
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -891,6 +924,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if key in instance.data:
                 version_data[key] = instance.data[key]
 
+        # Store source hashes also as list which can be indexed
+        if "sourceHashes" in version_data:
+            version_data["sourceHashKeys"] = list(
+                version_data["sourceHashes"].keys()
+            )
+
         # Include instance.data[versionData] directly
         version_data_instance = instance.data.get("versionData")
         if version_data_instance:
@@ -948,25 +987,38 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, destinations, sites, anatomy):
+    def get_files_info(
+        self, destinations, sites, anatomy, content_hashes=None
+    ):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             destinations (list): List of transferred file destinations
             sites (list): array of published locations
             anatomy: anatomy part from instance
+            content_hashes (Optional[dict[str, str]]): Content hashes of
+                files by normalized destination path.
         Returns:
             output_resources: array of dictionaries to be added to 'files' key
             in representation
         """
 
+        if content_hashes is None:
+            content_hashes = {}
         file_infos = []
         for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+            file_info = self.prepare_file_info(
+                file_path,
+                anatomy,
+                sites=sites,
+                content_hash=content_hashes.get(
+                    self._normalize_path(file_path)
+                )
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(self, path, anatomy, sites, content_hash=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -975,18 +1027,126 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            content_hash (Optional[str]): Hash of file content.
 
         Returns:
             dict: file info dictionary
         """
 
-        return {
+        file_info = {
             "_id": ObjectId(),
             "path": self.get_rootless_path(anatomy, path),
             "size": os.path.getsize(path),
             "hash": source_hash(path),
             "sites": sites
         }
+        if content_hash:
+            file_info["content_hash"] = content_hash
+        return file_info
+
+    def deduplicate_transfers(self, project_name, anatomy, transfers):
+        """Replace copies of already published files with hardlinks.
+
+        Content hash is calculated for each copied source file. If a file
+        with the same content was already published to the same device,
+        the destination is hardlinked to the published file instead of
+        copying the source.
+
+        Note:
+            Hardlinked files share content, so published files must never
+            be modified in place.
+
+        Args:
+            project_name (str): Project name.
+            anatomy (Anatomy): Project anatomy.
+            transfers (list[tuple[str, str, int]]): Source path,
+                destination path and transfer mode.
+
+        Returns:
+            tuple[list[tuple[str, str, int]], dict[str, str]]: Transfers
+                and content hashes by normalized destination path.
+        """
+
+        content_hashes = {}
+        for src, dst, copy_mode in transfers:
+            if copy_mode == FileTransaction.MODE_COPY:
+                content_hashes[self._normalize_path(dst)] = (
+                    get_file_content_hash(src)
+                )
+
+        published_paths = self._get_published_paths_by_hash(
+            project_name, anatomy, set(content_hashes.values())
+        )
+        # Published files which are replaced by this integration can't be
+        #   used as source of hardlink
+        destinations = {
+            self._normalize_path(dst)
+            for _, dst, _ in transfers
+        }
+
+        output = []
+        for src, dst, copy_mode in transfers:
+            published_path = published_paths.get(
+                content_hashes.get(self._normalize_path(dst))
+            )
+            if (
+                published_path is None
+                or published_path in destinations
+                or not self._is_same_device(published_path, dst)
+            ):
+                output.append((src, dst, copy_mode))
+                continue
+
+            self.log.debug(
+                "File with same content is already published: {} -> {}"
+                .format(src, published_path)
+            )
+            output.append(
+                (published_path, dst, FileTransaction.MODE_HARDLINK)
+            )
+        return output, content_hashes
+
+    def _get_published_paths_by_hash(
+        self, project_name, anatomy, content_hashes
+    ):
+        published_paths = {}
+        repre_docs = get_representations_by_file_hashes(
+            project_name, content_hashes, fields=["files"]
+        )
+        for repre_doc in repre_docs:
+            for file_info in repre_doc.get("files") or []:
+                content_hash = file_info.get("content_hash")
+                if (
+                    content_hash not in content_hashes
+                    or content_hash in published_paths
+                ):
+                    continue
+
+                path = self._normalize_path(
+                    anatomy.fill_root(file_info["path"])
+                )
+                if (
+                    os.path.isfile(path)
+                    and os.path.getsize(path) == file_info.get("size")
+                ):
+                    published_paths[content_hash] = path
+        return published_paths
+
+    @staticmethod
+    def _normalize_path(path):
+        return os.path.normpath(os.path.abspath(path))
+
+    @staticmethod
+    def _is_same_device(src, dst):
+        """Hardlink can be created only on the same device."""
+        # Destination folder might not exist yet
+        dst_dir = os.path.dirname(dst)
+        while not os.path.exists(dst_dir):
+            parent = os.path.dirname(dst_dir)
+            if parent == dst_dir:
+                return False
+            dst_dir = parent
+        return os.stat(src).st_dev == os.stat(dst_dir).st_dev
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
         """Checks if 'file_path' starts with any of the roots.
@@ -291,3 +291,68 @@ class PypeCommands:
         from openpype.lib.project_backpack import unpack_project
 
         unpack_project(zip_filepath, new_root, database_only)
+
+    def ensure_project_indexes(self, project_name=None):
+        from openpype.client import get_projects
+        from openpype.client.mongo import ensure_project_indexes
+
+        if project_name:
+            project_names = [project_name]
+        else:
+            project_names = [
+                project_doc["name"]
+                for project_doc in get_projects(
+                    inactive=True, fields=["name"]
+                )
+            ]
+
+        for name in project_names:
+            created = ensure_project_indexes(name)
+            if created:
+                print("Created indexes of project \"{}\": {}".format(
+                    name, ", ".join(created)))
+            else:
+                print("Indexes of project \"{}\" are up to date".format(
+                    name))
+
+    def rebuild_last_versions(self, project_name=None):
+        from openpype.client import get_projects
+        from openpype.client.mongo.operations import rebuild_last_versions
+
+        if project_name:
+            project_names = [project_name]
+        else:
+            project_names = [
+                project_doc["name"]
+                for project_doc in get_projects(
+                    inactive=True, fields=["name"]
+                )
+            ]
+
+        for name in project_names:
+            changed = rebuild_last_versions(name)
+            print("Updated last version of {} subsets in \"{}\"".format(
+                changed, name))
+
+    def backfill_source_hashes(self, project_name=None):
+        from openpype.client import get_projects
+        from openpype.client.mongo import ensure_project_indexes
+        from openpype.client.mongo.operations import (
+            backfill_source_hash_keys
+        )
+
+        if project_name:
+            project_names = [project_name]
+        else:
+            project_names = [
+                project_doc["name"]
+                for project_doc in get_projects(
+                    inactive=True, fields=["name"]
+                )
+            ]
+
+        for name in project_names:
+            ensure_project_indexes(name)
+            changed = backfill_source_hash_keys(name)
+            print("Updated source hashes of {} versions in \"{}\"".format(
+                changed, name))
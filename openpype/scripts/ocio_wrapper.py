@@ -17,8 +17,12 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- worker - console command - python 2
+         - long-lived process answering batched queries
+           read from stdin.
 """
 
+import sys
 import click
 import json
 from pathlib2 import Path
@@ -174,5 +178,47 @@ def _get_views_data(config_path):
     return data
 
 
+# Prefix of worker output lines with responses
+WORKER_RESPONSE_PREFIX = "__OCIO_WORKER_RESPONSE__"
+
+
+@main.command(
+    name="worker",
+    help="answer batched queries from stdin until stdin is closed"
+)
+def worker():
+    """Process queries from stdin.
+
+    Each input line is json with "queries" which is list of items with
+    "config_path" and "data_type" ("get_colorspace" or "get_views").
+    Response line is prefixed with 'WORKER_RESPONSE_PREFIX' followed by json
+    with "results" where each item has "data" or "error".
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py worker
+    """
+    data_getters = {
+        "get_colorspace": _get_colorspace_data,
+        "get_views": _get_views_data,
+    }
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        results = []
+        for query in json.loads(line)["queries"]:
+            try:
+                getter = data_getters[query["data_type"]]
+                results.append({"data": getter(query["config_path"])})
+            except Exception as exc:
+                results.append({"error": str(exc)})
+
+        sys.stdout.write("{}{}\n".format(
+            WORKER_RESPONSE_PREFIX, json.dumps({"results": results})
+        ))
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
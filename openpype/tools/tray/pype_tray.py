@@ -26,6 +26,7 @@ from openpype.lib.openpype_version import (
     is_running_staging,
     is_staging_enabled,
 )
+from openpype.lib.profiling import startup_phase
 from openpype.modules import TrayModulesManager
 from openpype.settings import (
     get_system_settings,
@@ -471,7 +472,8 @@ class TrayManager:
             ITrayService
         )
 
-        self.modules_manager.initialize(self, self.tray_widget.menu)
+        with startup_phase("tray.initialize"):
+            self.modules_manager.initialize(self, self.tray_widget.menu)
 
         admin_submenu = ITrayAction.admin_submenu(self.tray_widget.menu)
         self.tray_widget.menu.addMenu(admin_submenu)
@@ -585,6 +585,20 @@ class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = Field("", title="Template name")
 
 
+class IntegrateAssetModel(BaseSettingsModel):
+    _isGroup = True
+    file_transfer_workers: int = Field(
+        1,
+        title="File transfer workers",
+        ge=1,
+        le=64
+    )
+    content_hash_dedup: bool = Field(
+        False,
+        title="Hardlink files with already published content"
+    )
+
+
 class IntegrateHeroVersionModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = Field(True)
@@ -671,6 +685,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateAssetModel = Field(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = Field(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -920,6 +938,10 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "file_transfer_workers": 1,
+        "content_hash_dedup": False
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
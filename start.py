@@ -137,6 +137,17 @@ sys.path.insert(0, vendor_python_path)
 # - common contains common code for bootstraping and OpenPype processes
 sys.path.insert(0, os.path.join(OPENPYPE_ROOT, "common"))
 
+# Startup profiling must start before other imports
+if "--startup-profile" in sys.argv:
+    sys.argv.remove("--startup-profile")
+    if not os.getenv("OPENPYPE_STARTUP_PROFILE"):
+        os.environ["OPENPYPE_STARTUP_PROFILE"] = "1"
+
+if os.getenv("OPENPYPE_STARTUP_PROFILE"):
+    from igniter import startup_profiler
+
+    startup_profiler.start_profiler()
+
 import blessed  # noqa: E402
 import certifi  # noqa: E402
 
@@ -274,6 +285,10 @@ from igniter.tools import (
     OpenPypeVersionIncompatible
 )  # noqa
 from igniter.bootstrap_repos import OpenPypeVersion  # noqa: E402
+from igniter.startup_profiler import (  # noqa: E402
+    phase as startup_phase,
+    end_phase as end_startup_phase,
+)
 
 bootstrap = BootstrapRepos()
 silent_commands = {"run", "igniter", "standalonepublisher",
@@ -980,7 +995,8 @@ def boot():
     # ------------------------------------------------------------------------
     # Do necessary startup validations
     # ------------------------------------------------------------------------
-    _startup_validations()
+    with startup_phase("bootstrap.validations"):
+        _startup_validations()
 
     # ------------------------------------------------------------------------
     # Process arguments
@@ -1002,7 +1018,8 @@ def boot():
     # ------------------------------------------------------------------------
 
     try:
-        openpype_mongo = _determine_mongodb()
+        with startup_phase("bootstrap.mongo"):
+            openpype_mongo = _determine_mongodb()
     except RuntimeError as e:
         # without mongodb url we are done for.
         _print(f"!!! {e}", True)
@@ -1021,7 +1038,8 @@ def boot():
         if "_tests" not in avalon_db:
             os.environ["AVALON_DB"] = avalon_db + "_tests"
 
-    global_settings = get_openpype_global_settings(openpype_mongo)
+    with startup_phase("bootstrap.global_settings"):
+        global_settings = get_openpype_global_settings(openpype_mongo)
 
     _print(">>> run disk mapping command ...")
     run_disk_mapping_commands(global_settings)
@@ -1071,7 +1089,9 @@ def boot():
     if getattr(sys, 'frozen', False):
         # find versions of OpenPype to be used with frozen code
         try:
-            version_path = _find_frozen_openpype(use_version, use_staging)
+            with startup_phase("bootstrap.find_version"):
+                version_path = _find_frozen_openpype(
+                    use_version, use_staging)
         except OpenPypeVersionNotFound as exc:
             _boot_handle_missing_version(local_version, str(exc))
             sys.exit(1)
@@ -1082,14 +1102,16 @@ def boot():
             sys.exit(1)
         # validate version
         _print(f">>> Validating version in frozen [ {str(version_path)} ]")
-        result = bootstrap.validate_openpype_version(version_path)
+        with startup_phase("bootstrap.validate_version"):
+            result = bootstrap.validate_openpype_version(version_path)
         if not result[0]:
             _print(f"!!! Invalid version: {result[1]}", True)
             sys.exit(1)
         _print("--- version is valid")
     else:
         try:
-            version_path = _bootstrap_from_code(use_version)
+            with startup_phase("bootstrap.find_version"):
+                version_path = _bootstrap_from_code(use_version)
 
         except OpenPypeVersionNotFound as exc:
             _boot_handle_missing_version(local_version, str(exc))
@@ -1120,9 +1142,11 @@ def boot():
     _print("  - for Avalon ...")
     set_avalon_environments()
     _print("  - global OpenPype ...")
-    set_openpype_global_environments()
+    with startup_phase("environments.settings"):
+        set_openpype_global_environments()
     _print("  - for modules ...")
-    set_modules_environments()
+    with startup_phase("environments.modules"):
+        set_modules_environments()
 
     assert version_path, "Version path not defined."
 
@@ -1147,9 +1171,12 @@ def boot():
         for i in info:
             t.echo(i)
 
-    from openpype import cli
+    end_startup_phase("bootstrap")
+    with startup_phase("cli.import"):
+        from openpype import cli
     try:
-        cli.main(obj={}, prog_name="openpype")
+        with startup_phase("cli"):
+            cli.main(obj={}, prog_name="openpype")
     except Exception:  # noqa
         exc_info = sys.exc_info()
         _print("!!! OpenPype crashed:", True)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of event emitting with many registered callbacks.
+
+Compares legacy emitting, which checks topic of every registered callback
+for each event, to emitting with callbacks resolved through topic index.
+
+Benchmark does not assert anything, run it as a script:
+    python tests/benchmarks/benchmark_events.py [callbacks] [events]
+"""
+import sys
+import time
+
+from openpype.lib.events import EventSystem
+
+
+class _Listener(object):
+    def __init__(self):
+        self.calls = 0
+
+    def callback(self, event):
+        self.calls += 1
+
+
+def legacy_emit(event_system, event):
+    for callback in event_system._registered_callbacks:
+        callback.process_event(event)
+
+
+def main(callbacks_count=500, events_count=5000):
+    event_system = EventSystem()
+    # Keep listeners alive, callbacks are stored as weak references
+    listeners = []
+    for idx in range(callbacks_count):
+        listener = _Listener()
+        listeners.append(listener)
+        # Every fifth callback listens to a wildcard topic
+        if idx % 5 == 0:
+            topic = "group{}.*".format(idx % 20)
+        else:
+            topic = "group{}.topic{}".format(idx % 20, idx)
+        event_system.add_callback(topic, listener.callback)
+
+    events = [
+        event_system.create_event(
+            "group{}.topic{}".format(idx % 20, idx % callbacks_count),
+            {},
+            None
+        )
+        for idx in range(events_count)
+    ]
+
+    start = time.time()
+    for event in events:
+        legacy_emit(event_system, event)
+    legacy_time = time.time() - start
+
+    start = time.time()
+    for event in events:
+        event_system.emit_event(event)
+    indexed_time = time.time() - start
+
+    print("{} events, {} callbacks: legacy {:.3f}s, indexed {:.3f}s".format(
+        events_count, callbacks_count, legacy_time, indexed_time
+    ))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of per-frame formatting of publish path templates.
+
+Compares formatting of each frame like 'IntegrateAsset' does with template
+parsed for each frame and without fast path for solved templates (legacy)
+to formatting using cached parsed templates.
+
+Benchmark does not assert anything, run it as a script:
+    python tests/benchmarks/benchmark_path_templates.py [frames count]
+"""
+import sys
+import time
+
+from openpype.lib.path_templates import StringTemplate
+
+PUBLISH_TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish/{family}"
+    "/{subset}/v{version:0>3}/{project[code]}_{asset}_{subset}"
+    "_v{version:0>3}<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+)
+TEMPLATE_DATA = {
+    "root": {"work": "/mnt/projects"},
+    "project": {"name": "test_project", "code": "tp"},
+    "hierarchy": "shots/sq01",
+    "asset": "sh010",
+    "family": "render",
+    "subset": "renderMain",
+    "version": 3,
+    "ext": "exr",
+}
+
+
+def legacy_format(data):
+    StringTemplate.clear_cache()
+    template_obj = StringTemplate(PUBLISH_TEMPLATE)
+    template_obj._format_solved = lambda _data: None
+    return template_obj.format_strict(data)
+
+
+def cached_format(data):
+    return StringTemplate.format_strict_template(PUBLISH_TEMPLATE, data)
+
+
+def format_frames(format_func, frames):
+    start = time.time()
+    for frame in frames:
+        data = dict(TEMPLATE_DATA)
+        data["frame"] = frame
+        format_func(data)
+    return time.time() - start
+
+
+def main(frames_count=2000):
+    frames = range(1001, 1001 + frames_count)
+    legacy_time = format_frames(legacy_format, frames)
+    cached_time = format_frames(cached_format, frames)
+    print("{} frames: legacy {:.3f}s, cached {:.3f}s ({:.1f}x)".format(
+        frames_count, legacy_time, cached_time, legacy_time / cached_time
+    ))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
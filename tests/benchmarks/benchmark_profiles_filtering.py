@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of profiles filtering over settings-like profiles.
+
+Compares filtering validating each profile for each query (legacy) to
+filtering with compiled profiles used by 'filter_profiles'. Profiles mix
+literal values, wildcards, regex patterns and empty values like profiles
+in settings do.
+
+Benchmark does not assert anything, run it as a script with optional
+number of profiles and queries:
+    python tests/benchmarks/benchmark_profiles_filtering.py 500 5000
+"""
+import sys
+import time
+import random
+
+from openpype.lib.profiles_filtering import (
+    filter_profiles,
+    _filter_profiles,
+)
+
+HOSTS = ["maya", "nuke", "houdini", "blender", "photoshop", "standalone"]
+FAMILIES = [
+    "model", "rig", "look", "render", "review", "camera", "pointcache",
+    "workfile", "plate", "image",
+]
+TASK_TYPES = ["Modeling", "Rigging", "Lighting", "Compositing", "Animation"]
+KEYS_ORDER = ["hosts", "task_types", "families", "task_names"]
+
+
+def _random_values(rng, values, patterns):
+    choice = rng.random()
+    if choice < 0.25:
+        return []
+    if choice < 0.3:
+        return ["*"]
+    if choice < 0.45:
+        return [rng.choice(patterns)]
+    return rng.sample(values, rng.randint(1, 3))
+
+
+def generate_profiles(rng, count):
+    profiles = []
+    for idx in range(count):
+        profiles.append({
+            "hosts": _random_values(rng, HOSTS, ["ma.*", "nu.?e"]),
+            "families": _random_values(rng, FAMILIES, ["re.*", ".*cache"]),
+            "task_types": _random_values(rng, TASK_TYPES, ["Anim.*"]),
+            "task_names": _random_values(
+                rng, ["main", "blocking", "layout"], ["ma.*"]
+            ),
+            "template_name": "template_{}".format(idx),
+        })
+    return profiles
+
+
+def generate_queries(rng, count):
+    queries = []
+    for _ in range(count):
+        queries.append({
+            "hosts": rng.choice(HOSTS),
+            "families": rng.choice(FAMILIES),
+            "task_types": rng.choice(TASK_TYPES + [None]),
+            "task_names": rng.choice(["main", "blocking", "other", None]),
+        })
+    return queries
+
+
+def run_queries(filter_func, profiles, queries):
+    start = time.time()
+    for key_values in queries:
+        filter_func(profiles, key_values, KEYS_ORDER)
+    return time.time() - start
+
+
+def main(profiles_count=500, queries_count=5000):
+    rng = random.Random(2)
+    profiles = generate_profiles(rng, profiles_count)
+    queries = generate_queries(rng, queries_count)
+
+    legacy_time = run_queries(_filter_profiles, profiles, queries)
+    # Includes compilation of profiles on first query
+    compiled_time = run_queries(filter_profiles, profiles, queries)
+    print((
+        "{} profiles, {} queries: legacy {:.3f}s, compiled {:.3f}s"
+    ).format(profiles_count, queries_count, legacy_time, compiled_time))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -147,6 +147,28 @@ class DBHandler:
         print("Dropping {} database".format(db_name))
         self.client.drop_database(db_name)
 
+    def start_profiling(self, db_name):
+        """Store all queries of 'db_name' to 'system.profile' collection."""
+        self.client[db_name].command("profile", 2)
+
+    def stop_profiling(self, db_name):
+        self.client[db_name].command("profile", 0)
+
+    def get_collection_scans(self, db_name):
+        """Profiled queries of 'db_name' which used collection scan.
+
+        Profiling must be started with 'start_profiling' first.
+
+        Returns:
+            list[dict]: Profiled operations with collection scan.
+        """
+        if not self._db_exists(db_name):
+            return []
+        return list(self.client[db_name]["system.profile"].find({
+            "planSummary": "COLLSCAN",
+            "ns": {"$ne": "{}.system.profile".format(db_name)}
+        }))
+
     def backup_to_dump(self, db_name, dump_dir, overwrite=False,
                        collection=None):
         """
@@ -161,8 +161,19 @@ class ModuleUnitTest(BaseTest):
                                    overwrite=True,
                                    db_name_out=self.TEST_OPENPYPE_NAME)
 
+        from openpype.client.mongo import ensure_project_indexes
+        ensure_project_indexes(self.PROJECT, self.TEST_DB_NAME)
+        db_handler.start_profiling(self.TEST_DB_NAME)
+
         yield db_handler
 
+        # Report queries which are not covered by project indexes
+        collection_scans = db_handler.get_collection_scans(self.TEST_DB_NAME)
+        db_handler.stop_profiling(self.TEST_DB_NAME)
+        for operation in collection_scans:
+            print("Query used collection scan: {} {}".format(
+                operation.get("ns"), operation.get("command")))
+
         persist = self.PERSIST or self.is_test_failed(request)
         if not persist:
             db_handler.teardown(self.TEST_DB_NAME)
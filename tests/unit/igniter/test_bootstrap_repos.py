@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Test suite for repos bootstrapping (install)."""
+import hashlib
 import os
 import sys
 from collections import namedtuple
@@ -388,3 +389,88 @@ def test_find_openpype(fix_bootstrap, tmp_path_factory, monkeypatch, printer):
     )
     assert result[-1].path == expected_path, ("not a latest version of "
                                               "OpenPype 4")
+
+
+def _create_version_zip(zip_path, files, checksums=None):
+    """Create zip of OpenPype version with `checksums` file."""
+    if checksums is None:
+        checksums = files
+    with ZipFile(zip_path, "w") as zip_file:
+        checksums_str = ""
+        for file_name, content in files.items():
+            zip_file.writestr(file_name, content)
+            checksum = hashlib.sha256(checksums[file_name]).hexdigest()
+            checksums_str += "{}:{}\n".format(checksum, file_name)
+        zip_file.writestr("checksums", checksums_str)
+    return zip_path
+
+
+_VERSION_FILES = {
+    "openpype/__init__.py": b"",
+    "openpype/version.py": b"__version__ = '3.0.0'\n",
+    "openpype/lib/data.bin": os.urandom(1024 * 64),
+    "start.py": b"print('start')\n",
+}
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_validate_zip(tmp_path, max_workers):
+    zip_path = _create_version_zip(
+        tmp_path / "openpype-v3.0.0.zip", _VERSION_FILES)
+    assert BootstrapRepos._validate_zip(zip_path, max_workers) == (
+        True, "All ok")
+
+    tampered = dict(_VERSION_FILES)
+    tampered["openpype/version.py"] = b"__version__ = '3.0.1'\n"
+    zip_path = _create_version_zip(
+        tmp_path / "openpype-v3.0.1.zip", tampered, _VERSION_FILES)
+    assert BootstrapRepos._validate_zip(zip_path, max_workers) == (
+        False, "Invalid checksum on openpype/version.py")
+
+
+def test_validation_marker(fix_bootstrap, tmp_path, monkeypatch):
+    monkeypatch.delenv("OPENPYPE_DONT_VALIDATE_VERSION", raising=False)
+    zip_path = _create_version_zip(
+        tmp_path / "openpype-v3.0.0.zip", _VERSION_FILES)
+
+    result = fix_bootstrap.validate_openpype_version(zip_path)
+    assert result == (True, "All ok")
+    result = fix_bootstrap.validate_openpype_version(zip_path)
+    assert result == (True, "Already validated")
+
+    # Changed zip is validated again
+    mtime = zip_path.stat().st_mtime + 10
+    os.utime(zip_path, (mtime, mtime))
+    result = fix_bootstrap.validate_openpype_version(zip_path)
+    assert result == (True, "All ok")
+
+    # Change of any file of extracted version is validated again
+    version_dir = tmp_path / "openpype-v3.0.0"
+    BootstrapRepos._extract_zip(zip_path, version_dir)
+    result = fix_bootstrap.validate_openpype_version(version_dir)
+    assert result == (True, "All ok")
+    result = fix_bootstrap.validate_openpype_version(version_dir)
+    assert result == (True, "Already validated")
+
+    version_file = version_dir / "openpype" / "version.py"
+    version_file.write_bytes(b"__version__ = '3.0.1'\n")
+    result = fix_bootstrap.validate_openpype_version(version_dir)
+    assert result == (False, "Invalid checksum on openpype/version.py")
+
+
+def test_extract_zip_parallel(tmp_path):
+    zip_path = _create_version_zip(
+        tmp_path / "openpype-v3.0.0.zip", _VERSION_FILES)
+
+    for max_workers in (1, 4):
+        destination = tmp_path / "extracted_{}".format(max_workers)
+        BootstrapRepos._extract_zip(zip_path, destination, max_workers)
+
+        extracted = {
+            file.relative_to(destination).as_posix(): file.read_bytes()
+            for file in destination.rglob("*")
+            if file.is_file() and file.name != "checksums"
+        }
+        assert extracted == _VERSION_FILES
+        assert BootstrapRepos._validate_dir(destination, max_workers) == (
+            True, "All ok")
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Test startup profiler and startup time budget."""
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from igniter.startup_profiler import StartupProfiler
+
+# Budget of OpenPype CLI boot in seconds
+STARTUP_BUDGET = float(os.getenv("OPENPYPE_STARTUP_BUDGET") or 20)
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+_BOOT_SCRIPT = """
+import sys
+from igniter import startup_profiler
+
+profiler = startup_profiler.start_profiler(sys.argv[1])
+with startup_profiler.phase("cli.import"):
+    from openpype import cli
+startup_profiler.end_phase("boot")
+"""
+
+
+def _is_mongo_available():
+    mongo_url = os.getenv("OPENPYPE_MONGO")
+    if not mongo_url:
+        return False
+    from igniter.tools import validate_mongo_connection
+
+    result, _ = validate_mongo_connection(mongo_url)
+    return result
+
+
+def test_startup_profiler_report(tmp_path, monkeypatch):
+    """Phases and imports are recorded and written to report."""
+    module_dir = tmp_path / "modules"
+    module_dir.mkdir()
+    (module_dir / "_profiled_module.py").write_text("import time\nX = 1\n")
+    monkeypatch.syspath_prepend(str(module_dir))
+
+    report_path = tmp_path / "report.json"
+    profiler = StartupProfiler(str(report_path))
+    profiler.start()
+    try:
+        with profiler.phase("parent"):
+            with profiler.phase("child"):
+                import _profiled_module  # noqa: F401
+    finally:
+        profiler.stop()
+        sys.modules.pop("_profiled_module", None)
+    profiler.write_report()
+
+    report = json.loads(report_path.read_text())
+    phases = {item["name"]: item for item in report["phases"]}
+    assert phases["child"]["parent"] == "parent"
+    assert phases["parent"]["duration"] >= phases["child"]["duration"]
+    assert report["imports_measured"]
+    imports = {item["name"]: item for item in report["imports"]}
+    assert "_profiled_module" in imports
+
+
+@pytest.mark.slow
+def test_cli_boot_budget(tmp_path):
+    """Boot of OpenPype CLI must fit into time budget."""
+    if not _is_mongo_available():
+        pytest.skip("MongoDB is not available")
+
+    report_path = tmp_path / "startup.json"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(REPO_ROOT)] + [path for path in sys.path if path]
+    )
+    subprocess.run(
+        [sys.executable, "-c", _BOOT_SCRIPT, str(report_path)],
+        cwd=str(REPO_ROOT),
+        env=env,
+        check=True
+    )
+
+    report = json.loads(report_path.read_text())
+    phases = {item["name"]: item for item in report["phases"]}
+    assert "modules.discovery" in phases
+    assert report["total"] < STARTUP_BUDGET, (
+        "OpenPype CLI boot took {:.2f}s, budget is {:.2f}s".format(
+            report["total"], STARTUP_BUDGET
+        )
+    )
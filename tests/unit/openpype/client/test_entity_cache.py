@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Test suite for entity cache."""
+import time
+
+from openpype.client.mongo.entity_cache import EntityCache
+
+
+class _Getter(object):
+    __name__ = "get_subsets"
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, project_name, subset_ids=None, fields=None):
+        self.calls += 1
+        return iter([
+            {"_id": subset_id, "data": {"project": project_name}}
+            for subset_id in subset_ids
+        ])
+
+
+def test_hits_return_copies():
+    cache = EntityCache()
+    getter = _Getter()
+
+    first = cache.call(getter, ("project_a", ["a", "b"]), {})
+    first[0]["data"]["project"] = "modified"
+    second = cache.call(getter, ("project_a", ("a", "b")), {})
+
+    assert getter.calls == 1
+    assert second[0]["data"]["project"] == "project_a"
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_generator_arguments_are_passed():
+    cache = EntityCache()
+    getter = _Getter()
+
+    result = cache.call(
+        getter, ("project_a",), {"subset_ids": (i for i in "ab")}
+    )
+    assert [doc["_id"] for doc in result] == ["a", "b"]
+
+
+def test_invalidation():
+    cache = EntityCache()
+    getter = _Getter()
+
+    cache.call(getter, ("project_a", ["a"]), {})
+    cache.call(getter, ("project_b", ["a"]), {})
+    cache.invalidate_project("project_a")
+    cache.call(getter, ("project_a", ["a"]), {})
+    cache.call(getter, ("project_b", ["a"]), {})
+
+    assert getter.calls == 3
+
+    # Value queried before invalidation is not stored
+    generation = cache.get_generation("project_a")
+    cache.invalidate_project("project_a")
+    cache.set("project_a", "key", "value", generation)
+    assert cache.get("key") == (False, None)
+
+
+def test_ttl_and_size_limits():
+    cache = EntityCache(ttl=0.05, max_size=2)
+    for key in ("a", "b", "c"):
+        cache.set("project_a", key, key)
+
+    assert len(cache) == 2
+    assert cache.get("a") == (False, None)
+    assert cache.get("c") == (True, "c")
+
+    time.sleep(0.1)
+    assert cache.get("c") == (False, None)
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["expired"] == 1
+    assert stats["size"] == 1
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Test suite for event system."""
+import gc
+
+from openpype.lib.events import EventSystem, EventCallback
+
+
+class _Listener(object):
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def callback(self, event):
+        self.calls.append((self.name, event.topic))
+
+
+def _legacy_emit(callbacks, event):
+    for callback in callbacks:
+        callback.process_event(event)
+
+
+def test_callbacks_order_and_matching():
+    event_system = EventSystem()
+    calls = []
+    topics = (
+        "*", "create.*", "create.instance.added", "publish.*",
+        "create.instance.*", "create.*.added", "create.instance.added",
+    )
+    listeners = [_Listener(idx, calls) for idx in range(len(topics))]
+    for topic, listener in zip(topics, listeners):
+        event_system.add_callback(topic, listener.callback)
+
+    for topic in ("create.instance.added", "create.", "publish.x", "other"):
+        calls[:] = []
+        event_system.emit(topic, {}, None)
+        expected = []
+        for topic_pattern, listener in zip(topics, listeners):
+            if EventCallback(topic_pattern, listener.callback).topic_matches(
+                topic
+            ):
+                expected.append((listener.name, topic))
+        assert calls == expected
+
+
+def test_dead_callbacks_are_removed():
+    event_system = EventSystem()
+    calls = []
+    listener = _Listener("a", calls)
+    event_system.add_callback("topic.*", listener.callback)
+    event_system.emit("topic.a", {}, None)
+    assert calls == [("a", "topic.a")]
+
+    del listener
+    gc.collect()
+    event_system.emit("topic.a", {}, None)
+    assert event_system._registered_callbacks == []
+    assert event_system._get_topic_callbacks("topic.a") == []
+
+    other = _Listener("b", calls)
+    callback = event_system.add_callback("topic.a", other.callback)
+    callback.deregister()
+    event_system.emit("topic.a", {}, None)
+    assert event_system._registered_callbacks == []
+    assert len(calls) == 1
+
+
+def test_emit_matches_legacy_order():
+    event_system = EventSystem()
+    calls = []
+    listeners = []
+    for idx in range(500):
+        listener = _Listener(idx, calls)
+        listeners.append(listener)
+        if idx % 5 == 0:
+            topic = "group{}.*".format(idx % 20)
+        else:
+            topic = "group{}.topic{}".format(idx % 20, idx)
+        event_system.add_callback(topic, listener.callback)
+
+    events = [
+        event_system.create_event(
+            "group{}.topic{}".format(idx % 20, idx % 500), {}, None
+        )
+        for idx in range(5000)
+    ]
+
+    for event in events:
+        _legacy_emit(event_system._registered_callbacks, event)
+    legacy_calls = list(calls)
+
+    calls[:] = []
+    for event in events:
+        event_system.emit_event(event)
+
+    assert calls == legacy_calls
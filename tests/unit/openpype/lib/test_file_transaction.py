@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transaction."""
+import os
+
+import pytest
+
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _create_files(dirpath, count):
+    os.makedirs(dirpath)
+    paths = []
+    for idx in range(count):
+        path = os.path.join(dirpath, "file.{:04d}.exr".format(idx))
+        with open(path, "wb") as stream:
+            stream.write(os.urandom(1024 + idx))
+        paths.append(path)
+    return paths
+
+
+def _read(path):
+    with open(path, "rb") as stream:
+        return stream.read()
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_process_with_backup(tmpdir, max_workers):
+    src_paths = _create_files(os.path.join(str(tmpdir), "src"), 20)
+    dst_dir = os.path.join(str(tmpdir), "dst")
+    dst_paths = [
+        os.path.join(dst_dir, os.path.basename(path))
+        for path in src_paths
+    ]
+    os.makedirs(dst_dir)
+    with open(dst_paths[0], "wb") as stream:
+        stream.write(b"previous")
+
+    transaction = FileTransaction(max_workers=max_workers)
+    for src, dst in zip(src_paths, dst_paths):
+        transaction.add(src, dst)
+    # Same source and destination is skipped
+    transaction.add(src_paths[1], src_paths[1])
+    transaction.process()
+
+    assert sorted(transaction.transferred) == sorted(dst_paths)
+    assert transaction.backups == [dst_paths[0] + ".bak"]
+    for src, dst in zip(src_paths, dst_paths):
+        assert _read(src) == _read(dst)
+
+    transaction.finalize()
+    assert not os.path.exists(dst_paths[0] + ".bak")
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_rollback_after_failure(tmpdir, max_workers):
+    src_paths = _create_files(os.path.join(str(tmpdir), "src"), 20)
+    dst_dir = os.path.join(str(tmpdir), "dst")
+    os.makedirs(dst_dir)
+    existing_path = os.path.join(dst_dir, os.path.basename(src_paths[0]))
+    with open(existing_path, "wb") as stream:
+        stream.write(b"previous")
+
+    transaction = FileTransaction(max_workers=max_workers)
+    for src in src_paths:
+        transaction.add(src, os.path.join(dst_dir, os.path.basename(src)))
+    transaction.add(
+        os.path.join(str(tmpdir), "missing.exr"),
+        os.path.join(dst_dir, "missing.exr")
+    )
+
+    with pytest.raises(OSError):
+        transaction.process()
+    transaction.rollback()
+
+    assert os.listdir(dst_dir) == [os.path.basename(existing_path)]
+    assert _read(existing_path) == b"previous"
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Test suite for buffered mongo log handler."""
+import time
+import logging
+import threading
+
+from openpype.lib.log import BufferedMongoHandler
+
+
+class _Collection(object):
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def insert_many(self, documents, ordered=True):
+        self.release.wait()
+        self.batches.append(list(documents))
+
+
+class _Formatter(logging.Formatter):
+    def format(self, record):
+        return {"message": record.getMessage()}
+
+
+def _create_logger(handler):
+    logger = logging.getLogger("test_buffered_mongo_handler")
+    logger.propagate = False
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_records_are_written_in_batches():
+    collection = _Collection()
+    handler = BufferedMongoHandler(collection, batch_size=10)
+    handler.setFormatter(_Formatter())
+    logger = _create_logger(handler)
+
+    for idx in range(25):
+        logger.debug("message %s", idx)
+    handler.flush(5)
+
+    messages = [
+        document["message"]
+        for batch in collection.batches
+        for document in batch
+    ]
+    assert messages == ["message {}".format(idx) for idx in range(25)]
+    assert max(len(batch) for batch in collection.batches) <= 10
+    assert handler.get_stats()["written"] == 25
+    handler.close()
+
+
+def test_full_queue_drops_records():
+    collection = _Collection()
+    collection.release.clear()
+    handler = BufferedMongoHandler(collection, max_queue_size=5)
+    handler.setFormatter(_Formatter())
+    logger = _create_logger(handler)
+
+    for idx in range(20):
+        logger.info("message %s", idx)
+
+    assert handler.get_stats()["dropped"] > 0
+    collection.release.set()
+    handler.close()
+    stats = handler.get_stats()
+    assert stats["written"] + stats["dropped"] == 20
+
+
+def test_flush_does_not_block_after_close():
+    collection = _Collection()
+    collection.release.clear()
+    handler = BufferedMongoHandler(collection, batch_size=1)
+    handler.EXIT_TIMEOUT = 0.2
+    handler.FLUSH_TIMEOUT = 0.2
+    handler.setFormatter(_Formatter())
+    logger = _create_logger(handler)
+
+    for idx in range(20):
+        logger.info("message %s", idx)
+
+    start = time.time()
+    handler.flush()
+    assert time.time() - start < 1
+
+    handler.close()
+    # Flush called by 'logging.shutdown' after close
+    start = time.time()
+    handler.flush()
+    assert time.time() - start < 1
+    collection.release.set()
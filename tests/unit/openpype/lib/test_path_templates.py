@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates."""
+import pytest
+
+from openpype.lib.path_templates import StringTemplate, TemplateUnsolved
+
+PUBLISH_TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish/{family}"
+    "/{subset}/v{version:0>3}/{project[code]}_{asset}_{subset}"
+    "_v{version:0>3}<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+)
+
+
+@pytest.fixture
+def template_data():
+    return {
+        "root": {"work": "/mnt/projects"},
+        "project": {"name": "test_project", "code": "tp"},
+        "hierarchy": "shots/sq01",
+        "asset": "sh010",
+        "family": "render",
+        "subset": "renderMain",
+        "version": 3,
+        "ext": "exr",
+    }
+
+
+def _format_unsolved_path(template, data):
+    """Format template without fast path for fully solved templates."""
+    template_obj = StringTemplate(template)
+    template_obj._format_solved = lambda _data: None
+    return template_obj.format(data)
+
+
+def test_parsed_parts_are_shared():
+    first = StringTemplate(PUBLISH_TEMPLATE)
+    second = StringTemplate(PUBLISH_TEMPLATE)
+
+    assert first._parts is second._parts
+    assert isinstance(first._parts, tuple)
+
+
+def test_solved_format_matches_full_format(template_data):
+    for frame in (None, 1001):
+        data = dict(template_data)
+        if frame is not None:
+            data["frame"] = frame
+
+        result = StringTemplate.format_strict_template(PUBLISH_TEMPLATE, data)
+        expected = _format_unsolved_path(PUBLISH_TEMPLATE, data)
+
+        assert str(result) == str(expected)
+        assert result.solved is expected.solved is True
+        assert result.used_values == expected.used_values
+        assert result.missing_keys == expected.missing_keys
+        assert result.invalid_types == expected.invalid_types
+
+
+def test_unsolved_format(template_data):
+    template_data.pop("asset")
+    template_data["project"] = "test_project"
+
+    result = StringTemplate.format_template(PUBLISH_TEMPLATE, template_data)
+
+    assert result.solved is False
+    assert "asset" in result.missing_keys
+    assert "project" in result.invalid_types
+    with pytest.raises(TemplateUnsolved):
+        result.validate()
+
+
+def test_format_sequence(template_data):
+    frames = list(range(998, 1003))
+    results = StringTemplate.format_sequence_template(
+        PUBLISH_TEMPLATE, template_data, frames
+    )
+
+    assert len(results) == len(frames)
+    for frame, result in zip(frames, results):
+        data = dict(template_data)
+        data["frame"] = frame
+        expected = _format_unsolved_path(PUBLISH_TEMPLATE, data)
+
+        assert str(result) == str(expected)
+        assert result.used_values == expected.used_values
+    assert "frame" not in template_data
+
+
+def test_format_sequence_unsolved(template_data):
+    template_data.pop("subset")
+    template_obj = StringTemplate(PUBLISH_TEMPLATE)
+
+    results = template_obj.format_sequence(template_data, [1001, 1002])
+
+    assert [result.solved for result in results] == [False, False]
+    assert results[1].endswith("_v003.1002.exr")
+    with pytest.raises(TemplateUnsolved):
+        template_obj.format_sequence_strict(template_data, [1001])
+
+
+def test_per_frame_format_matches_legacy(template_data):
+    frames = range(1001, 3001)
+
+    def format_frames(format_func):
+        results = []
+        for frame in frames:
+            data = dict(template_data)
+            data["frame"] = frame
+            results.append(format_func(data))
+        return results
+
+    def legacy_format(data):
+        StringTemplate.clear_cache()
+        return _format_unsolved_path(PUBLISH_TEMPLATE, data)
+
+    legacy_results = format_frames(legacy_format)
+    cached_results = format_frames(
+        lambda data: StringTemplate.format_strict_template(
+            PUBLISH_TEMPLATE, data
+        )
+    )
+    assert [str(result) for result in cached_results] == [
+        str(result) for result in legacy_results
+    ]
+    assert [result.used_values for result in cached_results] == [
+        result.used_values for result in legacy_results
+    ]
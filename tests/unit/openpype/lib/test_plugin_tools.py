@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Test suite for content hash of files."""
+import os
+import collections
+
+import pytest
+
+from openpype.lib import plugin_tools
+from openpype.lib.plugin_tools import get_file_content_hash
+
+
+@pytest.fixture
+def read_paths(monkeypatch):
+    """Paths of files opened by 'get_file_content_hash'."""
+    monkeypatch.setattr(
+        plugin_tools, "_content_hash_cache", collections.OrderedDict()
+    )
+    paths = []
+
+    def _open(path, *args, **kwargs):
+        paths.append(path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(plugin_tools, "open", _open, raising=False)
+    return paths
+
+
+def test_content_hash_is_cached_by_file_identity(tmp_path, read_paths):
+    path = tmp_path / "texture.exr"
+    path.write_bytes(b"content A")
+    stat = os.stat(str(path))
+
+    content_hash = get_file_content_hash(str(path))
+    assert get_file_content_hash(str(path)) == content_hash
+    assert len(read_paths) == 1
+
+    # Same size and modification time, file is not read again
+    path.write_bytes(b"content B")
+    os.utime(str(path), (stat.st_atime, stat.st_mtime))
+    assert get_file_content_hash(str(path)) == content_hash
+    assert len(read_paths) == 1
+
+    # Changed modification time
+    os.utime(str(path), (stat.st_atime, stat.st_mtime + 10))
+    changed_hash = get_file_content_hash(str(path))
+    assert changed_hash != content_hash
+    assert len(read_paths) == 2
+
+    # Changed size
+    path.write_bytes(b"content AB")
+    os.utime(str(path), (stat.st_atime, stat.st_mtime + 10))
+    assert get_file_content_hash(str(path)) != changed_hash
+    assert len(read_paths) == 3
+
+
+def test_same_content_has_same_hash(tmp_path):
+    first = tmp_path / "first.exr"
+    second = tmp_path / "second.exr"
+    first.write_bytes(b"content")
+    second.write_bytes(b"content")
+
+    assert (
+        get_file_content_hash(str(first))
+        == get_file_content_hash(str(second))
+    )
@@ -0,0 +1,72 @@
+import random
+
+from openpype.lib.profiles_filtering import (
+    CompiledProfiles,
+    filter_profiles,
+    _filter_profiles,
+)
+
+HOSTS = ["maya", "nuke", "houdini", "blender", "photoshop", "standalone"]
+FAMILIES = [
+    "model", "rig", "look", "render", "review", "camera", "pointcache",
+    "workfile", "plate", "image",
+]
+TASK_TYPES = ["Modeling", "Rigging", "Lighting", "Compositing", "Animation"]
+
+
+def _random_values(rng, values, patterns):
+    choice = rng.random()
+    if choice < 0.25:
+        return []
+    if choice < 0.3:
+        return ["*"]
+    if choice < 0.45:
+        return [rng.choice(patterns)]
+    return rng.sample(values, rng.randint(1, 3))
+
+
+def _generate_profiles(rng, count):
+    profiles = []
+    for idx in range(count):
+        profiles.append({
+            "hosts": _random_values(rng, HOSTS, ["ma.*", "nu.?e"]),
+            "families": _random_values(rng, FAMILIES, ["re.*", ".*cache"]),
+            "task_types": _random_values(rng, TASK_TYPES, ["Anim.*"]),
+            "task_names": _random_values(
+                rng, ["main", "blocking", "layout"], ["ma.*"]
+            ),
+            "template_name": "template_{}".format(idx),
+        })
+    return profiles
+
+
+def _generate_queries(rng, count):
+    queries = []
+    for _ in range(count):
+        queries.append({
+            "hosts": rng.choice(HOSTS),
+            "families": rng.choice(FAMILIES),
+            "task_types": rng.choice(TASK_TYPES + [None]),
+            "task_names": rng.choice(["main", "blocking", "other", None]),
+        })
+    return queries
+
+
+def test_compiled_profiles_match_filter_profiles():
+    rng = random.Random(1)
+    profiles = _generate_profiles(rng, 200)
+    compiled = CompiledProfiles(profiles)
+    keys_order = ["hosts", "task_types", "families", "task_names"]
+    for key_values in _generate_queries(rng, 2000):
+        expected = _filter_profiles(profiles, key_values, keys_order)
+        assert compiled.filter(key_values, keys_order) is expected
+        assert filter_profiles(profiles, key_values, keys_order) is expected
+
+
+def test_filter_profiles_detects_replaced_profiles():
+    profiles = [{"hosts": ["maya"], "template_name": "maya"}]
+    assert filter_profiles(profiles, {"hosts": "maya"}) is profiles[0]
+
+    profiles[0] = {"hosts": ["nuke"], "template_name": "nuke"}
+    assert filter_profiles(profiles, {"hosts": "maya"}) is None
+    assert filter_profiles(profiles, {"hosts": "nuke"}) is profiles[0]
@@ -0,0 +1,115 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from openpype.lib import source_hash, run_subprocess
+from openpype.lib.transcoding import (
+    _split_paths_to_frame_chunks,
+    run_oiio_commands,
+    ConversionCache,
+)
+
+# Converter writing reversed content of input and logging its calls
+STUB_CONVERTER = """
+import sys
+src, dst, calls = sys.argv[1:4]
+with open(src, "rb") as stream:
+    data = stream.read()
+with open(dst, "wb") as stream:
+    stream.write(data[::-1])
+with open(calls, "a") as stream:
+    stream.write(src + "\\n")
+"""
+
+
+def test_split_paths_to_frame_chunks():
+    paths = ["/out/plate.{:04d}.exr".format(frame) for frame in range(1, 11)]
+    # Gap in frames
+    paths.extend(
+        "/out/plate.{:04d}.exr".format(frame) for frame in range(20, 23)
+    )
+    paths.append("/out/single.exr")
+
+    chunks = _split_paths_to_frame_chunks(paths, 4)
+
+    ranges = [
+        frame_range
+        for _, path, frame_range in chunks
+        if frame_range is not None
+    ]
+    assert ranges == ["1-4", "5-8", "9-10", "20-22"]
+    for _, path, frame_range in chunks:
+        if frame_range is not None:
+            assert path == "/out/plate.%04d.exr"
+    assert ("single.exr", "/out/single.exr", None) in chunks
+
+
+def test_run_oiio_commands_aggregates_errors():
+    commands = [
+        ("ok_{}".format(idx), [sys.executable, "-c", "print('ok')"])
+        for idx in range(4)
+    ]
+    commands.append(
+        ("failing", [sys.executable, "-c", "import sys; sys.exit(1)"])
+    )
+    with pytest.raises(RuntimeError) as exc_info:
+        run_oiio_commands(commands, max_workers=3)
+
+    assert "failing" in str(exc_info.value)
+    assert "ok_" not in str(exc_info.value)
+
+
+def test_conversion_cache_with_stub_converter(tmp_path):
+    converter = tmp_path / "converter.py"
+    converter.write_text(STUB_CONVERTER)
+    calls_path = tmp_path / "calls.txt"
+    sources = []
+    for idx in range(6):
+        source = tmp_path / "src" / "tex_{}.1001.exr".format(idx)
+        source.parent.mkdir(exist_ok=True)
+        source.write_bytes("texture {}".format(idx).encode("utf-8"))
+        sources.append(str(source))
+
+    cache = ConversionCache(str(tmp_path / "cache"))
+
+    def publish(staging_dir, args):
+        os.makedirs(staging_dir)
+
+        def _process(source):
+            texture_hash = source_hash(source, "stub", *args)
+            destination = os.path.join(
+                staging_dir, os.path.basename(source) + ".tx"
+            )
+            cache.convert(
+                source,
+                texture_hash,
+                destination,
+                lambda: run_subprocess([
+                    sys.executable, str(converter),
+                    source, destination, str(calls_path)
+                ])
+            )
+            with open(destination, "rb") as stream:
+                return stream.read()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            return list(executor.map(_process, sources))
+
+    def calls_count():
+        if not calls_path.exists():
+            return 0
+        return len(calls_path.read_text().splitlines())
+
+    first = publish(str(tmp_path / "publish_1"), [])
+    assert calls_count() == len(sources)
+
+    # Unchanged textures are not converted again
+    second = publish(str(tmp_path / "publish_2"), [])
+    assert second == first
+    assert calls_count() == len(sources)
+
+    # Different converter arguments invalidate cache
+    publish(str(tmp_path / "publish_3"), ["--other"])
+    assert calls_count() == 2 * len(sources)
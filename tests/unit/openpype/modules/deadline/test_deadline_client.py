@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Test suite for Deadline Web Service client against stub server."""
+import json
+import threading
+import time
+
+import pytest
+
+from six.moves import BaseHTTPServer, socketserver
+
+from openpype.modules.deadline.deadline_client import DeadlineClient
+
+
+class _StubState(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.jobs = []
+        self.active = 0
+        self.max_active = 0
+        self.failures_left = 0
+        self.failure_status = 503
+        self.connections = set()
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        state = self.server.state
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        with state.lock:
+            state.connections.add(self.client_address)
+            if state.failures_left:
+                state.failures_left -= 1
+                self._respond(state.failure_status, {})
+                return
+            state.active += 1
+            state.max_active = max(state.max_active, state.active)
+
+        time.sleep(0.02)
+        with state.lock:
+            state.active -= 1
+            job_id = "job{}".format(len(state.jobs))
+            state.jobs.append(payload)
+        self._respond(200, {"_id": job_id, "Props": payload["JobInfo"]})
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def stub_server():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.state = _StubState()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    return "http://{}:{}".format(*server.server_address)
+
+
+def test_submit_jobs_concurrently(stub_server):
+    client = DeadlineClient(_url(stub_server), max_workers=4)
+    payloads = [
+        {"JobInfo": {"Name": "frame {}".format(idx)}, "PluginInfo": {}}
+        for idx in range(40)
+    ]
+
+    results = client.submit_jobs(
+        payloads, lambda payload, response: response.json()
+    )
+
+    state = stub_server.state
+    assert [result["Props"] for result in results] == [
+        payload["JobInfo"] for payload in payloads
+    ]
+    assert len(state.jobs) == 40
+    assert 1 < state.max_active <= 4
+    # Connections are reused from pool
+    assert len(state.connections) <= 4
+
+
+def test_retry_unavailable_service(stub_server):
+    stub_server.state.failures_left = 2
+    client = DeadlineClient(_url(stub_server), max_workers=1)
+    # Make test fast
+    client._session.get_adapter("http://").max_retries.backoff_factor = 0
+
+    response = client.submit_job({"JobInfo": {}, "PluginInfo": {}})
+
+    assert response.ok
+    assert response.json()["_id"] == "job0"
+    assert stub_server.state.failures_left == 0
+
+
+def test_no_retry_of_post_on_gateway_timeout(stub_server):
+    stub_server.state.failures_left = 2
+    stub_server.state.failure_status = 504
+    client = DeadlineClient(_url(stub_server), max_workers=1)
+    client._session.get_adapter("http://").max_retries.backoff_factor = 0
+
+    response = client.submit_job({"JobInfo": {}, "PluginInfo": {}})
+
+    # Job could be created by the service so it is not submitted again
+    assert response.status_code == 504
+    assert stub_server.state.failures_left == 1
+
+
+def test_shared_client():
+    client = DeadlineClient.get_client("http://localhost:8082/")
+    assert DeadlineClient.get_client("http://localhost:8082") is client
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Test parallel processing of stored ftrack events by event workers."""
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ftrack_api")
+
+from openpype.modules import load_modules  # noqa: E402
+
+load_modules()
+
+from openpype_modules.ftrack.ftrack_server.lib import (  # noqa: E402
+    StoredEventsQueue,
+    ProcessEventWorker,
+)
+
+PROCESS_TIME = 0.1
+
+
+class _Recorder(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = []
+        self.in_process = set()
+        self.parallel_events_of_project = False
+
+    def handle(self, event):
+        project_id = event["project_id"]
+        with self.lock:
+            if project_id in self.in_process:
+                self.parallel_events_of_project = True
+            self.in_process.add(project_id)
+        started = time.time()
+        time.sleep(PROCESS_TIME)
+        with self.lock:
+            self.in_process.discard(project_id)
+            self.records.append(
+                (project_id, event["index"], started, time.time())
+            )
+
+
+def _session_factory(recorder):
+    return SimpleNamespace(
+        event_hub=SimpleNamespace(_handle=recorder.handle),
+        close=lambda: None
+    )
+
+
+def test_projects_processed_in_parallel():
+    stored_events = StoredEventsQueue()
+    processed_queue = queue.Queue()
+    stop_event = threading.Event()
+    recorder = _Recorder()
+
+    events_count = 4
+    for index in range(events_count):
+        for project_id in ("A", "B"):
+            event = {"project_id": project_id, "index": index, "data": {}}
+            stored_events.put(project_id, (event, None))
+
+    workers = [
+        ProcessEventWorker(
+            stored_events,
+            lambda: _session_factory(recorder),
+            processed_queue,
+            stop_event
+        )
+        for _ in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+
+    processed = []
+    while len(processed) < events_count * 2:
+        processed.append(processed_queue.get(timeout=5))
+    stop_event.set()
+    for worker in workers:
+        worker.join()
+
+    assert not recorder.parallel_events_of_project
+    assert len(stored_events) == 0
+
+    records_by_project = {"A": [], "B": []}
+    for record in recorder.records:
+        records_by_project[record[0]].append(record)
+
+    # Events of a project are processed in order, one after another
+    for records in records_by_project.values():
+        assert [record[1] for record in records] == list(range(events_count))
+        for previous, record in zip(records, records[1:]):
+            assert previous[3] <= record[2]
+
+    # Events of different projects overlap
+    assert any(
+        record_a[2] < record_b[3] and record_b[2] < record_a[3]
+        for record_a in records_by_project["A"]
+        for record_b in records_by_project["B"]
+    )
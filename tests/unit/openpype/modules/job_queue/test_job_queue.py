@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Test suite for job queue scheduling and storage of jobs."""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from openpype.modules.job_queue.job_server.jobs import Job, JobQueue
+from openpype.modules.job_queue.job_server.store import JobStore
+from openpype.modules.job_queue.job_server.workers import Worker
+
+HOST_NAME = "tvpaint"
+
+
+def _create_worker(job_queue, slots=1):
+    worker = Worker(HOST_NAME, SimpleNamespace(), slots)
+    job_queue.add_worker(worker)
+    return worker
+
+
+def _start_assigned_jobs(job_queue):
+    """Assign jobs and mark them as accepted by workers."""
+    job_queue.assign_jobs()
+    assigned_jobs = job_queue.pop_assigned_jobs()
+    for _, job in assigned_jobs:
+        job_queue.job_sent(job, True)
+    return assigned_jobs
+
+
+@pytest.fixture
+def store():
+    job_store = JobStore(":memory:")
+    yield job_store
+    job_store.close()
+
+
+def test_job_store(store):
+    first = Job(HOST_NAME, {"value": 1}, created_time=1)
+    second = Job(HOST_NAME, {"value": 2}, created_time=2)
+    done = Job(HOST_NAME, {"value": 3}, created_time=3)
+    done.set_done(True, "ok", {"result": 1})
+    second.set_started()
+    store.save_jobs(job.to_data() for job in (second, first, done))
+
+    assert store.get_job(first.id) == first.to_data()
+    assert store.get_job("missing") is None
+    assert [
+        job_data["id"]
+        for job_data in store.get_jobs(("waiting", "started"))
+    ] == [first.id, second.id]
+
+    # Saved job replaces previous data
+    first.set_started()
+    store.save_jobs([first.to_data()])
+    assert store.get_job(first.id)["state"] == "started"
+
+    store.remove_done_jobs(time.time() + 1)
+    assert store.get_job(done.id) is None
+    assert store.get_job(first.id) is not None
+
+
+def test_priority_order():
+    job_queue = JobQueue()
+    jobs = job_queue.create_jobs(HOST_NAME, [
+        {"name": "low"},
+        {"name": "high", "priority": 10},
+        {"name": "middle", "priority": 5},
+        {"name": "high_second", "priority": 10},
+    ])
+    _create_worker(job_queue, slots=len(jobs))
+
+    assigned_jobs = _start_assigned_jobs(job_queue)
+
+    assert [job.data["name"] for _, job in assigned_jobs] == [
+        "high", "high_second", "middle", "low"
+    ]
+
+
+def test_retry_until_max_attempts():
+    job_queue = JobQueue()
+    job = job_queue.create_job(HOST_NAME, {"max_attempts": 2})
+    worker = _create_worker(job_queue)
+
+    _start_assigned_jobs(job_queue)
+    assert job_queue.job_done(job.id, False, "failed", None, worker.id)
+    assert job.get_state() == "waiting"
+    assert job.attempts == 1
+    assert worker.free_slots() == 1
+
+    _start_assigned_jobs(job_queue)
+    assert job.worker is worker
+    assert job_queue.job_done(job.id, False, "failed", None, worker.id)
+    assert job.get_state() == "error"
+    assert job.attempts == 2
+    assert worker.free_slots() == 1
+
+
+def test_timeout_requeue_ignores_late_report():
+    job_queue = JobQueue()
+    job = job_queue.create_job(HOST_NAME, {"timeout": 10, "max_attempts": 2})
+    first_worker = _create_worker(job_queue)
+    second_worker = _create_worker(job_queue)
+
+    _start_assigned_jobs(job_queue)
+    assert job.worker is first_worker
+
+    # Job timed out and is started by other worker
+    job._started_time -= 20
+    _start_assigned_jobs(job_queue)
+    assert job.worker is second_worker
+    assert job.get_state() == "started"
+    assert first_worker.free_slots() == 1
+
+    # Late report of first worker does not finish job of second worker
+    assert not job_queue.job_done(job.id, True, "late", None, first_worker.id)
+    assert job.get_state() == "started"
+    assert second_worker.free_slots() == 0
+
+    assert job_queue.job_done(job.id, True, "ok", None, second_worker.id)
+    assert job.get_state() == "done"
+    assert second_worker.free_slots() == 1
+
+    # Timed out job without attempts left is failed
+    job = job_queue.create_job(HOST_NAME, {"timeout": 10})
+    _start_assigned_jobs(job_queue)
+    job._started_time -= 20
+    job_queue.assign_jobs()
+    assert job.get_state() == "error"
+    assert job.worker is None
+
+
+def test_worker_slots():
+    job_queue = JobQueue()
+    jobs = job_queue.create_jobs(HOST_NAME, [{}, {}, {}])
+    worker = _create_worker(job_queue, slots=2)
+
+    assigned_jobs = _start_assigned_jobs(job_queue)
+    assert [job for _, job in assigned_jobs] == jobs[:2]
+    assert worker.free_slots() == 0
+    assert _start_assigned_jobs(job_queue) == []
+
+    job_queue.job_done(jobs[0].id, True, None, None, worker.id)
+    assert worker.free_slots() == 1
+
+    assigned_jobs = _start_assigned_jobs(job_queue)
+    assert assigned_jobs == [(worker, jobs[2])]
+    assert worker.current_jobs == [jobs[1], jobs[2]]
+
+    # Jobs of removed worker are added back to queue
+    job_queue.remove_worker(worker)
+    assert [job.get_state() for job in jobs] == [
+        "done", "waiting", "waiting"
+    ]
+
+
+def test_restore_jobs(store):
+    job_queue = JobQueue(store)
+    waiting, started, done = job_queue.create_jobs(
+        HOST_NAME, [{"name": "waiting"}, {"name": "started"}, {}]
+    )
+    worker = _create_worker(job_queue, slots=3)
+    job_queue.assign_jobs()
+    for _, job in job_queue.pop_assigned_jobs():
+        if job is waiting:
+            # Worker refused the job
+            job_queue.job_sent(job, False)
+        else:
+            job_queue.job_sent(job, True)
+    job_queue.job_done(done.id, True, "ok", None, worker.id)
+    assert started.get_state() == "started"
+
+    # Server restart
+    restored_queue = JobQueue(store)
+    restored_jobs = {job.id: job for job in restored_queue.get_jobs()}
+    assert set(restored_jobs) == {waiting.id, started.id}
+    assert all(
+        job.get_state() == "waiting"
+        for job in restored_jobs.values()
+    )
+    assert restored_jobs[started.id].attempts == 1
+    assert restored_queue.get_job(done.id).get_state() == "done"
+
+    new_worker = _create_worker(restored_queue, slots=2)
+    assigned_jobs = _start_assigned_jobs(restored_queue)
+    assert {job.data["name"] for _, job in assigned_jobs} == {
+        "waiting", "started"
+    }
+    assert new_worker.free_slots() == 0
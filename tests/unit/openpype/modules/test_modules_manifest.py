@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Test loading of modules with modules manifest."""
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+_ADDON_TEMPLATE = """
+from openpype.modules import OpenPypeModule
+
+
+class {class_name}(OpenPypeModule):
+    name = "{name}"
+
+    def initialize(self, modules_settings):
+        self.enabled = modules_settings.get(self.name, {{}}).get("enabled")
+"""
+
+_MANAGER_SCRIPT = """
+import sys
+import json
+
+from openpype.modules import base
+from openpype.settings.lib import get_default_settings
+
+addons_dir, enabled_json = sys.argv[1:3]
+base.get_dynamic_modules_dirs = lambda: [addons_dir]
+
+settings = get_default_settings()["system_settings"]
+settings["modules"].update(json.loads(enabled_json))
+manager = base.ModulesManager(settings)
+
+from openpype_modules.manifest_enabled import ENABLED_VALUE
+
+output = {}
+for name in ("manifest_enabled", "manifest_disabled"):
+    module = manager[name]
+    output[name] = {
+        "enabled": bool(module.enabled),
+        "imported": "openpype_modules.{}".format(name) in sys.modules,
+    }
+output["enabled_value"] = ENABLED_VALUE
+output["manifest"] = base._LoadCache.manifest is not None
+sys.stdout.write("RESULT" + json.dumps(output))
+"""
+
+
+def _create_addon(addons_dir, name, class_name):
+    addon_dir = addons_dir / name
+    addon_dir.mkdir()
+    content = _ADDON_TEMPLATE.format(name=name, class_name=class_name)
+    if name == "manifest_enabled":
+        content += "\nENABLED_VALUE = 1\n"
+    (addon_dir / "__init__.py").write_text(content)
+
+
+def _run_manager(addons_dir, manifest_path, enabled):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(REPO_ROOT)] + [path for path in sys.path if path]
+    )
+    env["OPENPYPE_MODULES_MANIFEST"] = str(manifest_path)
+    settings = {
+        name: {"enabled": value}
+        for name, value in enabled.items()
+    }
+    process = subprocess.run(
+        [
+            sys.executable, "-c", _MANAGER_SCRIPT,
+            str(addons_dir), json.dumps(settings)
+        ],
+        cwd=str(REPO_ROOT),
+        env=env,
+        stdout=subprocess.PIPE,
+        check=True
+    )
+    stdout = process.stdout.decode("utf-8")
+    return json.loads(stdout.split("RESULT")[-1])
+
+
+def test_modules_manifest(tmp_path):
+    addons_dir = tmp_path / "addons"
+    addons_dir.mkdir()
+    _create_addon(addons_dir, "manifest_enabled", "ManifestEnabledAddon")
+    _create_addon(addons_dir, "manifest_disabled", "ManifestDisabledAddon")
+    manifest_path = tmp_path / "manifest.json"
+    enabled = {"manifest_enabled": True, "manifest_disabled": False}
+
+    # Manifest with disabled modules is created on first start
+    result = _run_manager(addons_dir, manifest_path, enabled)
+    assert result["manifest"]
+    assert result["manifest_disabled"] == {
+        "enabled": False, "imported": True
+    }
+
+    # Disabled module is not imported
+    result = _run_manager(addons_dir, manifest_path, enabled)
+    assert result["enabled_value"] == 1
+    assert result["manifest_enabled"] == {"enabled": True, "imported": True}
+    assert result["manifest_disabled"] == {
+        "enabled": False, "imported": False
+    }
+
+    # Different settings
+    enabled = {"manifest_enabled": True, "manifest_disabled": True}
+    result = _run_manager(addons_dir, manifest_path, enabled)
+    assert result["manifest_disabled"] == {
+        "enabled": True, "imported": True
+    }
+
+    # Changed submodule of package invalidates manifest
+    enabled = {"manifest_enabled": True, "manifest_disabled": False}
+    submodule_path = addons_dir / "manifest_disabled" / "lib.py"
+    submodule_path.write_text("VALUE = 1\n")
+    result = _run_manager(addons_dir, manifest_path, enabled)
+    assert result["manifest_disabled"]["imported"]
+    result = _run_manager(addons_dir, manifest_path, enabled)
+    assert not result["manifest_disabled"]["imported"]
+
+    mtime = os.path.getmtime(str(submodule_path)) + 10
+    os.utime(str(submodule_path), (mtime, mtime))
+    result = _run_manager(addons_dir, manifest_path, enabled)
+    assert result["manifest_disabled"]["imported"]
+
+    # Changed module invalidates manifest
+    _create_addon(addons_dir, "manifest_other", "ManifestOtherAddon")
+    result = _run_manager(addons_dir, manifest_path, enabled)
+    assert result["manifest_disabled"]["imported"]
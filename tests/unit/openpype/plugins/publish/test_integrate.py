@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Test replacing of copies with hardlinks to published files."""
+import os
+
+import pytest
+
+from openpype.lib import get_file_content_hash
+from openpype.lib.file_transaction import FileTransaction
+from openpype.plugins.publish import integrate
+from openpype.plugins.publish.integrate import IntegrateAsset
+
+CONTENT = b"published content"
+
+
+class _Anatomy(object):
+    def __init__(self, root):
+        self._root = root
+
+    def fill_root(self, path):
+        return path.format(root={"work": self._root})
+
+
+@pytest.fixture
+def publish_dir(tmp_path):
+    """Published file of previous version and source of new version."""
+    previous_path = tmp_path / "publish" / "v001" / "model_v001.abc"
+    previous_path.parent.mkdir(parents=True)
+    previous_path.write_bytes(CONTENT)
+
+    source_path = tmp_path / "work" / "model.abc"
+    source_path.parent.mkdir()
+    source_path.write_bytes(CONTENT)
+    return tmp_path
+
+
+def _set_published_files(monkeypatch, files):
+    monkeypatch.setattr(
+        integrate,
+        "get_representations_by_file_hashes",
+        lambda project_name, content_hashes, fields=None: [{"files": files}]
+    )
+
+
+def _deduplicate(publish_dir, transfers):
+    plugin = IntegrateAsset()
+    return plugin.deduplicate_transfers(
+        "test_project", _Anatomy(str(publish_dir)), transfers
+    )
+
+
+def _transfer(publish_dir):
+    src = str(publish_dir / "work" / "model.abc")
+    dst = str(publish_dir / "publish" / "v002" / "model_v002.abc")
+    return src, dst, FileTransaction.MODE_COPY
+
+
+def _file_info(publish_dir, size=len(CONTENT)):
+    return {
+        "path": "{root[work]}/publish/v001/model_v001.abc",
+        "size": size,
+        "content_hash": get_file_content_hash(
+            str(publish_dir / "publish" / "v001" / "model_v001.abc")
+        ),
+    }
+
+
+def test_matching_published_file_is_hardlinked(publish_dir, monkeypatch):
+    _set_published_files(monkeypatch, [_file_info(publish_dir)])
+    src, dst, copy_mode = _transfer(publish_dir)
+
+    transfers, content_hashes = _deduplicate(
+        publish_dir, [(src, dst, copy_mode)]
+    )
+
+    published_path = os.path.normpath(
+        str(publish_dir / "publish" / "v001" / "model_v001.abc")
+    )
+    assert transfers == [
+        (published_path, dst, FileTransaction.MODE_HARDLINK)
+    ]
+    assert content_hashes == {
+        os.path.normpath(dst): get_file_content_hash(src)
+    }
+
+
+def test_own_destination_is_not_hardlinked(publish_dir, monkeypatch):
+    _set_published_files(monkeypatch, [_file_info(publish_dir)])
+    src, dst, copy_mode = _transfer(publish_dir)
+    # Integration replaces the published file
+    replaced = (
+        src,
+        str(publish_dir / "publish" / "v001" / "model_v001.abc"),
+        copy_mode
+    )
+
+    transfers, _ = _deduplicate(
+        publish_dir, [(src, dst, copy_mode), replaced]
+    )
+
+    assert transfers == [(src, dst, copy_mode), replaced]
+
+
+def test_other_device_is_not_hardlinked(publish_dir, monkeypatch):
+    _set_published_files(monkeypatch, [_file_info(publish_dir)])
+    src, dst, copy_mode = _transfer(publish_dir)
+    published_path = os.path.normpath(
+        str(publish_dir / "publish" / "v001" / "model_v001.abc")
+    )
+
+    os_stat = os.stat
+
+    def _stat(path, *args, **kwargs):
+        result = os_stat(path, *args, **kwargs)
+        if os.path.normpath(str(path)) != published_path:
+            return result
+        # Published file on other device
+        values = list(result)
+        values[2] += 1
+        return os.stat_result(values)
+
+    monkeypatch.setattr(os, "stat", _stat)
+
+    transfers, _ = _deduplicate(publish_dir, [(src, dst, copy_mode)])
+
+    assert transfers == [(src, dst, copy_mode)]
+
+
+def test_size_mismatch_is_not_hardlinked(publish_dir, monkeypatch):
+    _set_published_files(
+        monkeypatch, [_file_info(publish_dir, size=len(CONTENT) + 1)]
+    )
+    src, dst, copy_mode = _transfer(publish_dir)
+
+    transfers, _ = _deduplicate(publish_dir, [(src, dst, copy_mode)])
+
+    assert transfers == [(src, dst, copy_mode)]